@@ -3,12 +3,15 @@
 Data Analysis Script
 
 - Calculates risk scores for all participants (using RiskScorer)
+  (pass --incremental to rescore only participants whose responses changed)
 - Stores per-category and overall scores in database
-- Generates charts and summary report (using RiskDashboard)
+- Generates charts and summary report (using RiskDashboard, from the
+  risk_summary table materialized by the scoring run)
 """
 
 import os
 import sqlite3
+import sys
 from risk_scoring import RiskScorer
 from risk_dashboard import RiskDashboard
 
@@ -19,7 +22,7 @@ def connect_db(db_path: str) -> sqlite3.Connection:
     return conn
 
 
-def analyze_all_participants(db_path: str) -> None:
+def analyze_all_participants(db_path: str, bulk: bool = True, incremental: bool = False) -> None:
     conn = connect_db(db_path)
     try:
         cur = conn.cursor()
@@ -34,11 +37,21 @@ def analyze_all_participants(db_path: str) -> None:
 
     scorer = RiskScorer(db_path)
 
-    for pid in participant_ids:
-        category_scores, overall_score = scorer.process_participant_scores(pid)
+    if incremental:
+        results = scorer.score_dirty()
+    elif bulk:
+        results = scorer.score_all()
+    else:
+        results = {pid: scorer.process_participant_scores(pid) for pid in participant_ids}
+        scorer.refresh_summary()
+
+    for pid, (category_scores, overall_score) in results.items():
         print(f"Participant {pid}: overall_score={overall_score} category_scores={category_scores}")
 
-    print(f"Processed scores for {len(participant_ids)} participants")
+    if incremental:
+        print(f"Rescored {len(results)} changed participants (of {len(participant_ids)} total)")
+    else:
+        print(f"Processed scores for {len(results)} participants")
 
 
 def generate_reports(db_path: str, output_dir: str) -> None:
@@ -58,8 +71,10 @@ if __name__ == "__main__":
     db_path = "../data/assessment.db"
     output_dir = "../reports"
 
+    incremental = "--incremental" in sys.argv[1:]
+
     print("Analyzing participant data...")
-    analyze_all_participants(db_path)
+    analyze_all_participants(db_path, incremental=incremental)
 
     print("Generating reports...")
     generate_reports(db_path, output_dir)
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Index Migration Benchmark
+
+Builds synthetic assessment databases at 10k, 100k and 1M responses and
+prints query plans and timings for the scoring/dashboard queries before
+and after the schema_migrations indexes are applied.
+
+Usage:
+    python3 benchmark_indexes.py [responses ...]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import Callable, List, Tuple
+
+from risk_scoring import RiskScorer
+from schema_migrations import connect_db, migrate
+
+
+QUESTIONS_PER_PARTICIPANT = 10
+QUESTION_CATEGORIES: List[Tuple[str, str]] = [
+    ("password_unique", "password_security"),
+    ("password_manager", "password_security"),
+    ("email_sender_check", "email_security"),
+    ("email_report", "email_security"),
+    ("phishing_recognition", "social_engineering"),
+    ("info_disclosure", "social_engineering"),
+    ("prompt_updates", "device_security"),
+    ("approved_software", "device_security"),
+    ("training_completed", "training_awareness"),
+    ("policy_familiarity", "training_awareness"),
+]
+
+LOOKUP_SAMPLES = 200
+
+QUERIES: List[Tuple[str, str]] = [
+    (
+        "participant responses",
+        "SELECT question_id, response_value, category FROM risk_responses WHERE participant_id = ?",
+    ),
+    (
+        "grouped category totals",
+        """
+        SELECT participant_id, category, SUM(response_value), COUNT(*)
+        FROM risk_responses
+        GROUP BY participant_id, category
+        """,
+    ),
+    (
+        "risk level distribution",
+        "SELECT risk_level, COUNT(*) FROM risk_scores WHERE category = 'overall' GROUP BY risk_level",
+    ),
+    (
+        "category averages",
+        """
+        SELECT category, AVG(score) FROM risk_scores
+        WHERE category != 'overall' GROUP BY category ORDER BY category
+        """,
+    ),
+]
+
+
+def build_database(db_path: str, num_responses: int, seed: int = 42) -> int:
+    rng = random.Random(seed)
+    num_participants = max(1, num_responses // QUESTIONS_PER_PARTICIPANT)
+
+    migrate(db_path, target_version=1, enable_wal=False)
+
+    conn = connect_db(db_path)
+    try:
+        with conn:
+            conn.executemany(
+                "INSERT INTO participants (id, employee_id, department, role, experience_years) VALUES (?, ?, ?, ?, ?)",
+                (
+                    (pid, f"EMP-{pid:07d}", rng.choice(["IT", "HR", "Finance"]), "Analyst", rng.randint(1, 15))
+                    for pid in range(1, num_participants + 1)
+                ),
+            )
+            conn.executemany(
+                "INSERT INTO risk_responses (participant_id, question_id, response_value, category) VALUES (?, ?, ?, ?)",
+                (
+                    (pid, qid, rng.randint(1, 5), cat)
+                    for pid in range(1, num_participants + 1)
+                    for qid, cat in QUESTION_CATEGORIES
+                ),
+            )
+    finally:
+        conn.close()
+
+    RiskScorer(db_path).score_all()
+    return num_participants
+
+
+def time_call(fn: Callable[[], None], repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure(db_path: str, num_participants: int) -> List[Tuple[str, str, float]]:
+    conn = connect_db(db_path)
+    try:
+        rng = random.Random(7)
+        sample_ids = [rng.randint(1, num_participants) for _ in range(LOOKUP_SAMPLES)]
+        results = []
+
+        for name, sql in QUERIES:
+            params: Tuple = (sample_ids[0],) if "?" in sql else ()
+            plan_rows = conn.execute("EXPLAIN QUERY PLAN " + sql, params).fetchall()
+            plan = "; ".join(row[-1] for row in plan_rows)
+
+            if "?" in sql:
+                def run(sql: str = sql) -> None:
+                    for pid in sample_ids:
+                        conn.execute(sql, (pid,)).fetchall()
+            else:
+                def run(sql: str = sql) -> None:
+                    conn.execute(sql).fetchall()
+
+            results.append((name, plan, time_call(run)))
+
+        return results
+    finally:
+        conn.close()
+
+
+def print_results(label: str, results: List[Tuple[str, str, float]]) -> None:
+    print(f"  [{label}]")
+    for name, plan, seconds in results:
+        print(f"    {name:<26} {seconds * 1000:10.2f} ms  | {plan}")
+
+
+def run_benchmark(sizes: List[int]) -> None:
+    for num_responses in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, "assessment.db")
+
+            build_start = time.perf_counter()
+            num_participants = build_database(db_path, num_responses)
+            build_seconds = time.perf_counter() - build_start
+
+            print(f"\n=== {num_responses:,} responses / {num_participants:,} participants (built in {build_seconds:.1f}s) ===")
+            print(f"  (participant responses = {LOOKUP_SAMPLES} lookups)")
+            print_results("before", measure(db_path, num_participants))
+
+            migrate_start = time.perf_counter()
+            migrate(db_path)
+            print(f"  migrate + WAL + ANALYZE: {time.perf_counter() - migrate_start:.2f}s")
+            print_results("after", measure(db_path, num_participants))
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000, 1_000_000]
+    run_benchmark(sizes)
@@ -1,44 +1,75 @@
 #!/usr/bin/env python3
 """
 Risk Assessment Dashboard
+
+Charts and the summary report read the risk_summary table that
+RiskScorer materializes once per scoring run, so dashboard cost
+does not depend on the number of participants.
 """
 
 import os
 import sqlite3
-from typing import List
+from typing import List, Optional
 
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+from risk_scoring import RiskScorer
+
 
 class RiskDashboard:
     def __init__(self, db_path: str, output_dir: str):
         self.db_path = db_path
         self.output_dir = output_dir
+        self._summary: Optional[pd.DataFrame] = None
 
     def _connect(self) -> sqlite3.Connection:
         conn = sqlite3.connect(self.db_path)
         conn.execute("PRAGMA foreign_keys = ON;")
         return conn
 
-    def generate_risk_distribution_chart(self) -> str:
-        os.makedirs(self.output_dir, exist_ok=True)
+    def _load_summary(self) -> pd.DataFrame:
+        """Read the whole risk_summary table once and share it across outputs."""
+        if self._summary is not None:
+            return self._summary
+
+        conn = self._connect()
+        try:
+            exists = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'risk_summary'"
+            ).fetchone()
+        finally:
+            conn.close()
+
+        # Databases scored before the summary table existed get it built on first use.
+        if not exists:
+            RiskScorer(self.db_path).refresh_summary()
 
         conn = self._connect()
         try:
-            df = pd.read_sql_query(
-                """
-                SELECT risk_level, COUNT(*) as count
-                FROM risk_scores
-                WHERE category = 'overall'
-                GROUP BY risk_level
-                """,
+            self._summary = pd.read_sql_query(
+                "SELECT section, label, count, avg_score, min_score, max_score FROM risk_summary",
                 conn,
             )
         finally:
             conn.close()
 
+        return self._summary
+
+    def refresh(self) -> None:
+        """Drop the cached summary so the next output re-reads risk_summary."""
+        self._summary = None
+
+    def _section(self, section: str) -> pd.DataFrame:
+        summary = self._load_summary()
+        return summary[summary["section"] == section].reset_index(drop=True)
+
+    def generate_risk_distribution_chart(self) -> str:
+        os.makedirs(self.output_dir, exist_ok=True)
+
+        df = self._section("risk_level").rename(columns={"label": "risk_level"})[["risk_level", "count"]]
+
         out_path = os.path.join(self.output_dir, "risk_distribution.png")
 
         if df.empty:
@@ -60,20 +91,12 @@ class RiskDashboard:
     def generate_category_scores_chart(self) -> str:
         os.makedirs(self.output_dir, exist_ok=True)
 
-        conn = self._connect()
-        try:
-            df = pd.read_sql_query(
-                """
-                SELECT category, AVG(score) as avg_score
-                FROM risk_scores
-                WHERE category != 'overall'
-                GROUP BY category
-                ORDER BY category
-                """,
-                conn,
-            )
-        finally:
-            conn.close()
+        df = (
+            self._section("category")
+            .rename(columns={"label": "category"})[["category", "avg_score"]]
+            .sort_values("category")
+            .reset_index(drop=True)
+        )
 
         out_path = os.path.join(self.output_dir, "category_scores.png")
 
@@ -102,24 +125,13 @@ class RiskDashboard:
         os.makedirs(self.output_dir, exist_ok=True)
         out_path = os.path.join(self.output_dir, "summary_report.md")
 
-        conn = self._connect()
-        try:
-            overall_df = pd.read_sql_query(
-                "SELECT score, risk_level FROM risk_scores WHERE category = 'overall'",
-                conn,
-            )
-            cat_df = pd.read_sql_query(
-                "SELECT category, score FROM risk_scores WHERE category != 'overall'",
-                conn,
-            )
-            participant_count_df = pd.read_sql_query(
-                "SELECT COUNT(*) as count FROM participants",
-                conn,
-            )
-        finally:
-            conn.close()
+        participants_df = self._section("participants")
+        overall_df = self._section("overall")
+        level_df = self._section("risk_level")
+        cat_df = self._section("category")
+        dept_df = self._section("department")
 
-        participant_count = int(participant_count_df["count"].iloc[0]) if not participant_count_df.empty else 0
+        participant_count = int(participants_df["count"].iloc[0]) if not participants_df.empty else 0
 
         lines: List[str] = []
         lines.append("# Human Risk Assessment - Summary Report")
@@ -128,28 +140,38 @@ class RiskDashboard:
         lines.append("")
 
         if not overall_df.empty:
+            overall = overall_df.iloc[0]
             lines.append("## Overall Risk Results")
             lines.append("")
-            lines.append(f"- Overall average score: **{overall_df['score'].mean():.2f}**")
-            lines.append(f"- Overall min score: **{overall_df['score'].min()}**")
-            lines.append(f"- Overall max score: **{overall_df['score'].max()}**")
+            lines.append(f"- Overall average score: **{overall['avg_score']:.2f}**")
+            lines.append(f"- Overall min score: **{int(overall['min_score'])}**")
+            lines.append(f"- Overall max score: **{int(overall['max_score'])}**")
             lines.append("")
 
-            dist = overall_df["risk_level"].value_counts(normalize=True) * 100
+            dist = level_df.sort_values("count", ascending=False, kind="stable")
+            total = int(overall["count"])
             lines.append("### Risk Level Distribution")
             lines.append("")
-            for level, pct in dist.items():
-                lines.append(f"- {level}: **{pct:.1f}%**")
+            for level, count in zip(dist["label"], dist["count"]):
+                lines.append(f"- {level}: **{count / total * 100:.1f}%**")
             lines.append("")
 
         if not cat_df.empty:
             lines.append("## Category Results")
             lines.append("")
-            cat_avg = cat_df.groupby("category")["score"].mean().sort_values(ascending=False)
-            for cat, avg in cat_avg.items():
+            cat_avg = cat_df.sort_values("avg_score", ascending=False, kind="stable")
+            for cat, avg in zip(cat_avg["label"], cat_avg["avg_score"]):
                 lines.append(f"- {cat}: **{avg:.2f}**")
             lines.append("")
 
+        if not dept_df.empty:
+            lines.append("## Department Results")
+            lines.append("")
+            dept_avg = dept_df.sort_values("avg_score", ascending=False, kind="stable")
+            for dept, avg, count in zip(dept_avg["label"], dept_avg["avg_score"], dept_avg["count"]):
+                lines.append(f"- {dept}: **{avg:.2f}** ({int(count)} participants)")
+            lines.append("")
+
         with open(out_path, "w", encoding="utf-8") as f:
             f.write("\n".join(lines))
 
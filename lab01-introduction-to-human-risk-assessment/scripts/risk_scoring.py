@@ -38,11 +38,17 @@ class RiskScorer:
         Returns integer score 0-100.
         """
         cat_values = [r["response_value"] for r in responses if r["category"] == category]
+        return self._score_from_totals(sum(cat_values), len(cat_values))
 
-        if not cat_values:
+    def _score_from_totals(self, total: int, count: int) -> int:
+        """
+        Normalize a category's response total/count into a 0-100 score.
+        Shared by the per-participant and bulk paths so both round identically.
+        """
+        if not count:
             return 0
 
-        avg_val = sum(cat_values) / len(cat_values)
+        avg_val = total / count
         normalized = int(round(((avg_val - 1) / 4) * 100))
 
         if normalized < 0:
@@ -122,6 +128,263 @@ class RiskScorer:
         finally:
             conn.close()
 
+    def _score_from_aggregates(
+        self, participant_ids: List[int], totals: Dict[Tuple[int, str], Tuple[int, int]]
+    ) -> Tuple[Dict[int, Tuple[Dict[str, int], int]], List[Tuple[int, str, int, str]]]:
+        """
+        Turn grouped (participant, category) -> (total, count) aggregates into
+        per-participant results and the risk_scores rows to insert.
+        """
+        results: Dict[int, Tuple[Dict[str, int], int]] = {}
+        rows: List[Tuple[int, str, int, str]] = []
+        for pid in participant_ids:
+            category_scores: Dict[str, int] = {}
+            for category in self.risk_weights.keys():
+                total, count = totals.get((pid, category), (0, 0))
+                score = self._score_from_totals(total, count)
+                category_scores[category] = score
+                rows.append((pid, category, score, self.get_risk_level(score)))
+
+            overall_score = self.calculate_overall_risk(category_scores)
+            rows.append((pid, "overall", overall_score, self.get_risk_level(overall_score)))
+            results[pid] = (category_scores, overall_score)
+
+        return results, rows
+
+    def score_all(self) -> Dict[int, Tuple[Dict[str, int], int]]:
+        """
+        Bulk mode: score every participant with one grouped aggregate and
+        rewrite risk_scores with executemany in a single transaction.
+        Produces the same rows as calling process_participant_scores per participant.
+        """
+        conn = self._connect()
+        try:
+            cur = conn.cursor()
+
+            cur.execute("SELECT id FROM participants ORDER BY id")
+            participant_ids = [row[0] for row in cur.fetchall()]
+
+            cur.execute(
+                """
+                SELECT participant_id, category, SUM(response_value), COUNT(*)
+                FROM risk_responses
+                GROUP BY participant_id, category
+                """
+            )
+            totals: Dict[Tuple[int, str], Tuple[int, int]] = {
+                (pid, cat): (int(total), count) for (pid, cat, total, count) in cur.fetchall()
+            }
+
+            results, rows = self._score_from_aggregates(participant_ids, totals)
+
+            with conn:
+                cur.execute("DELETE FROM risk_scores WHERE participant_id IN (SELECT id FROM participants)")
+                cur.executemany(
+                    """
+                    INSERT INTO risk_scores (participant_id, category, score, risk_level)
+                    VALUES (?, ?, ?, ?)
+                    """,
+                    rows,
+                )
+                # Everyone is fresh now, so nothing is left to rescore incrementally.
+                if self._has_change_tracking(cur):
+                    cur.execute("DELETE FROM dirty_participants")
+                self._materialize_summary(cur)
+
+            return results
+        finally:
+            conn.close()
+
+    def _has_change_tracking(self, cur: sqlite3.Cursor) -> bool:
+        cur.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'dirty_participants'")
+        return cur.fetchone() is not None
+
+    def install_change_tracking(self) -> None:
+        """
+        Create the dirty_participants queue and the triggers that fill it
+        whenever risk_responses change (including inserts from the PHP survey).
+        On first install every participant is queued, since existing scores
+        cannot be trusted to be current.
+        """
+        conn = self._connect()
+        try:
+            cur = conn.cursor()
+            first_install = not self._has_change_tracking(cur)
+
+            cur.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS dirty_participants (
+                    participant_id INTEGER PRIMARY KEY
+                );
+
+                CREATE TRIGGER IF NOT EXISTS trg_risk_responses_insert_dirty
+                AFTER INSERT ON risk_responses
+                BEGIN
+                    INSERT OR IGNORE INTO dirty_participants (participant_id) VALUES (NEW.participant_id);
+                END;
+
+                CREATE TRIGGER IF NOT EXISTS trg_risk_responses_update_dirty
+                AFTER UPDATE ON risk_responses
+                BEGIN
+                    INSERT OR IGNORE INTO dirty_participants (participant_id) VALUES (OLD.participant_id);
+                    INSERT OR IGNORE INTO dirty_participants (participant_id) VALUES (NEW.participant_id);
+                END;
+
+                CREATE TRIGGER IF NOT EXISTS trg_risk_responses_delete_dirty
+                AFTER DELETE ON risk_responses
+                BEGIN
+                    INSERT OR IGNORE INTO dirty_participants (participant_id) VALUES (OLD.participant_id);
+                END;
+
+                CREATE TRIGGER IF NOT EXISTS trg_participants_insert_dirty
+                AFTER INSERT ON participants
+                BEGIN
+                    INSERT OR IGNORE INTO dirty_participants (participant_id) VALUES (NEW.id);
+                END;
+                """
+            )
+
+            if first_install:
+                cur.execute("INSERT OR IGNORE INTO dirty_participants (participant_id) SELECT id FROM participants")
+
+            conn.commit()
+        finally:
+            conn.close()
+
+    def score_dirty(self) -> Dict[int, Tuple[Dict[str, int], int]]:
+        """
+        Incremental mode: rescore only participants queued in dirty_participants,
+        then drain the queue in the same transaction. Cost is proportional to
+        the responses that changed, not to the whole table.
+        """
+        self.install_change_tracking()
+
+        conn = self._connect()
+        try:
+            cur = conn.cursor()
+            # Take the write lock up front so responses inserted while we score
+            # cannot be dropped from the queue without being scored.
+            cur.execute("BEGIN IMMEDIATE")
+            try:
+                cur.execute(
+                    """
+                    SELECT p.id
+                    FROM dirty_participants d
+                    JOIN participants p ON p.id = d.participant_id
+                    ORDER BY p.id
+                    """
+                )
+                participant_ids = [row[0] for row in cur.fetchall()]
+
+                cur.execute(
+                    """
+                    SELECT participant_id, category, SUM(response_value), COUNT(*)
+                    FROM risk_responses
+                    WHERE participant_id IN (SELECT participant_id FROM dirty_participants)
+                    GROUP BY participant_id, category
+                    """
+                )
+                totals: Dict[Tuple[int, str], Tuple[int, int]] = {
+                    (pid, cat): (int(total), count) for (pid, cat, total, count) in cur.fetchall()
+                }
+
+                results, rows = self._score_from_aggregates(participant_ids, totals)
+
+                cur.execute(
+                    "DELETE FROM risk_scores WHERE participant_id IN (SELECT participant_id FROM dirty_participants)"
+                )
+                cur.executemany(
+                    """
+                    INSERT INTO risk_scores (participant_id, category, score, risk_level)
+                    VALUES (?, ?, ?, ?)
+                    """,
+                    rows,
+                )
+                cur.execute("DELETE FROM dirty_participants")
+                self._materialize_summary(cur)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+            return results
+        finally:
+            conn.close()
+
+    def _materialize_summary(self, cur: sqlite3.Cursor) -> None:
+        """
+        Rebuild risk_summary from risk_scores: one row per
+        (section, label) with counts and score aggregates. The dashboard
+        reads only this table, so its cost does not grow with participants.
+        """
+        cur.execute(
+            """
+            CREATE TABLE IF NOT EXISTS risk_summary (
+                section TEXT NOT NULL,
+                label TEXT NOT NULL,
+                count INTEGER NOT NULL,
+                avg_score REAL,
+                min_score INTEGER,
+                max_score INTEGER,
+                PRIMARY KEY (section, label)
+            )
+            """
+        )
+        cur.execute("DELETE FROM risk_summary")
+
+        cur.execute(
+            """
+            INSERT INTO risk_summary (section, label, count)
+            SELECT 'participants', 'all', COUNT(*) FROM participants
+            """
+        )
+        cur.execute(
+            """
+            INSERT INTO risk_summary (section, label, count, avg_score, min_score, max_score)
+            SELECT 'overall', 'all', COUNT(*), AVG(score), MIN(score), MAX(score)
+            FROM risk_scores
+            WHERE category = 'overall'
+            HAVING COUNT(*) > 0
+            """
+        )
+        cur.execute(
+            """
+            INSERT INTO risk_summary (section, label, count, avg_score, min_score, max_score)
+            SELECT 'risk_level', risk_level, COUNT(*), AVG(score), MIN(score), MAX(score)
+            FROM risk_scores
+            WHERE category = 'overall'
+            GROUP BY risk_level
+            """
+        )
+        cur.execute(
+            """
+            INSERT INTO risk_summary (section, label, count, avg_score, min_score, max_score)
+            SELECT 'category', category, COUNT(*), AVG(score), MIN(score), MAX(score)
+            FROM risk_scores
+            WHERE category != 'overall'
+            GROUP BY category
+            """
+        )
+        cur.execute(
+            """
+            INSERT INTO risk_summary (section, label, count, avg_score, min_score, max_score)
+            SELECT 'department', COALESCE(p.department, 'Unknown'), COUNT(*), AVG(s.score), MIN(s.score), MAX(s.score)
+            FROM risk_scores s
+            JOIN participants p ON p.id = s.participant_id
+            WHERE s.category = 'overall'
+            GROUP BY COALESCE(p.department, 'Unknown')
+            """
+        )
+
+    def refresh_summary(self) -> None:
+        """Materialize risk_summary after scores were written outside score_all/score_dirty."""
+        conn = self._connect()
+        try:
+            with conn:
+                self._materialize_summary(conn.cursor())
+        finally:
+            conn.close()
+
 
 if __name__ == "__main__":
     scorer = RiskScorer("../data/assessment.db")
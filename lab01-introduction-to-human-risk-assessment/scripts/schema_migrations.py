@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Schema Migrations for assessment.db
+
+Versioned migrations tracked with SQLite's PRAGMA user_version:
+- 1: base tables (no-op on databases created during the lab)
+- 2: composite/covering indexes for scoring and dashboard queries
+
+After migrating, WAL journal mode is enabled and ANALYZE refreshes
+the query planner statistics.
+"""
+
+import sqlite3
+from typing import List, Tuple
+
+
+MIGRATIONS: List[Tuple[int, str, List[str]]] = [
+    (
+        1,
+        "base tables",
+        [
+            """
+            CREATE TABLE IF NOT EXISTS participants (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                employee_id TEXT UNIQUE NOT NULL,
+                department TEXT,
+                role TEXT,
+                experience_years INTEGER,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS risk_responses (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                participant_id INTEGER,
+                question_id TEXT,
+                response_value INTEGER,
+                category TEXT,
+                timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (participant_id) REFERENCES participants(id)
+            )
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS risk_scores (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                participant_id INTEGER,
+                category TEXT,
+                score INTEGER,
+                risk_level TEXT,
+                calculated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (participant_id) REFERENCES participants(id)
+            )
+            """,
+        ],
+    ),
+    (
+        2,
+        "scoring and dashboard indexes",
+        [
+            # Covers the per-participant SELECT and the grouped SUM/COUNT used by
+            # score_all/score_dirty without touching the table rows.
+            """
+            CREATE INDEX IF NOT EXISTS idx_risk_responses_participant_category
+            ON risk_responses (participant_id, category, response_value)
+            """,
+            # Used by the DELETE ... WHERE participant_id before re-inserting scores.
+            """
+            CREATE INDEX IF NOT EXISTS idx_risk_scores_participant
+            ON risk_scores (participant_id)
+            """,
+            # Covers the dashboard GROUP BY risk_level / GROUP BY category aggregates.
+            """
+            CREATE INDEX IF NOT EXISTS idx_risk_scores_category_level
+            ON risk_scores (category, risk_level, score)
+            """,
+        ],
+    ),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+def connect_db(db_path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA foreign_keys = ON;")
+    return conn
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    return int(conn.execute("PRAGMA user_version").fetchone()[0])
+
+
+def migrate(db_path: str, target_version: int = LATEST_VERSION, enable_wal: bool = True) -> int:
+    """
+    Apply pending migrations up to target_version, each in its own transaction.
+    Returns the resulting schema version.
+    """
+    conn = connect_db(db_path)
+    try:
+        current = get_schema_version(conn)
+
+        for version, description, statements in MIGRATIONS:
+            if version <= current or version > target_version:
+                continue
+
+            with conn:
+                for statement in statements:
+                    conn.execute(statement)
+                # PRAGMA does not accept bound parameters; version is an int from MIGRATIONS.
+                conn.execute(f"PRAGMA user_version = {int(version)}")
+
+            print(f"Applied migration {version}: {description}")
+            current = version
+
+        # journal_mode cannot change inside a transaction, so it runs after migrating.
+        if enable_wal:
+            conn.execute("PRAGMA journal_mode = WAL")
+
+        conn.execute("ANALYZE")
+        conn.commit()
+        return current
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    db_path = "../data/assessment.db"
+    version = migrate(db_path)
+    print(f"Schema is at version {version}")
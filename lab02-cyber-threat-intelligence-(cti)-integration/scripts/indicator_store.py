@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+import hashlib
+import json
+import sqlite3
+from datetime import datetime
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit
+
+
+# Fields that define an indicator's content; a change in any of them
+# marks the indicator as "changed" on the next ingestion run.
+CONTENT_FIELDS = ["timestamp", "threat_level", "malware_family", "status", "description"]
+
+
+def normalize_indicator(itype: str, value: str) -> str:
+    """
+    Normalize an indicator value so the same IOC from different feeds
+    maps to one key.
+
+    - File hashes: lowercase hex
+    - IP addresses: stripped
+    - URLs/domains: lowercase scheme and host, path/query kept as-is
+    """
+    value = (value or "").strip().strip('"').strip()
+    t = (itype or "").lower()
+
+    if "hash" in t:
+        return value.lower()
+    if "url" in t or "domain" in t:
+        parts = urlsplit(value)
+        if parts.scheme and parts.netloc:
+            return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, parts.query, parts.fragment))
+        return value.lower()
+    return value
+
+
+def _content_hash(record: Dict[str, Any]) -> str:
+    payload = json.dumps([record.get(k, "") or "" for k in CONTENT_FIELDS])
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+class IndicatorStore:
+    """
+    Persistent, deduplicated indicator store backed by SQLite.
+
+    Indicators are keyed by normalized (type, indicator_value). Each
+    ingestion run upserts in bulk, tracks first_seen/last_seen, and merges
+    the set of feeds (sources) that reported an indicator.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        conn = self._connect()
+        try:
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS indicators (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    type TEXT NOT NULL,
+                    normalized_value TEXT NOT NULL,
+                    indicator_value TEXT NOT NULL,
+                    timestamp TEXT,
+                    threat_level TEXT,
+                    malware_family TEXT,
+                    status TEXT,
+                    description TEXT,
+                    content_hash TEXT NOT NULL,
+                    first_seen TEXT NOT NULL,
+                    last_seen TEXT NOT NULL,
+                    updated_at TEXT NOT NULL,
+                    UNIQUE (type, normalized_value)
+                );
+
+                CREATE TABLE IF NOT EXISTS indicator_sources (
+                    indicator_id INTEGER NOT NULL REFERENCES indicators(id),
+                    source TEXT NOT NULL,
+                    first_seen TEXT NOT NULL,
+                    last_seen TEXT NOT NULL,
+                    PRIMARY KEY (indicator_id, source)
+                );
+
+                CREATE INDEX IF NOT EXISTS idx_indicators_last_seen ON indicators (last_seen);
+                """
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("PRAGMA foreign_keys = ON;")
+        return conn
+
+    def upsert_many(
+        self,
+        records: Iterable[Dict[str, Any]],
+        seen_at: Optional[str] = None,
+        batch_size: int = 10000,
+    ) -> Dict[str, int]:
+        """
+        Bulk-upsert normalized indicator records.
+
+        New indicators are inserted, indicators whose content changed are
+        updated, and unchanged ones only get last_seen bumped. Sources are
+        merged per indicator.
+
+        Args:
+            records: Normalized indicators (as produced by process_cti.py)
+            seen_at: Ingestion timestamp (defaults to now, ISO format)
+            batch_size: Records per executemany batch
+
+        Returns:
+            Counts of new, changed, unchanged and duplicate (in-run) indicators
+        """
+        seen_at = seen_at or datetime.now().isoformat(timespec="seconds")
+        counts = {"new": 0, "changed": 0, "unchanged": 0, "duplicates": 0}
+
+        conn = self._connect()
+        try:
+            conn.execute("CREATE TEMP TABLE IF NOT EXISTS _batch_keys (type TEXT, normalized_value TEXT)")
+
+            batch: List[Dict[str, Any]] = []
+            for rec in records:
+                batch.append(rec)
+                if len(batch) >= batch_size:
+                    self._upsert_batch(conn, batch, seen_at, counts)
+                    batch = []
+            if batch:
+                self._upsert_batch(conn, batch, seen_at, counts)
+
+            return counts
+        finally:
+            conn.close()
+
+    def _upsert_batch(
+        self,
+        conn: sqlite3.Connection,
+        batch: List[Dict[str, Any]],
+        seen_at: str,
+        counts: Dict[str, int],
+    ) -> None:
+        # Collapse duplicates inside the batch first (same IOC from several feeds)
+        merged: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        sources: Dict[Tuple[str, str], set] = {}
+        for rec in batch:
+            itype = rec.get("type", "") or ""
+            key = (itype, normalize_indicator(itype, rec.get("indicator_value", "")))
+            if not key[1]:
+                continue
+            if key in merged:
+                counts["duplicates"] += 1
+            merged[key] = rec
+            sources.setdefault(key, set()).add(rec.get("source", "") or "Unknown")
+
+        with conn:
+            conn.execute("DELETE FROM _batch_keys")
+            conn.executemany("INSERT INTO _batch_keys (type, normalized_value) VALUES (?, ?)", list(merged.keys()))
+            existing = {
+                (t, v): (iid, h)
+                for (iid, t, v, h) in conn.execute(
+                    """
+                    SELECT i.id, i.type, i.normalized_value, i.content_hash
+                    FROM indicators i
+                    JOIN _batch_keys k ON k.type = i.type AND k.normalized_value = i.normalized_value
+                    """
+                )
+            }
+
+            new_rows, changed_rows, unchanged_ids = [], [], []
+            for key, rec in merged.items():
+                h = _content_hash(rec)
+                content = [rec.get(k, "") or "" for k in CONTENT_FIELDS]
+                if key not in existing:
+                    new_rows.append((key[0], key[1], rec.get("indicator_value", ""), *content, h, seen_at, seen_at, seen_at))
+                else:
+                    iid, old_hash = existing[key]
+                    if old_hash != h:
+                        changed_rows.append((*content, h, seen_at, seen_at, iid))
+                    else:
+                        unchanged_ids.append((seen_at, iid))
+
+            conn.executemany(
+                """
+                INSERT INTO indicators (type, normalized_value, indicator_value, timestamp, threat_level,
+                                        malware_family, status, description, content_hash,
+                                        first_seen, last_seen, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                new_rows,
+            )
+            conn.executemany(
+                """
+                UPDATE indicators
+                SET timestamp = ?, threat_level = ?, malware_family = ?, status = ?, description = ?,
+                    content_hash = ?, last_seen = ?, updated_at = ?
+                WHERE id = ?
+                """,
+                changed_rows,
+            )
+            conn.executemany("UPDATE indicators SET last_seen = ? WHERE id = ?", unchanged_ids)
+
+            conn.execute("DELETE FROM _batch_keys")
+            conn.executemany("INSERT INTO _batch_keys (type, normalized_value) VALUES (?, ?)", list(merged.keys()))
+            ids = {
+                (t, v): iid
+                for (iid, t, v) in conn.execute(
+                    """
+                    SELECT i.id, i.type, i.normalized_value
+                    FROM indicators i
+                    JOIN _batch_keys k ON k.type = i.type AND k.normalized_value = i.normalized_value
+                    """
+                )
+            }
+            conn.executemany(
+                """
+                INSERT INTO indicator_sources (indicator_id, source, first_seen, last_seen)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT (indicator_id, source) DO UPDATE SET last_seen = excluded.last_seen
+                """,
+                [(ids[key], src, seen_at, seen_at) for key, srcs in sources.items() for src in sorted(srcs)],
+            )
+
+        counts["new"] += len(new_rows)
+        counts["changed"] += len(changed_rows)
+        counts["unchanged"] += len(unchanged_ids)
+
+    def iter_indicators(self, seen_since: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream stored indicators in the master dataset format.
+
+        'source' is the first feed that reported the indicator; 'sources'
+        lists every feed that has reported it.
+
+        Args:
+            seen_since: Only return indicators with last_seen >= this ISO timestamp
+        """
+        conn = self._connect()
+        try:
+            sql = """
+                SELECT i.id, i.type, i.indicator_value, i.timestamp, i.threat_level, i.malware_family,
+                       i.status, i.description, i.first_seen, i.last_seen,
+                       (SELECT group_concat(source, '|') FROM (
+                            SELECT source FROM indicator_sources s
+                            WHERE s.indicator_id = i.id
+                            ORDER BY s.first_seen, s.source
+                       )) AS sources
+                FROM indicators i
+            """
+            params: Tuple = ()
+            if seen_since:
+                sql += " WHERE i.last_seen >= ?"
+                params = (seen_since,)
+            sql += " ORDER BY i.id"
+
+            for row in conn.execute(sql, params):
+                (_, itype, value, ts, level, family, status, desc, first_seen, last_seen, srcs) = row
+                source_list = srcs.split("|") if srcs else []
+                rec: Dict[str, Any] = {
+                    "timestamp": ts or "",
+                    "indicator_value": value,
+                    "threat_level": level,
+                    "source": source_list[0] if source_list else "",
+                    "sources": source_list,
+                    "type": itype,
+                    "description": desc or "",
+                    "first_seen": first_seen,
+                    "last_seen": last_seen,
+                }
+                if family:
+                    rec["malware_family"] = family
+                if status:
+                    rec["status"] = status
+                yield rec
+        finally:
+            conn.close()
+
+    def count(self) -> int:
+        conn = self._connect()
+        try:
+            return int(conn.execute("SELECT COUNT(*) FROM indicators").fetchone()[0])
+        finally:
+            conn.close()
+
+
+if __name__ == "__main__":
+    store = IndicatorStore("output/indicator_store.db")
+    print(f"Indicator store has {store.count()} indicators")
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+import heapq
+import itertools
+from typing import List, Dict, Any, Generic, Optional, Tuple, TypeVar
+
+
+T = TypeVar("T")
+
+# Risk matrix buckets: (name, min score, max score, primary action, timeline)
+PRIORITY_BUCKETS: List[Tuple[str, int, int, str, str]] = [
+    ("Critical (12-15)", 12, 15, "Immediate Response", "Within 24 hours"),
+    ("High (8-11)", 8, 11, "Urgent Investigation", "Within 72 hours"),
+    ("Medium (5-7)", 5, 7, "Scheduled Review", "Within 2 weeks"),
+    ("Low (1-4)", 1, 4, "Routine Monitoring", "Ongoing"),
+]
+
+
+def bucket_for_score(score: int) -> str:
+    """Map a priority score to its risk matrix bucket (anything below 5 is Low)."""
+    for name, low, high, _, _ in PRIORITY_BUCKETS:
+        if low <= score <= high:
+            return name
+    return PRIORITY_BUCKETS[-1][0]
+
+
+class StreamingTopK(Generic[T]):
+    """
+    Keep the K highest-scoring items seen so far in a bounded min-heap.
+
+    Ties keep the earlier item, so top() matches
+    sorted(items, key=score, reverse=True)[:k] (Python's stable sort).
+    """
+
+    def __init__(self, k: int):
+        self.k = k
+        self._heap: List[Tuple[int, int, T]] = []
+        self._seq = itertools.count()
+
+    def push(self, score: int, item: T) -> None:
+        if self.k <= 0:
+            return
+        entry = (score, -next(self._seq), item)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+
+    def would_accept(self, score: int) -> bool:
+        """True if an item with this score would enter the heap (lets callers skip building it)."""
+        return len(self._heap) < self.k or score > self._heap[0][0]
+
+    def top(self) -> List[Tuple[int, T]]:
+        """Return (score, item) pairs, highest score first."""
+        return [(score, item) for score, _, item in sorted(self._heap, key=lambda e: e[:2], reverse=True)]
+
+
+class PrioritySummary:
+    """
+    One-pass priority summary: per-bucket counts, averages and indicator
+    types for the full dataset, plus the top-K records.
+    """
+
+    def __init__(self, top_k: int = 10):
+        self.total = 0
+        self.top_k: StreamingTopK[Dict[str, Any]] = StreamingTopK(top_k)
+        self._counts: Dict[str, int] = {name: 0 for name, _, _, _, _ in PRIORITY_BUCKETS}
+        self._sums: Dict[str, int] = {name: 0 for name, _, _, _, _ in PRIORITY_BUCKETS}
+        self._types: Dict[str, set] = {name: set() for name, _, _, _, _ in PRIORITY_BUCKETS}
+
+    def add(self, score: int, record: Dict[str, Any]) -> None:
+        self.total += 1
+        bucket = bucket_for_score(score)
+        self._counts[bucket] += 1
+        self._sums[bucket] += score
+        self._types[bucket].add(record.get("type", "Unknown"))
+        self.top_k.push(score, record)
+
+    def count(self, bucket: str) -> int:
+        return self._counts[bucket]
+
+    def buckets(self) -> Dict[str, Dict[str, Any]]:
+        """Per-bucket statistics in risk matrix order."""
+        result: Dict[str, Dict[str, Any]] = {}
+        for name, _, _, action, timeline in PRIORITY_BUCKETS:
+            count = self._counts[name]
+            result[name] = {
+                "count": count,
+                "avg_score": round(self._sums[name] / count, 2) if count else 0.0,
+                "indicator_types": sorted(self._types[name]),
+                "primary_action": action,
+                "timeline": timeline,
+            }
+        return result
+
+    def top(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        items = [item for _, item in self.top_k.top()]
+        return items[:limit] if limit is not None else items
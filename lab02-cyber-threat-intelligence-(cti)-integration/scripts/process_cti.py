@@ -1,224 +1,419 @@
 #!/usr/bin/env python3
 import csv
+import io
+import itertools
 import json
-from datetime import datetime
-from typing import List, Dict, Any
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import List, Dict, Any, Callable, Deque, Iterable, Iterator, Optional, Tuple
 
+from indicator_store import IndicatorStore
 
-def process_malware_hashes(input_file: str) -> List[Dict[str, Any]]:
-    """
-    Process malware hash indicators from MalwareBazaar.
 
-    Args:
-        input_file: Path to CSV file with malware hashes
+# Column order shared by the CSV export and downstream spreadsheet scripts
+CSV_HEADERS = ["timestamp", "type", "indicator_value", "threat_level", "source", "description"]
 
-    Returns:
-        List of processed indicator dictionaries
+# Chunk size used to split large feeds across worker processes
+DEFAULT_CHUNK_BYTES = 8 * 1024 * 1024
+
+
+def _iter_feed_rows(input_file: str) -> Iterator[List[str]]:
     """
-    processed = []
-    count = 0
+    Stream CSV rows from a feed file with a single csv.reader.
 
-    # Open and read the CSV file
-    # Skip comment lines starting with '#'
-    # Extract relevant fields: timestamp, hash, malware_family
-    # Add threat_level='High', source='MalwareBazaar', type='File Hash'
-    # Limit to first 50 records
+    Comment lines starting with '#' and blank lines are skipped before
+    parsing, so one reader handles the whole file without buffering it.
+    """
+    with open(input_file, "r", encoding="utf-8", errors="ignore") as f:
+        lines = (line.strip() for line in f)
+        yield from csv.reader(line for line in lines if line and not line.startswith("#"))
+
+
+def _normalize_malware_row(row: List[str]) -> Optional[Dict[str, Any]]:
+    """Map one MalwareBazaar row to an indicator (threat_level='High', type='File Hash')."""
+    # Common columns for bazaar export can vary; we try best-effort extraction:
+    # timestamp is often at index 0, sha256 at index 1, malware family sometimes later.
+    timestamp = row[0] if len(row) > 0 else ""
+    sha256_hash = row[1] if len(row) > 1 else ""
+    malware_family = row[2] if len(row) > 2 else ""
+
+    if not sha256_hash:
+        return None
+
+    return {
+        "timestamp": timestamp,
+        "indicator_value": sha256_hash,
+        "malware_family": malware_family,
+        "threat_level": "High",
+        "source": "MalwareBazaar",
+        "type": "File Hash",
+        "description": f"Malware family: {malware_family}" if malware_family else "Malware hash indicator",
+    }
+
+
+def _normalize_ip_row(row: List[str]) -> Optional[Dict[str, Any]]:
+    """Map one Feodo Tracker row to an indicator (threat_level='Medium', type='IP Address')."""
+    # Feodo IP blocklist CSV lines usually start with IP
+    # We take first CSV field as IP address
+    ip_address = row[0].strip() if row else ""
+    if not ip_address:
+        return None
+
+    return {
+        "timestamp": "",  # may not be present in this feed
+        "indicator_value": ip_address,
+        "threat_level": "Medium",
+        "source": "Feodo Tracker",
+        "type": "IP Address",
+        "description": "Known malicious/botnet C2 IP (Feodo Tracker)",
+    }
+
+
+def _normalize_url_row(row: List[str]) -> Optional[Dict[str, Any]]:
+    """Map one URLhaus row to an indicator (threat_level='High', type='URL/Domain')."""
+    # URLhaus CSV often has: id, dateadded, url, url_status, ...
+    # We'll best-effort map:
+    timestamp = ""
+    url = ""
+    status = ""
+
+    if len(row) >= 4:
+        timestamp = row[1]
+        url = row[2]
+        status = row[3]
+    elif len(row) >= 3:
+        timestamp = row[0]
+        url = row[1]
+        status = row[2]
+    elif len(row) >= 2:
+        url = row[0]
+        status = row[1]
+    else:
+        return None
+
+    if not url:
+        return None
+
+    return {
+        "timestamp": timestamp,
+        "indicator_value": url,
+        "status": status,
+        "threat_level": "High",
+        "source": "URLhaus",
+        "type": "URL/Domain",
+        "description": f"URLhaus malicious URL (status: {status})" if status else "URLhaus malicious URL",
+    }
+
+
+# Feed registry used by the parallel ingestion path: (source, path, row normalizer)
+FEEDS: List[Tuple[str, str, Callable[[List[str]], Optional[Dict[str, Any]]]]] = [
+    ("MalwareBazaar", "data/malware_hashes.csv", _normalize_malware_row),
+    ("Feodo Tracker", "data/feodo_ips.csv", _normalize_ip_row),
+    ("URLhaus", "data/urlhaus_domains.csv", _normalize_url_row),
+]
+
+
+def _iter_normalized(
+    input_file: str,
+    normalize: Callable[[List[str]], Optional[Dict[str, Any]]],
+    limit: Optional[int],
+    file_label: str,
+    error_label: str,
+) -> Iterator[Dict[str, Any]]:
+    count = 0
     try:
-        with open(input_file, "r", encoding="utf-8", errors="ignore") as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
+        for row in _iter_feed_rows(input_file):
+            if limit is not None and count >= limit:
+                break
 
-                # MalwareBazaar export is CSV-like; we parse using csv.reader for robustness
-                row = next(csv.reader([line]))
-                # Common columns for bazaar export can vary; we try best-effort extraction:
-                # timestamp is often at index 0, sha256 at index 1, malware family sometimes later.
-                timestamp = row[0] if len(row) > 0 else ""
-                sha256_hash = row[1] if len(row) > 1 else ""
-                malware_family = row[2] if len(row) > 2 else ""
+            record = normalize(row)
+            if record is None:
+                continue
 
-                if not sha256_hash:
-                    continue
-
-                record = {
-                    "timestamp": timestamp,
-                    "indicator_value": sha256_hash,
-                    "malware_family": malware_family,
-                    "threat_level": "High",
-                    "source": "MalwareBazaar",
-                    "type": "File Hash",
-                    "description": f"Malware family: {malware_family}" if malware_family else "Malware hash indicator",
-                }
-                processed.append(record)
-                count += 1
-                if count >= 50:
-                    break
+            yield record
+            count += 1
     except FileNotFoundError:
-        print(f"[ERROR] Malware hashes file not found: {input_file}")
+        print(f"[ERROR] {file_label} file not found: {input_file}")
     except Exception as e:
-        print(f"[ERROR] Failed processing malware hashes: {e}")
-
-    return processed
+        print(f"[ERROR] Failed processing {error_label}: {e}")
 
 
-def process_ip_indicators(input_file: str) -> List[Dict[str, Any]]:
+def iter_malware_hashes(input_file: str, limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
     """
-    Process IP reputation data from Feodo Tracker.
+    Stream normalized malware hash indicators from MalwareBazaar.
 
     Args:
-        input_file: Path to file with malicious IPs
+        input_file: Path to CSV file with malware hashes
+        limit: Maximum number of records to yield (None = no limit)
 
-    Returns:
-        List of processed IP indicator dictionaries
+    Yields:
+        Processed indicator dictionaries
     """
-    processed = []
-    count = 0
+    return _iter_normalized(input_file, _normalize_malware_row, limit, "Malware hashes", "malware hashes")
 
-    # Read file line by line
-    # Skip comments and empty lines
-    # Extract IP addresses
-    # Create records with: ip_address, threat_level='Medium',
-    # source='Feodo Tracker', type='IP Address'
-    # Limit to first 50 records
-    try:
-        with open(input_file, "r", encoding="utf-8", errors="ignore") as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
 
-                # Feodo IP blocklist CSV lines usually start with IP
-                # We take first CSV field as IP address
-                row = next(csv.reader([line]))
-                ip_address = row[0].strip() if row else ""
-                if not ip_address:
-                    continue
+def iter_ip_indicators(input_file: str, limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Stream normalized IP reputation indicators from Feodo Tracker.
 
-                record = {
-                    "timestamp": "",  # may not be present in this feed
-                    "indicator_value": ip_address,
-                    "threat_level": "Medium",
-                    "source": "Feodo Tracker",
-                    "type": "IP Address",
-                    "description": "Known malicious/botnet C2 IP (Feodo Tracker)",
-                }
-                processed.append(record)
-                count += 1
-                if count >= 50:
-                    break
-    except FileNotFoundError:
-        print(f"[ERROR] Feodo IP file not found: {input_file}")
-    except Exception as e:
-        print(f"[ERROR] Failed processing IP indicators: {e}")
+    Args:
+        input_file: Path to file with malicious IPs
+        limit: Maximum number of records to yield (None = no limit)
 
-    return processed
+    Yields:
+        Processed IP indicator dictionaries
+    """
+    return _iter_normalized(input_file, _normalize_ip_row, limit, "Feodo IP", "IP indicators")
 
 
-def process_url_indicators(input_file: str) -> List[Dict[str, Any]]:
+def iter_url_indicators(input_file: str, limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
     """
-    Process malicious URL indicators from URLhaus.
+    Stream normalized malicious URL indicators from URLhaus.
 
     Args:
         input_file: Path to CSV with malicious URLs
+        limit: Maximum number of records to yield (None = no limit)
 
-    Returns:
-        List of processed URL indicator dictionaries
+    Yields:
+        Processed URL indicator dictionaries
     """
-    processed = []
-    count = 0
-
-    # Open and parse CSV file
-    # Skip comment lines
-    # Extract: timestamp, url, status
-    # Add threat_level='High', source='URLhaus', type='URL/Domain'
-    # Limit to first 50 records
-    try:
-        with open(input_file, "r", encoding="utf-8", errors="ignore") as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
+    return _iter_normalized(input_file, _normalize_url_row, limit, "URLhaus", "URL indicators")
+
+
+def process_malware_hashes(input_file: str, limit: Optional[int] = 50) -> List[Dict[str, Any]]:
+    """List wrapper around iter_malware_hashes (defaults to the lab's 50-record sample)."""
+    return list(iter_malware_hashes(input_file, limit))
+
+
+def process_ip_indicators(input_file: str, limit: Optional[int] = 50) -> List[Dict[str, Any]]:
+    """List wrapper around iter_ip_indicators (defaults to the lab's 50-record sample)."""
+    return list(iter_ip_indicators(input_file, limit))
+
+
+def process_url_indicators(input_file: str, limit: Optional[int] = 50) -> List[Dict[str, Any]]:
+    """List wrapper around iter_url_indicators (defaults to the lab's 50-record sample)."""
+    return list(iter_url_indicators(input_file, limit))
+
+
+def _split_feed(input_file: str, chunk_bytes: int) -> List[Tuple[int, int]]:
+    """Split a feed into byte ranges that start and end on line boundaries."""
+    size = os.path.getsize(input_file)
+    boundaries = [0]
+    with open(input_file, "rb") as f:
+        pos = chunk_bytes
+        while pos < size:
+            f.seek(pos)
+            f.readline()
+            pos = f.tell()
+            if pos >= size:
+                break
+            boundaries.append(pos)
+            pos += chunk_bytes
+    boundaries.append(size)
+    return list(zip(boundaries[:-1], boundaries[1:]))
+
+
+def _parse_chunk(
+    normalize: Callable[[List[str]], Optional[Dict[str, Any]]],
+    input_file: str,
+    start: int,
+    end: int,
+) -> Tuple[List[Dict[str, Any]], float]:
+    """Worker: parse one byte range of a feed. Returns records and parse time in seconds."""
+    t0 = time.perf_counter()
+    with open(input_file, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+
+    # newline=None gives the same newline translation as the text-mode reader
+    lines = (line.strip() for line in io.StringIO(data.decode("utf-8", errors="ignore"), newline=None))
+    rows = csv.reader(line for line in lines if line and not line.startswith("#"))
+    records = [rec for rec in map(normalize, rows) if rec is not None]
+    return records, time.perf_counter() - t0
+
+
+def iter_indicators_parallel(
+    limit: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+    stats: Optional[Dict[str, Dict[str, float]]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Parse all feeds in a process pool, split into line-aligned chunks.
 
-                row = next(csv.reader([line]))
-                # URLhaus CSV often has: id, dateadded, url, url_status, ...
-                # We'll best-effort map:
-                timestamp = ""
-                url = ""
-                status = ""
-
-                if len(row) >= 4:
-                    timestamp = row[1]
-                    url = row[2]
-                    status = row[3]
-                elif len(row) >= 3:
-                    timestamp = row[0]
-                    url = row[1]
-                    status = row[2]
-                elif len(row) >= 2:
-                    url = row[0]
-                    status = row[1]
-                else:
-                    continue
+    Results are yielded in source order (feed by feed, chunk by chunk), so
+    output matches iter_all_indicators. At most 2 x workers chunks are in
+    flight, which keeps memory bounded when the writer is slower than parsing.
 
-                if not url:
+    Args:
+        limit: Maximum records per feed (None = no limit)
+        max_workers: Pool size (None = os.cpu_count())
+        chunk_bytes: Approximate chunk size per task
+        stats: Optional dict filled with per-feed records, parse seconds and records/sec
+    """
+    tasks = []
+    for source, path, normalize in FEEDS:
+        try:
+            ranges = _split_feed(path, chunk_bytes)
+        except FileNotFoundError:
+            print(f"[ERROR] {source} file not found: {path}")
+            continue
+        tasks.extend((source, path, normalize, start, end) for start, end in ranges)
+
+    feed_stats: Dict[str, Dict[str, float]] = stats if stats is not None else {}
+    for source, _, _ in FEEDS:
+        feed_stats.setdefault(source, {"records": 0, "parsed": 0, "seconds": 0.0, "records_per_sec": 0.0})
+
+    def limit_reached(source: str) -> bool:
+        return limit is not None and feed_stats[source]["records"] >= limit
+
+    workers = max_workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: Deque[Tuple[str, Future]] = deque()
+        task_iter = iter(tasks)
+
+        def submit_next() -> None:
+            for source, path, normalize, start, end in task_iter:
+                if limit_reached(source):
                     continue
-
-                record = {
-                    "timestamp": timestamp,
-                    "indicator_value": url,
-                    "status": status,
-                    "threat_level": "High",
-                    "source": "URLhaus",
-                    "type": "URL/Domain",
-                    "description": f"URLhaus malicious URL (status: {status})" if status else "URLhaus malicious URL",
-                }
-                processed.append(record)
-                count += 1
-                if count >= 50:
+                pending.append((source, pool.submit(_parse_chunk, normalize, path, start, end)))
+                return
+
+        for _ in range(workers * 2):
+            submit_next()
+
+        while pending:
+            source, future = pending.popleft()
+            try:
+                records, seconds = future.result()
+            except Exception as e:
+                print(f"[ERROR] Failed processing {source} chunk: {e}")
+                records, seconds = [], 0.0
+
+            st = feed_stats[source]
+            st["parsed"] += len(records)
+            st["seconds"] += seconds
+            for rec in records:
+                if limit_reached(source):
                     break
-    except FileNotFoundError:
-        print(f"[ERROR] URLhaus file not found: {input_file}")
-    except Exception as e:
-        print(f"[ERROR] Failed processing URL indicators: {e}")
+                st["records"] += 1
+                yield rec
+
+            submit_next()
 
-    return processed
+    for st in feed_stats.values():
+        st["records_per_sec"] = st["parsed"] / st["seconds"] if st["seconds"] else 0.0
 
 
-def create_master_dataset() -> List[Dict[str, Any]]:
-    """Combine all CTI sources into master dataset."""
-    all_indicators: List[Dict[str, Any]] = []
+def iter_all_indicators(limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """Chain all CTI feeds into one stream of normalized indicators (limit applies per feed)."""
+    return itertools.chain(
+        iter_malware_hashes("data/malware_hashes.csv", limit),
+        iter_ip_indicators("data/feodo_ips.csv", limit),
+        iter_url_indicators("data/urlhaus_domains.csv", limit),
+    )
 
-    malware = process_malware_hashes("data/malware_hashes.csv")
-    ips = process_ip_indicators("data/feodo_ips.csv")
-    urls = process_url_indicators("data/urlhaus_domains.csv")
 
-    all_indicators.extend(malware)
-    all_indicators.extend(ips)
-    all_indicators.extend(urls)
+def write_master_dataset(
+    indicators: Iterable[Dict[str, Any]],
+    json_file: str = "output/master_cti_dataset.json",
+    jsonl_file: str = "output/master_cti_dataset.jsonl",
+    csv_file: str = "output/master_cti_dataset.csv",
+) -> int:
+    """
+    Write indicators to JSON, JSON Lines and CSV as they arrive.
 
-    # Save as JSON to output/master_cti_dataset.json
-    with open("output/master_cti_dataset.json", "w", encoding="utf-8") as f:
-        json.dump(all_indicators, f, indent=2)
+    The JSON file is still a single array (downstream scripts json.load it),
+    but it is emitted record by record so memory stays flat.
 
-    # Save as CSV to output/master_cti_dataset.csv
-    csv_headers = ["timestamp", "type", "indicator_value", "threat_level", "source", "description"]
-    with open("output/master_cti_dataset.csv", "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=csv_headers)
+    Returns:
+        Number of indicators written
+    """
+    count = 0
+    with open(json_file, "w", encoding="utf-8") as jf, \
+            open(jsonl_file, "w", encoding="utf-8") as lf, \
+            open(csv_file, "w", newline="", encoding="utf-8") as cf:
+        writer = csv.DictWriter(cf, fieldnames=CSV_HEADERS, extrasaction="ignore", restval="")
         writer.writeheader()
-        for rec in all_indicators:
-            writer.writerow({
-                "timestamp": rec.get("timestamp", ""),
-                "type": rec.get("type", ""),
-                "indicator_value": rec.get("indicator_value", ""),
-                "threat_level": rec.get("threat_level", ""),
-                "source": rec.get("source", ""),
-                "description": rec.get("description", ""),
-            })
 
-    print(f"Processed {len(all_indicators)} indicators")
-    return all_indicators
+        jf.write("[")
+        for rec in indicators:
+            line = json.dumps(rec)
+            jf.write(",\n  " if count else "\n  ")
+            jf.write(line)
+            lf.write(line)
+            lf.write("\n")
+            writer.writerow(rec)
+            count += 1
+        jf.write("\n]\n" if count else "]\n")
+
+    return count
+
+
+def create_master_dataset(
+    limit: Optional[int] = None,
+    parallel: bool = False,
+    max_workers: Optional[int] = None,
+) -> int:
+    """
+    Combine all CTI sources into master dataset.
+
+    Feeds are streamed straight into the JSON, JSON Lines and CSV outputs,
+    so full MalwareBazaar/URLhaus dumps never sit in memory at once.
+
+    Args:
+        limit: Maximum records per feed (None = no limit)
+        parallel: Parse feeds/chunks in a process pool
+        max_workers: Pool size for parallel mode (None = os.cpu_count())
+
+    Returns:
+        Number of indicators written
+    """
+    if not parallel:
+        total = write_master_dataset(iter_all_indicators(limit))
+        print(f"Processed {total} indicators")
+        return total
+
+    stats: Dict[str, Dict[str, float]] = {}
+    t0 = time.perf_counter()
+    total = write_master_dataset(iter_indicators_parallel(limit, max_workers, stats=stats))
+    elapsed = time.perf_counter() - t0
+
+    print(f"Processed {total} indicators in {elapsed:.2f}s ({total / elapsed if elapsed else 0:.0f} records/sec overall)")
+    for source, st in stats.items():
+        print(f" - {source}: {int(st['records'])} records, {st['records_per_sec']:.0f} records/sec parse throughput")
+    return total
+
+
+def ingest_to_store(
+    store_path: str = "output/indicator_store.db",
+    limit: Optional[int] = None,
+    parallel: bool = False,
+) -> Dict[str, int]:
+    """
+    Upsert all feeds into the deduplicating IndicatorStore.
+
+    Only new or changed indicators are rewritten; repeats across feeds
+    and across daily runs just have last_seen and their sources merged.
+    """
+    indicators = iter_indicators_parallel(limit) if parallel else iter_all_indicators(limit)
+    counts = IndicatorStore(store_path).upsert_many(indicators)
+    print(
+        f"Indicator store: {counts['new']} new, {counts['changed']} changed, "
+        f"{counts['unchanged']} unchanged, {counts['duplicates']} in-run duplicates"
+    )
+    return counts
 
 
 if __name__ == "__main__":
-    create_master_dataset()
+    # Usage: process_cti.py [per-feed limit] [--parallel] [--store]
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    record_limit = int(args[0]) if args else None
+    use_parallel = "--parallel" in sys.argv[1:]
+    if "--store" in sys.argv[1:]:
+        ingest_to_store(limit=record_limit, parallel=use_parallel)
+    else:
+        create_master_dataset(record_limit, parallel=use_parallel)
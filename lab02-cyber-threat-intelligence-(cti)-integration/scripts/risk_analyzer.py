@@ -1,16 +1,24 @@
 #!/usr/bin/env python3
 import json
+import sys
 from collections import Counter, defaultdict
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+
+from indicator_store import IndicatorStore
+from priority_summary import PrioritySummary, StreamingTopK
+from term_matcher import TermMatcher, load_terms
 
 
 class CTIRiskAnalyzer:
-    def __init__(self, data_file: str):
-        """Initialize analyzer with CTI data."""
-        # Load JSON data from file
-        with open(data_file, "r", encoding="utf-8") as f:
-            self.data: List[Dict[str, Any]] = json.load(f)
+    def __init__(self, data_file: str = "", records: Optional[List[Dict[str, Any]]] = None):
+        """Initialize analyzer with CTI data (from a JSON file or preloaded records)."""
+        if records is not None:
+            self.data: List[Dict[str, Any]] = records
+        else:
+            # Load JSON data from file
+            with open(data_file, "r", encoding="utf-8") as f:
+                self.data = json.load(f)
 
         # Define risk_matrix with weights for high/medium/low
         self.risk_matrix = {
@@ -34,6 +42,43 @@ class CTIRiskAnalyzer:
             "agenttesla", "redline", "lokibot", "remcos", "formbook", "raccoon", "vidar"
         ]
 
+        self._compile_matchers()
+
+    def _compile_matchers(self) -> None:
+        """Precompile the keyword lists into single-pass multi-term matchers."""
+        self.social_engineering_matcher = TermMatcher(self.social_engineering_terms)
+        self.malware_family_matcher = TermMatcher(self.user_targeting_malware_families)
+
+    def load_term_list(self, path: str, kind: str = "social_engineering", replace: bool = False) -> int:
+        """
+        Load extra keywords (e.g. phishing lure terms from internal threat intel).
+
+        Args:
+            path: .txt (one term per line) or .json (list, or object of lists)
+            kind: "social_engineering" or "malware_family"
+            replace: Replace the built-in list instead of extending it
+
+        Returns:
+            Number of terms now active for that kind
+        """
+        attr = {
+            "social_engineering": "social_engineering_terms",
+            "malware_family": "user_targeting_malware_families",
+        }.get(kind)
+        if attr is None:
+            raise ValueError(f"Unknown term list kind: {kind}")
+
+        terms = load_terms(path)
+        current = [] if replace else list(getattr(self, attr))
+        setattr(self, attr, current + [t for t in terms if t not in current])
+        self._compile_matchers()
+        return len(getattr(self, attr))
+
+    @classmethod
+    def from_store(cls, db_path: str, seen_since: Optional[str] = None) -> "CTIRiskAnalyzer":
+        """Build an analyzer from the deduplicated IndicatorStore instead of the master JSON."""
+        return cls(records=list(IndicatorStore(db_path).iter_indicators(seen_since)))
+
     def analyze_threat_landscape(self):
         """
         Perform threat landscape analysis.
@@ -71,7 +116,7 @@ class CTIRiskAnalyzer:
             pct = (cnt / total) * 100
             print(f" - {t}: {cnt} ({pct:.1f}%)")
 
-    def calculate_priority_score(self, record: Dict[str, Any]) -> int:
+    def calculate_priority_score(self, record: Dict[str, Any], now: Optional[datetime] = None) -> int:
         """
         Calculate priority score (1-15) based on multiple factors.
 
@@ -83,11 +128,13 @@ class CTIRiskAnalyzer:
 
         Args:
             record: Indicator dictionary
+            now: Reference time for the recency check (defaults to now)
 
         Returns:
             Integer priority score (1-15)
         """
         score = 0
+        recent_cutoff = (now or datetime.now()) - timedelta(days=7)
 
         # Calculate base score from threat level
         tl = record.get("threat_level", "Low")
@@ -116,7 +163,7 @@ class CTIRiskAnalyzer:
             for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d", "%Y-%m-%dT%H:%M:%S"):
                 try:
                     dt = datetime.strptime(ts.strip(), fmt)
-                    if dt >= datetime.now() - timedelta(days=7):
+                    if dt >= recent_cutoff:
                         recent = True
                     break
                 except Exception:
@@ -132,46 +179,93 @@ class CTIRiskAnalyzer:
 
         return score
 
-    def prioritize_threats(self) -> List[Dict[str, Any]]:
+    def score_frame(self, now: Optional[datetime] = None):
+        """
+        Score every indicator in one columnar pass (pandas/NumPy).
+
+        Gives the same priority_score, recommended_action and
+        response_timeline as the per-record path.
+
+        Returns:
+        pandas DataFrame of indicators with the scoring columns added
+        """
+        # Imported here so the per-record path keeps working without pandas
+        from vectorized_scoring import records_to_frame, score_priority_frame
+
+        return score_priority_frame(records_to_frame(self.data), self.risk_matrix, self.trusted_sources, now)
+
+    def prioritize_threats(self, vectorized: bool = False) -> List[Dict[str, Any]]:
         """
         Prioritize all threats and return sorted list.
 
+        Args:
+            vectorized: Score with the columnar pandas/NumPy engine
+
         Returns:
         List of threat dictionaries sorted by priority_score
         """
+        if vectorized:
+            from vectorized_scoring import frame_to_records
+
+            frame = self.score_frame().sort_values("priority_score", ascending=False, kind="stable")
+            prioritized = frame_to_records(frame, self.data)
+            self._print_top_prioritized(prioritized)
+            return prioritized
+
         prioritized = []
+        now = datetime.now()
 
         for rec in self.data:
-            ps = self.calculate_priority_score(rec)
-
-            action = "Monitor"
-            timeline = "Ongoing"
-            if ps >= 12:
-                action = "Immediate Response"
-                timeline = "Within 24 hours"
-            elif ps >= 8:
-                action = "Urgent Investigation"
-                timeline = "Within 72 hours"
-            elif ps >= 5:
-                action = "Scheduled Review"
-                timeline = "Within 2 weeks"
-
-            enriched = dict(rec)
-            enriched["priority_score"] = ps
-            enriched["recommended_action"] = action
-            enriched["response_timeline"] = timeline
-
-            prioritized.append(enriched)
+            ps = self.calculate_priority_score(rec, now)
+            prioritized.append(self._enrich_priority(rec, ps))
 
         prioritized.sort(key=lambda x: x.get("priority_score", 0), reverse=True)
 
+        self._print_top_prioritized(prioritized)
+        return prioritized
+
+    def _enrich_priority(self, rec: Dict[str, Any], ps: int) -> Dict[str, Any]:
+        action = "Monitor"
+        timeline = "Ongoing"
+        if ps >= 12:
+            action = "Immediate Response"
+            timeline = "Within 24 hours"
+        elif ps >= 8:
+            action = "Urgent Investigation"
+            timeline = "Within 72 hours"
+        elif ps >= 5:
+            action = "Scheduled Review"
+            timeline = "Within 2 weeks"
+
+        enriched = dict(rec)
+        enriched["priority_score"] = ps
+        enriched["recommended_action"] = action
+        enriched["response_timeline"] = timeline
+        return enriched
+
+    def summarize_priorities(self, top_k: int = 10) -> Dict[str, Any]:
+        """
+        Score all threats in one pass without sorting or copying the dataset.
+
+        Returns:
+        Dict with the PrioritySummary (per-bucket counts/averages for the full
+        dataset) and the top_k threats enriched like prioritize_threats output
+        """
+        summary = PrioritySummary(top_k)
+        now = datetime.now()
+        for rec in self.data:
+            summary.add(self.calculate_priority_score(rec, now), rec)
+
+        top_threats = [self._enrich_priority(rec, ps) for ps, rec in summary.top_k.top()]
+        self._print_top_prioritized(top_threats)
+        return {"summary": summary, "top": top_threats}
+
+    def _print_top_prioritized(self, prioritized: List[Dict[str, Any]]) -> None:
         print("\n===== TOP 10 PRIORITIZED THREATS =====")
         for i, t in enumerate(prioritized[:10], start=1):
             print(f"{i}. [{t.get('priority_score')}] {t.get('type')} | {t.get('indicator_value')} | "
                   f"{t.get('threat_level')} | {t.get('source')} | {t.get('recommended_action')}")
 
-        return prioritized
-
     def analyze_human_risk_factors(self) -> List[Dict[str, Any]]:
         """
         Identify threats targeting human vulnerabilities.
@@ -184,40 +278,75 @@ class CTIRiskAnalyzer:
         Returns:
         List of human-targeting threats with risk scores
         """
-        human_threats = []
+        human_threats = [
+            self._enrich_human(rec, human_score, se_terms, families)
+            for human_score, rec, se_terms, families in self._iter_human_scores()
+        ]
+
+        human_threats.sort(key=lambda x: x.get("human_risk_score", 0), reverse=True)
+
+        self._print_top_human(human_threats)
+        return human_threats
+
+    def _iter_human_scores(self):
+        """Yield (human_score, record, matched terms, matched families) for human-targeting threats."""
+        se_matcher = self.social_engineering_matcher
+        fam_matcher = self.malware_family_matcher
 
         for rec in self.data:
             human_score = 0
             itype = (rec.get("type") or "").lower()
-            val = (rec.get("indicator_value") or "").lower()
-            desc = (rec.get("description") or "").lower()
-            fam = (rec.get("malware_family") or "").lower()
 
             # Score URLs/domains higher (+3)
             if "url" in itype or "domain" in itype:
                 human_score += 3
 
             # Check for social engineering terms (+2)
-            if any(term in val or term in desc for term in self.social_engineering_terms):
+            se_terms = se_matcher.find(rec.get("indicator_value") or "", rec.get("description") or "")
+            if se_terms:
                 human_score += 2
 
             # Check for user-targeting malware (+2)
-            if fam and any(m in fam for m in self.user_targeting_malware_families):
+            families = fam_matcher.find(rec.get("malware_family") or "")
+            if families:
                 human_score += 2
 
             if human_score > 0:
-                enriched = dict(rec)
-                enriched["human_risk_score"] = human_score
-                human_threats.append(enriched)
+                yield human_score, rec, se_terms, families
 
-        human_threats.sort(key=lambda x: x.get("human_risk_score", 0), reverse=True)
+    def _enrich_human(self, rec: Dict[str, Any], human_score: int, se_terms, families) -> Dict[str, Any]:
+        enriched = dict(rec)
+        enriched["human_risk_score"] = human_score
+        # Match evidence for the report
+        enriched["matched_terms"] = sorted(se_terms)
+        enriched["matched_malware_families"] = sorted(families)
+        return enriched
 
+    def _print_top_human(self, human_threats: List[Dict[str, Any]]) -> None:
         print("\n===== TOP 5 HUMAN-TARGETING THREATS =====")
         for i, t in enumerate(human_threats[:5], start=1):
+            evidence = ", ".join(t.get("matched_terms", []) + t.get("matched_malware_families", []))
             print(f"{i}. [HumanScore={t.get('human_risk_score')}] {t.get('type')} | {t.get('indicator_value')} | "
-                  f"{t.get('threat_level')} | {t.get('source')}")
+                  f"{t.get('threat_level')} | {t.get('source')}" + (f" | matched: {evidence}" if evidence else ""))
 
-        return human_threats
+    def summarize_human_risks(self, top_k: int = 5) -> Dict[str, Any]:
+        """
+        One-pass human risk summary: total count, term hit counts and top_k threats.
+        Only the retained top_k records are copied and enriched.
+        """
+        top: StreamingTopK = StreamingTopK(top_k)
+        term_hits: Counter = Counter()
+        total = 0
+        for human_score, rec, se_terms, families in self._iter_human_scores():
+            total += 1
+            term_hits.update(se_terms)
+            term_hits.update(families)
+            if top.would_accept(human_score):
+                top.push(human_score, (rec, se_terms, families))
+
+        top_threats = [self._enrich_human(rec, score, se, fam) for score, (rec, se, fam) in top.top()]
+        self._print_top_human(top_threats)
+        return {"total": total, "term_hits": term_hits, "top": top_threats}
 
     def generate_recommendations(self, prioritized: List[Dict[str, Any]], human_risks: List[Dict[str, Any]]) -> List[str]:
         """
@@ -257,15 +386,23 @@ class CTIRiskAnalyzer:
     def generate_report(self, output_file: str) -> Dict[str, Any]:
         """Generate comprehensive risk assessment report."""
         self.analyze_threat_landscape()
-        prioritized = self.prioritize_threats()
-        human_risks = self.analyze_human_risk_factors()
-        recommendations = self.generate_recommendations(prioritized, human_risks)
+        # Single-pass summaries: bucket stats cover the full dataset, only the
+        # top-K records are kept (no sorted copy of the whole dataset).
+        priorities = self.summarize_priorities(top_k=10)
+        human = self.summarize_human_risks(top_k=5)
+        # generate_recommendations only needs to know whether any threat reached
+        # the Immediate Response threshold / any human risk exists; the top-K
+        # lists answer both.
+        recommendations = self.generate_recommendations(priorities["top"], human["top"])
 
         report = {
             "generated_at": datetime.now().isoformat(),
             "total_indicators": len(self.data),
-            "top_10_prioritized_threats": prioritized[:10],
-            "top_5_human_targeting_threats": human_risks[:5],
+            "priority_buckets": priorities["summary"].buckets(),
+            "top_10_prioritized_threats": priorities["top"],
+            "total_human_targeting_threats": human["total"],
+            "top_5_human_targeting_threats": human["top"],
+            "human_risk_term_hits": dict(human["term_hits"].most_common()),
             "recommendations": recommendations,
         }
 
@@ -277,7 +414,17 @@ class CTIRiskAnalyzer:
 
 
 def main():
-    analyzer = CTIRiskAnalyzer("output/master_cti_dataset.json")
+    if "--store" in sys.argv[1:]:
+        analyzer = CTIRiskAnalyzer.from_store("output/indicator_store.db")
+    else:
+        analyzer = CTIRiskAnalyzer("output/master_cti_dataset.json")
+
+    # Optional: --terms <file> adds phishing lure terms from internal threat intel
+    if "--terms" in sys.argv[1:]:
+        idx = sys.argv.index("--terms")
+        if idx + 1 < len(sys.argv):
+            count = analyzer.load_term_list(sys.argv[idx + 1])
+            print(f"Loaded social engineering terms: {count} active")
 
     # Run all analysis methods and generate final report
     analyzer.generate_report("output/risk_assessment_report.json")
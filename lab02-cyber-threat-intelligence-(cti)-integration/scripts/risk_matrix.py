@@ -19,9 +19,14 @@ def create_risk_matrix():
     with open("output/risk_assessment_report.json", "r", encoding="utf-8") as f:
         report = json.load(f)
 
+    # Reports from summarize_priorities carry bucket stats for the full dataset.
+    buckets = report.get("priority_buckets")
+    if buckets:
+        write_risk_matrix_from_buckets(buckets)
+        return
+
+    # Older reports only include the Top 10; categorize those as before.
     threats = report.get("top_10_prioritized_threats", [])
-    # NOTE: Top 10 only included in report. For full dataset prioritization matrix,
-    # re-run scoring on master dataset. But lab asked from report; keeping as-is.
 
     categories = {
         "Critical (12-15)": [],
@@ -81,5 +86,26 @@ def create_risk_matrix():
     print(f"Risk matrix saved to: {output_file}")
 
 
+def write_risk_matrix_from_buckets(buckets, output_file: str = "output/risk_matrix.csv") -> None:
+    """Write the risk matrix CSV from precomputed full-dataset bucket statistics."""
+    headers = ["Risk_Category", "Count", "Indicator_Types", "Avg_Score", "Primary_Action", "Timeline"]
+
+    with open(output_file, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(headers)
+
+        for cat, stats in buckets.items():
+            writer.writerow([
+                cat,
+                stats.get("count", 0),
+                ", ".join(stats.get("indicator_types", [])),
+                f"{float(stats.get('avg_score', 0)):.2f}",
+                stats.get("primary_action", ""),
+                stats.get("timeline", "")
+            ])
+
+    print(f"Risk matrix saved to: {output_file}")
+
+
 if __name__ == "__main__":
     create_risk_matrix()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+import json
+import re
+from typing import List, Dict, Iterable, Set
+
+
+class TermMatcher:
+    """
+    Precompiled multi-term substring matcher.
+
+    All terms are compiled into one case-insensitive alternation regex, so a
+    text is scanned once regardless of how many terms are loaded. Matching
+    follows `term in text.lower()` semantics and reports every term that
+    occurs, including terms nested inside longer ones (e.g. "pay" in "paypal").
+    """
+
+    def __init__(self, terms: Iterable[str]):
+        self.terms: List[str] = sorted({t.strip().lower() for t in terms if t and t.strip()})
+
+        # Longest first, so at each position the regex reports the longest term
+        # starting there; shorter terms nested in it are recovered via _contained.
+        ordered = sorted(self.terms, key=len, reverse=True)
+        self._contained: Dict[str, List[str]] = {t: [u for u in self.terms if u in t] for t in self.terms}
+        self._pattern = (
+            re.compile("(?=(" + "|".join(re.escape(t) for t in ordered) + "))", re.IGNORECASE)
+            if self.terms
+            else None
+        )
+
+    def search(self, *texts: str) -> bool:
+        """Return True if any term occurs in any of the texts."""
+        if self._pattern is None:
+            return False
+        return any(text and self._pattern.search(text) for text in texts)
+
+    def find(self, *texts: str) -> Set[str]:
+        """Return every term that occurs in any of the texts."""
+        found: Set[str] = set()
+        if self._pattern is None:
+            return found
+        for text in texts:
+            if not text:
+                continue
+            for m in self._pattern.finditer(text):
+                longest = m.group(1).lower()
+                if longest not in found:
+                    found.update(self._contained.get(longest, (longest,)))
+        return found
+
+
+def load_terms(path: str) -> List[str]:
+    """
+    Load a term list from a file.
+
+    - .json: a list of strings, or an object mapping names to lists of strings
+    - anything else: one term per line, blank lines and '#' comments ignored
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        if path.lower().endswith(".json"):
+            data = json.load(f)
+            if isinstance(data, dict):
+                return [str(t) for values in data.values() for t in values]
+            return [str(t) for t in data]
+
+        terms = []
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                terms.append(line)
+        return terms
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Tests for columnar CTI priority scoring (vectorized_scoring.py)
+"""
+
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from risk_analyzer import CTIRiskAnalyzer
+from vectorized_scoring import parse_timestamps
+
+
+def _pass(msg: str):
+    print(f"[PASS] {msg}")
+
+
+def _fail(msg: str):
+    print(f"[FAIL] {msg}")
+
+
+def _assert_true(condition: bool, msg: str):
+    if condition:
+        _pass(msg)
+        return True
+    _fail(msg)
+    return False
+
+
+def _mixed_records(now: datetime):
+    """Indicators with missing fields, naive/aware timestamps and unknown types"""
+    recent = now - timedelta(days=1)
+    old = now - timedelta(days=30)
+    return [
+        {"type": "URL", "threat_level": "High", "source": "OSINT", "timestamp": recent.strftime("%Y-%m-%d %H:%M:%S")},
+        {"type": "domain", "threat_level": "Critical", "timestamp": recent.strftime("%Y-%m-%d")},
+        {"type": "ip", "source": "Unknown Feed", "timestamp": recent.strftime("%Y-%m-%dT%H:%M:%S")},
+        {"type": "hash", "threat_level": "Medium", "timestamp": old.strftime("%Y-%m-%d %H:%M:%S")},
+        {"type": "IPv6", "threat_level": "Low", "timestamp": f" {recent.strftime('%Y-%m-%d')} "},
+        {"type": "email", "threat_level": "Severe", "source": "OSINT"},
+        {"type": None, "threat_level": None, "source": None, "timestamp": None},
+        {"threat_level": "High", "timestamp": recent.strftime("%Y-%m-%dT%H:%M:%S") + "+00:00"},
+        {"type": "url", "threat_level": "High", "timestamp": recent.strftime("%Y-%m-%dT%H:%M:%SZ")},
+        {"type": "domain", "timestamp": "not a date"},
+        {"type": "registry_key", "threat_level": "Medium", "source": "OSINT", "timestamp": ""},
+        {},
+    ]
+
+
+def test_vectorized_matches_scalar():
+    """score_frame and prioritize_threats(vectorized=True) match the per-record scorer"""
+    print("=== Testing Vectorized vs Scalar Scoring ===\n")
+
+    now = datetime(2026, 1, 10, 12, 0, 0)
+    records = _mixed_records(now)
+    analyzer = CTIRiskAnalyzer(records=records)
+    analyzer.trusted_sources = set(analyzer.trusted_sources) | {"OSINT"}
+
+    scored = analyzer.score_frame(now=now)
+    expected = [analyzer._enrich_priority(r, analyzer.calculate_priority_score(r, now=now)) for r in records]
+    columns = ["priority_score", "recommended_action", "response_timeline"]
+    actual = [dict(zip(columns, row)) for row in scored[columns].itertuples(index=False, name=None)]
+    ok1 = _assert_true(actual == [{c: e[c] for c in columns} for e in expected],
+                       "score_frame scores, actions and timelines match calculate_priority_score")
+
+    # prioritize_threats() reads the clock itself; the fixtures sit well clear of the 7-day cutoff
+    analyzer = CTIRiskAnalyzer(records=_mixed_records(datetime.now()))
+    scalar = analyzer.prioritize_threats()
+    vectorized = analyzer.prioritize_threats(vectorized=True)
+    ok2 = _assert_true(vectorized == scalar, "prioritize_threats(vectorized=True) returns the scalar result")
+
+    print("\n=== Vectorized vs Scalar Test Complete ===\n")
+    return ok1 and ok2
+
+
+def test_out_of_range_timestamps():
+    """Timestamps outside pandas' nanosecond range score like the scalar path"""
+    print("=== Testing Out-of-Range Timestamps ===\n")
+
+    parsed = parse_timestamps(pd.Series(["9999-12-31", "1500-01-01 00:00:00", "2026-01-02T03:04:05", "bad", ""]))
+    ok1 = _assert_true(parsed[0] == datetime(9999, 12, 31), "Far-future date parsed")
+    ok2 = _assert_true(parsed[1] == datetime(1500, 1, 1), "Far-past date parsed")
+    ok3 = _assert_true(parsed[2] == datetime(2026, 1, 2, 3, 4, 5), "In-range ISO date parsed")
+    ok4 = _assert_true(pd.isna(parsed[3]) and pd.isna(parsed[4]), "Invalid and blank values stay NaT")
+
+    now = datetime(2026, 1, 10)
+    records = [
+        {"type": "url", "threat_level": "High", "source": "OSINT", "timestamp": "9999-12-31"},
+        {"type": "ip", "threat_level": "Low", "source": "OSINT", "timestamp": "1500-01-01 00:00:00"},
+        {"type": "hash", "threat_level": "Medium", "source": "OSINT", "timestamp": "2026-01-08"},
+    ]
+    analyzer = CTIRiskAnalyzer(records=records)
+    scored = analyzer.score_frame(now=now)
+    expected = [analyzer.calculate_priority_score(r, now=now) for r in records]
+    ok5 = _assert_true(scored["priority_score"].tolist() == expected,
+                       "Frame scores match calculate_priority_score for out-of-range timestamps")
+
+    print("\n=== Out-of-Range Timestamp Test Complete ===\n")
+    return ok1 and ok2 and ok3 and ok4 and ok5
+
+
+if __name__ == "__main__":
+    ok_a = test_vectorized_matches_scalar()
+    ok_b = test_out_of_range_timestamps()
+
+    print("\n=== All Tests Complete ===")
+    print(f"Overall Result: {'PASS' if ok_a and ok_b else 'FAIL'}")
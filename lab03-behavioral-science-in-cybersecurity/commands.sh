@@ -51,3 +51,6 @@ ls -lh org_risk_report.json
 
 # Validate JSON format
 python3 -m json.tool org_risk_report.json > /dev/null && echo "JSON valid"
+
+# Run organizational assessment over employee profiles (CSV or SQLite)
+python3 org_assessment.py employee_profiles.csv --chunk-size 50000
@@ -5,8 +5,72 @@ Students: Complete the TODO sections to implement the model
 """
 
 import json
+import math
 import datetime
-from typing import Dict, List, Any
+from collections import deque
+from typing import Dict, List, Any, Deque, Iterator, Optional
+
+
+# Deficiency bits: a component below 5 sets its bit
+DEFICIENCY_BITS = {"motivation": 1, "ability": 2, "trigger": 4}
+
+COMPONENT_RECOMMENDATIONS = {
+    "motivation": [
+        "Increase motivation via targeted security awareness campaigns and real incident examples.",
+        "Share success stories and measurable impact of secure behaviors to build personal relevance.",
+        "Implement recognition or reward programs for consistent secure behavior (positive reinforcement).",
+    ],
+    "ability": [
+        "Improve ability through hands-on training and short practical exercises.",
+        "Provide simplified tools (password managers, MFA apps) and step-by-step documentation.",
+        "Reduce friction: standardize secure configurations and automate difficult security tasks where possible.",
+    ],
+    "trigger": [
+        "Strengthen triggers with automated reminders (email prompts, in-app alerts, scheduled nudges).",
+        "Add environmental cues: posters, login banners, browser warnings, and security prompts at decision points.",
+        "Use regular check-ins: team huddles, security champions, and periodic simulations to reinforce behavior.",
+    ],
+}
+
+MAINTAIN_RECOMMENDATION = (
+    "Current Motivation, Ability, and Trigger levels are strong. Maintain with periodic refreshers and monitoring."
+)
+
+
+def deficiency_mask(motivation: float, ability: float, trigger: float) -> int:
+    """3-bit mask of the components below 5 (see DEFICIENCY_BITS)"""
+    mask = 0
+    if motivation < 5:
+        mask |= DEFICIENCY_BITS["motivation"]
+    if ability < 5:
+        mask |= DEFICIENCY_BITS["ability"]
+    if trigger < 5:
+        mask |= DEFICIENCY_BITS["trigger"]
+    return mask
+
+
+def _build_recommendation_table() -> List[List[str]]:
+    table: List[List[str]] = []
+    for mask in range(8):
+        recommendations = [
+            rec
+            for component, bit in DEFICIENCY_BITS.items()
+            if mask & bit
+            for rec in COMPONENT_RECOMMENDATIONS[component]
+        ]
+        table.append(recommendations or [MAINTAIN_RECOMMENDATION])
+    return table
+
+
+# One shared recommendation list per deficiency mask, indexed by mask
+RECOMMENDATION_TABLE = _build_recommendation_table()
+
+
+def _round2(values):
+    """Round each element with Python's round(x, 2), as calculate_behavior_score() does."""
+    import numpy as np
+
+    return np.array([round(v, 2) for v in values.ravel().tolist()], dtype=float).reshape(values.shape)
 
 
 class FoggBehaviorModel:
@@ -14,8 +78,31 @@ class FoggBehaviorModel:
     Implementation of B.J. Fogg's Behavior Model for cybersecurity contexts
     """
 
-    def __init__(self):
-        self.behavior_history: List[Dict[str, Any]] = []
+    def __init__(self, history_limit: Optional[int] = None, spill_path: Optional[str] = None):
+        """
+        Args:
+            history_limit: Keep at most this many raw assessments in memory
+                           (ring buffer, must be >= 1); None keeps all of them
+            spill_path: JSONL file that receives assessments evicted from the
+                        ring buffer, so export_data still writes the full history
+
+        behavior_history is a deque, not a list: it supports len(), iteration
+        and indexing but not slicing; use recent_history(n) for a list.
+        """
+        if history_limit is not None and history_limit < 1:
+            raise ValueError(f"history_limit must be at least 1 (or None), got {history_limit}")
+
+        self.behavior_history: Deque[Dict[str, Any]] = deque(maxlen=history_limit)
+        self.spill_path = spill_path
+        self._spill_file = None
+        self._spilled = 0
+
+        # Running aggregates for get_behavior_trends
+        self._count = 0
+        self._sums = {"motivation": 0.0, "ability": 0.0, "trigger": 0.0, "behavior_score": 0.0}
+        self._risk_counts = {"High": 0, "Medium": 0, "Low": 0}
+        self._score_mean = 0.0
+        self._score_m2 = 0.0
 
     def calculate_behavior_score(self, motivation: float, ability: float, trigger: float) -> float:
         """
@@ -92,104 +179,208 @@ class FoggBehaviorModel:
             "recommendations": recommendations,
         }
 
-        self.behavior_history.append(assessment)
+        self._record(assessment)
         return assessment
 
+    def _record(self, assessment: Dict[str, Any]) -> None:
+        """Update running aggregates and store the raw assessment"""
+        scores = assessment["scores"]
+        self._count += 1
+        for key in self._sums:
+            self._sums[key] += scores[key]
+
+        risk_level = assessment.get("risk_level", "Medium")
+        self._risk_counts[risk_level if risk_level in ("High", "Low") else "Medium"] += 1
+
+        # Welford's online variance for the behavior score
+        delta = scores["behavior_score"] - self._score_mean
+        self._score_mean += delta / self._count
+        self._score_m2 += delta * (scores["behavior_score"] - self._score_mean)
+
+        history = self.behavior_history
+        if history.maxlen is not None and len(history) == history.maxlen and self.spill_path:
+            if self._spill_file is None:
+                # Start a fresh spill file per model, append after close()
+                self._spill_file = open(self.spill_path, "a" if self._spilled else "w", encoding="utf-8")
+            self._spill_file.write(json.dumps(history[0]) + "\n")
+            self._spilled += 1
+        history.append(assessment)
+
     def _generate_recommendations(self, motivation: float, ability: float, trigger: float) -> List[str]:
         """
         Generate recommendations based on Fogg model component scores
+
+        Returns the shared list for the component deficiency pattern from
+        RECOMMENDATION_TABLE (do not mutate it).
         """
 
-        recommendations: List[str] = []
-
-        if motivation < 5:
-            recommendations.append(
-                "Increase motivation via targeted security awareness campaigns and real incident examples."
-            )
-            recommendations.append(
-                "Share success stories and measurable impact of secure behaviors to build personal relevance."
-            )
-            recommendations.append(
-                "Implement recognition or reward programs for consistent secure behavior (positive reinforcement)."
-            )
-
-        if ability < 5:
-            recommendations.append(
-                "Improve ability through hands-on training and short practical exercises."
-            )
-            recommendations.append(
-                "Provide simplified tools (password managers, MFA apps) and step-by-step documentation."
-            )
-            recommendations.append(
-                "Reduce friction: standardize secure configurations and automate difficult security tasks where possible."
-            )
-
-        if trigger < 5:
-            recommendations.append(
-                "Strengthen triggers with automated reminders (email prompts, in-app alerts, scheduled nudges)."
-            )
-            recommendations.append(
-                "Add environmental cues: posters, login banners, browser warnings, and security prompts at decision points."
-            )
-            recommendations.append(
-                "Use regular check-ins: team huddles, security champions, and periodic simulations to reinforce behavior."
-            )
-
-        if not recommendations:
-            recommendations.append(
-                "Current Motivation, Ability, and Trigger levels are strong. Maintain with periodic refreshers and monitoring."
-            )
-
-        return recommendations
+        return RECOMMENDATION_TABLE[deficiency_mask(motivation, ability, trigger)]
+
+    def assess_batch(self, profiles: Any, as_frame: bool = False) -> Any:
+        """
+        Assess many (motivation, ability, trigger) profiles in one NumPy pass
+
+        Args:
+            profiles: (N, 3) array-like of M/A/T values, a list of profile dicts,
+                      or a DataFrame with 'motivation', 'ability', 'trigger' columns
+                      (missing dict keys default to 5, as in assess_cybersecurity_behavior)
+            as_frame: Return a pandas DataFrame instead of a NumPy structured array
+
+        Returns:
+            Structured array / DataFrame with motivation, ability, trigger,
+            behavior_score, likelihood, risk_level and deficiency_mask columns.
+            Scores and levels match assess_cybersecurity_behavior. Batch results
+            are not added to behavior_history; use recommendations_by_pattern()
+            to build recommendations on request.
+        """
+        import numpy as np
+
+        mat = self._profiles_to_array(profiles)
+
+        # Clamp to 0-10, normalize, multiply: same operation order as calculate_behavior_score
+        normalized = np.clip(mat, 0.0, 10.0) / 10.0
+        scores = _round2((normalized[:, 0] * normalized[:, 1] * normalized[:, 2]) * 100.0)
+
+        likelihood = np.select([scores >= 70, scores >= 40], ["High", "Medium"], default="Low")
+        risk_level = np.select([scores >= 70, scores >= 40], ["Low", "Medium"], default="High")
+
+        deficient = mat < 5
+        mask = (
+            deficient[:, 0] * DEFICIENCY_BITS["motivation"]
+            + deficient[:, 1] * DEFICIENCY_BITS["ability"]
+            + deficient[:, 2] * DEFICIENCY_BITS["trigger"]
+        ).astype(np.uint8)
+
+        result = np.empty(
+            len(mat),
+            dtype=[
+                ("motivation", "f8"),
+                ("ability", "f8"),
+                ("trigger", "f8"),
+                ("behavior_score", "f8"),
+                ("likelihood", "U6"),
+                ("risk_level", "U6"),
+                ("deficiency_mask", "u1"),
+            ],
+        )
+        rounded = _round2(mat)
+        result["motivation"] = rounded[:, 0]
+        result["ability"] = rounded[:, 1]
+        result["trigger"] = rounded[:, 2]
+        result["behavior_score"] = scores
+        result["likelihood"] = likelihood
+        result["risk_level"] = risk_level
+        result["deficiency_mask"] = mask
+
+        if as_frame:
+            import pandas as pd
+
+            return pd.DataFrame(result)
+        return result
+
+    def _profiles_to_array(self, profiles: Any):
+        import numpy as np
+
+        columns = ["motivation", "ability", "trigger"]
+        if hasattr(profiles, "columns"):
+            return profiles[columns].to_numpy(dtype=float)
+        if isinstance(profiles, (list, tuple)) and profiles and isinstance(profiles[0], dict):
+            return np.array([[float(p.get(c, 5)) for c in columns] for p in profiles], dtype=float)
+
+        mat = np.asarray(profiles, dtype=float)
+        if mat.size == 0:
+            return mat.reshape(0, 3)
+        if mat.ndim != 2 or mat.shape[1] != 3:
+            raise ValueError("profiles must have shape (N, 3): motivation, ability, trigger")
+        return mat
+
+    def describe_deficiency(self, mask: int) -> str:
+        """Readable label for a deficiency mask, e.g. 'motivation+trigger' or 'none'"""
+        names = [name for name, bit in DEFICIENCY_BITS.items() if mask & bit]
+        return "+".join(names) if names else "none"
+
+    def recommendations_by_pattern(self, batch: Any) -> Dict[str, Dict[str, Any]]:
+        """
+        Group a batch result by deficiency pattern, with the shared
+        recommendation list for each pattern
+
+        Returns:
+            {pattern label: {"deficiency_mask", "count", "recommendations"}}
+        """
+        import numpy as np
+
+        masks = np.asarray(batch["deficiency_mask"], dtype=np.uint8)
+        values, counts = np.unique(masks, return_counts=True)
+
+        grouped: Dict[str, Dict[str, Any]] = {}
+        for mask, count in zip(values.tolist(), counts.tolist()):
+            grouped[self.describe_deficiency(mask)] = {
+                "deficiency_mask": mask,
+                "count": count,
+                "recommendations": RECOMMENDATION_TABLE[mask],
+            }
+        return grouped
 
     def get_behavior_trends(self) -> Dict:
         """
         Analyze trends in behavior assessments over time
         """
 
-        if not self.behavior_history:
+        if not self._count:
             return {"message": "No behavior data available"}
 
-        total = len(self.behavior_history)
-
-        avg_m = sum(item["scores"]["motivation"] for item in self.behavior_history) / total
-        avg_a = sum(item["scores"]["ability"] for item in self.behavior_history) / total
-        avg_t = sum(item["scores"]["trigger"] for item in self.behavior_history) / total
-        avg_b = sum(item["scores"]["behavior_score"] for item in self.behavior_history) / total
-
-        risk_distribution = {"High": 0, "Medium": 0, "Low": 0}
-        for item in self.behavior_history:
-            rl = item.get("risk_level", "Medium")
-            if rl == "High":
-                risk_distribution["High"] += 1
-            elif rl == "Low":
-                risk_distribution["Low"] += 1
-            else:
-                risk_distribution["Medium"] += 1
+        total = self._count
+        variance = self._score_m2 / (total - 1) if total > 1 else 0.0
 
         return {
             "total_assessments": total,
-            "averages": {
-                "motivation": round(avg_m, 2),
-                "ability": round(avg_a, 2),
-                "trigger": round(avg_t, 2),
-                "behavior_score": round(avg_b, 2),
-            },
-            "risk_distribution": risk_distribution,
+            "averages": {key: round(value / total, 2) for key, value in self._sums.items()},
+            "behavior_score_std_dev": round(math.sqrt(variance), 2),
+            "risk_distribution": dict(self._risk_counts),
         }
 
+    def recent_history(self, n: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Return the last n in-memory assessments (all of them if n is None) as a list"""
+        history = list(self.behavior_history)
+        return history if n is None else history[max(0, len(history) - n):]
+
+    def iter_history(self) -> Iterator[Dict[str, Any]]:
+        """Yield every retained assessment, spilled ones first (oldest to newest)"""
+        if self._spill_file is not None:
+            self._spill_file.flush()
+        if self._spilled:
+            with open(self.spill_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    yield json.loads(line)
+        yield from list(self.behavior_history)
+
     def export_data(self, filename: str) -> bool:
         """
         Export behavior history to JSON file
+
+        The history is streamed one assessment at a time, so spilled
+        history is never loaded into memory as a whole.
         """
 
         try:
             with open(filename, "w", encoding="utf-8") as f:
-                json.dump(self.behavior_history, f, indent=2)
+                f.write("[")
+                first = True
+                for item in self.iter_history():
+                    f.write("\n  " if first else ",\n  ")
+                    f.write(json.dumps(item, indent=2).replace("\n", "\n  "))
+                    first = False
+                f.write("\n]" if not first else "]")
             return True
         except Exception:
             return False
 
+    def close(self) -> None:
+        """Close the spill file, if one was opened"""
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+
 
 # Test your implementation
 if __name__ == "__main__":
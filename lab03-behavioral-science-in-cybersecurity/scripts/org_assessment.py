@@ -8,11 +8,22 @@ Uses:
 Outputs:
 - A formatted text report to stdout
 - A JSON report file: org_risk_report.json
+
+Usage:
+    python3 org_assessment.py                          (built-in department profiles)
+    python3 org_assessment.py profiles.csv [--chunk-size N]
+    python3 org_assessment.py profiles.db [--table NAME] [--chunk-size N]
+
+Profile files hold one row per employee with department, motivation,
+ability and trigger columns (employee_id and other columns are ignored).
 """
 
+import os
+import sys
 import json
+import sqlite3
 import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Iterator, Optional, Tuple
 
 from fogg_model import FoggBehaviorModel
 from risk_prioritization import CybersecurityRiskPrioritizer
@@ -115,6 +126,134 @@ def assess_department_behaviors(
     return dept_results
 
 
+PROFILE_COLUMNS = ["department", "motivation", "ability", "trigger"]
+DEFAULT_CHUNK_SIZE = 50_000
+DEFAULT_PROFILE_TABLE = "employee_profiles"
+
+
+def iter_profile_chunks(
+    source: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    table: str = DEFAULT_PROFILE_TABLE,
+) -> Iterator[Any]:
+    """
+    Stream employee M/A/T profiles from a CSV file or SQLite database
+    as DataFrames of at most chunk_size rows.
+
+    Missing M/A/T values default to 5, as in assess_cybersecurity_behavior.
+    """
+    import pandas as pd
+
+    if source.lower().endswith((".db", ".sqlite", ".sqlite3")):
+        conn = sqlite3.connect(source)
+        try:
+            query = f'SELECT {", ".join(PROFILE_COLUMNS)} FROM "{table}"'
+            for chunk in pd.read_sql_query(query, conn, chunksize=chunk_size):
+                yield chunk.fillna({"motivation": 5, "ability": 5, "trigger": 5})
+        finally:
+            conn.close()
+    else:
+        for chunk in pd.read_csv(source, usecols=PROFILE_COLUMNS, chunksize=chunk_size):
+            yield chunk.fillna({"motivation": 5, "ability": 5, "trigger": 5})
+
+
+def aggregate_department_profiles(
+    fogg: FoggBehaviorModel,
+    chunks: Iterator[Any],
+) -> Any:
+    """
+    Score profile chunks with the batch engine and accumulate per-department
+    totals, so memory stays bounded by the chunk size.
+
+    Returns:
+        DataFrame indexed by department with count, M/A/T/behavior score sums
+        and per risk level counts
+    """
+    import pandas as pd
+
+    totals: Optional[pd.DataFrame] = None
+    for chunk in chunks:
+        batch = fogg.assess_batch(chunk[["motivation", "ability", "trigger"]].to_numpy(dtype=float))
+        scored = pd.DataFrame({
+            "department": chunk["department"].fillna("Unknown").astype(str).to_numpy(),
+            "motivation": batch["motivation"],
+            "ability": batch["ability"],
+            "trigger": batch["trigger"],
+            "behavior_score": batch["behavior_score"],
+            "high_risk": batch["risk_level"] == "High",
+            "medium_risk": batch["risk_level"] == "Medium",
+            "low_risk": batch["risk_level"] == "Low",
+        })
+        grouped = scored.groupby("department", sort=False).agg(
+            count=("behavior_score", "size"),
+            motivation=("motivation", "sum"),
+            ability=("ability", "sum"),
+            trigger=("trigger", "sum"),
+            behavior_score=("behavior_score", "sum"),
+            high_risk=("high_risk", "sum"),
+            medium_risk=("medium_risk", "sum"),
+            low_risk=("low_risk", "sum"),
+        )
+        totals = grouped if totals is None else totals.add(grouped, fill_value=0)
+
+    if totals is None:
+        return pd.DataFrame(columns=["count", "motivation", "ability", "trigger", "behavior_score",
+                                     "high_risk", "medium_risk", "low_risk"])
+    return totals
+
+
+def summarize_department_totals(totals: Any) -> Dict[str, Any]:
+    """
+    Turn per-department totals into the same summary layout as
+    assess_department_behaviors, plus the per-level risk distribution
+    and the unrounded means used for risk prioritization.
+    """
+
+    dept_results: Dict[str, Any] = {}
+
+    for dept, row in totals.iterrows():
+        total = int(row["count"])
+        means = {
+            key: float(row[key]) / total if total else 0.0
+            for key in ("motivation", "ability", "trigger", "behavior_score")
+        }
+
+        if means["behavior_score"] >= 70:
+            dept_risk = "Low"
+        elif means["behavior_score"] >= 40:
+            dept_risk = "Medium"
+        else:
+            dept_risk = "High"
+
+        dept_results[str(dept)] = {
+            "assessment_count": total,
+            "averages": {key: round(value, 2) for key, value in means.items()},
+            "behavioral_risk": dept_risk,
+            "risk_distribution": {
+                "High": int(row["high_risk"]),
+                "Medium": int(row["medium_risk"]),
+                "Low": int(row["low_risk"]),
+            },
+            "behavior_summary": {"count": total, "averages": means},
+        }
+
+    return dept_results
+
+
+def assess_org_profiles(
+    fogg: FoggBehaviorModel,
+    source: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    table: str = DEFAULT_PROFILE_TABLE,
+) -> Dict[str, Any]:
+    """
+    Assess every employee profile in a CSV/SQLite source, per department
+    """
+
+    totals = aggregate_department_profiles(fogg, iter_profile_chunks(source, chunk_size, table))
+    return summarize_department_totals(totals)
+
+
 def generate_department_recommendations(
     dept_name: str,
     dept_summary: Dict[str, Any]
@@ -151,6 +290,23 @@ def generate_department_recommendations(
     return recs
 
 
+def department_risk_factors(risk: Dict[str, Any], dept: str) -> Tuple[float, float]:
+    """
+    Department-adjusted (impact, frequency) for a common risk: high-value
+    departments get +0.5 impact, high-exposure departments +0.5 frequency.
+    """
+
+    impact = float(risk["impact_score"])
+    if dept in ["Executives", "Finance"]:
+        impact = min(10.0, impact + 0.5)
+
+    frequency = float(risk["threat_frequency"])
+    if dept in ["Marketing", "HR"]:
+        frequency = min(10.0, frequency + 0.5)
+
+    return impact, frequency
+
+
 def build_org_risk_prioritization(
     prioritizer: CybersecurityRiskPrioritizer,
     departments: Dict[str, List[Dict[str, float]]]
@@ -164,13 +320,7 @@ def build_org_risk_prioritization(
             scenario_id = f"{r['risk_id']}-{dept.upper()}"
             scenario_name = f"{r['risk_name']} ({dept})"
 
-            impact = float(r["impact_score"])
-            if dept in ["Executives", "Finance"]:
-                impact = min(10.0, impact + 0.5)
-
-            frequency = float(r["threat_frequency"])
-            if dept in ["Marketing", "HR"]:
-                frequency = min(10.0, frequency + 0.5)
+            impact, frequency = department_risk_factors(r, dept)
 
             prioritizer.add_risk_scenario(
                 risk_id=scenario_id,
@@ -183,6 +333,31 @@ def build_org_risk_prioritization(
     return prioritizer.prioritize_risks()
 
 
+def build_org_risk_prioritization_from_summary(
+    prioritizer: CybersecurityRiskPrioritizer,
+    dept_behavior: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    """
+    Same department scenarios as build_org_risk_prioritization, scored from
+    the aggregated department summaries produced by assess_org_profiles
+    """
+
+    for r in build_common_risks():
+        for dept, summary in dept_behavior.items():
+
+            impact, frequency = department_risk_factors(r, dept)
+
+            prioritizer.add_risk_scenario_summary(
+                risk_id=f"{r['risk_id']}-{dept.upper()}",
+                risk_name=f"{r['risk_name']} ({dept})",
+                impact_score=impact,
+                behavior_summary=summary["behavior_summary"],
+                threat_frequency=frequency,
+            )
+
+    return prioritizer.prioritize_risks(include_assessments=False)
+
+
 def format_report(
     dept_behavior: Dict[str, Any],
     dept_recs: Dict[str, List[str]],
@@ -242,20 +417,43 @@ def export_json(filename: str, payload: Dict[str, Any]) -> bool:
         return False
 
 
+def _option(args: List[str], name: str, default: str) -> str:
+    if name in args:
+        idx = args.index(name)
+        if idx + 1 < len(args):
+            return args[idx + 1]
+    return default
+
+
 def main():
 
+    args = sys.argv[1:]
+    source = args[0] if args and not args[0].startswith("--") else None
+
     fogg = FoggBehaviorModel()
     prioritizer = CybersecurityRiskPrioritizer()
 
-    departments = build_department_profiles()
-
-    dept_behavior = assess_department_behaviors(fogg, departments)
+    if source:
+        if not os.path.exists(source):
+            print(f"Profile source not found: {source}")
+            return
+        chunk_size = int(_option(args, "--chunk-size", str(DEFAULT_CHUNK_SIZE)))
+        table = _option(args, "--table", DEFAULT_PROFILE_TABLE)
+        dept_behavior = assess_org_profiles(fogg, source, chunk_size, table)
+    else:
+        departments = build_department_profiles()
+        dept_behavior = assess_department_behaviors(fogg, departments)
 
     dept_recs: Dict[str, List[str]] = {}
     for dept, summary in dept_behavior.items():
         dept_recs[dept] = generate_department_recommendations(dept, summary)
 
-    prioritized_risks = build_org_risk_prioritization(prioritizer, departments)
+    if source:
+        prioritized_risks = build_org_risk_prioritization_from_summary(prioritizer, dept_behavior)
+        for summary in dept_behavior.values():
+            summary.pop("behavior_summary", None)
+    else:
+        prioritized_risks = build_org_risk_prioritization(prioritizer, departments)
 
     report_text = format_report(dept_behavior, dept_recs, prioritized_risks)
     print(report_text)
@@ -4,9 +4,59 @@ Cybersecurity Risk Prioritization using B.J. Fogg Model
 Students: Complete the TODO sections to implement risk prioritization
 """
 
+import os
 import json
-from typing import Dict, List, Any
-from fogg_model import FoggBehaviorModel
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict, List, Any, Callable, Optional, Tuple
+from fogg_model import FoggBehaviorModel, DEFICIENCY_BITS, deficiency_mask
+
+
+RISK_COMPONENT_RECOMMENDATIONS = {
+    "motivation": "Increase motivation: run targeted awareness campaigns and leadership messaging for this risk.",
+    "ability": "Increase ability: provide hands-on training, clear SOPs, and simplify security tools/workflows.",
+    "trigger": "Increase triggers: enable reminders, banners, simulations, and just-in-time prompts for users.",
+}
+HIGH_IMPACT_RECOMMENDATION = "High impact detected: apply stronger controls, monitoring, and escalation procedures."
+HIGH_FREQUENCY_RECOMMENDATION = (
+    "High frequency detected: prioritize continuous controls and frequent user testing/simulations."
+)
+MAINTAIN_RISK_RECOMMENDATION = (
+    "Maintain current controls and perform periodic reassessment to ensure risk stays controlled."
+)
+
+
+def _build_risk_recommendation_table() -> Dict[Tuple[int, bool, bool], List[str]]:
+    table: Dict[Tuple[int, bool, bool], List[str]] = {}
+    for mask in range(8):
+        for high_impact in (False, True):
+            for high_frequency in (False, True):
+                recs = [rec for comp, rec in RISK_COMPONENT_RECOMMENDATIONS.items() if mask & DEFICIENCY_BITS[comp]]
+                if high_impact:
+                    recs.append(HIGH_IMPACT_RECOMMENDATION)
+                if high_frequency:
+                    recs.append(HIGH_FREQUENCY_RECOMMENDATION)
+                table[(mask, high_impact, high_frequency)] = recs or [MAINTAIN_RISK_RECOMMENDATION]
+    return table
+
+
+# Shared recommendation lists keyed by (deficiency mask, impact >= 8, frequency >= 8)
+RISK_RECOMMENDATION_TABLE = _build_risk_recommendation_table()
+
+
+SWEEP_CHUNK_SIZE = 50_000
+SCORE_KEYS = ("motivation", "ability", "trigger", "behavior_score")
+
+
+def _summarize_profiles(profiles: Any) -> Tuple[int, Dict[str, float]]:
+    """Sweep worker: batch-score a slice of a population, return count and score sums"""
+    batch = FoggBehaviorModel().assess_batch(profiles)
+    return len(batch), {key: float(batch[key].sum()) for key in SCORE_KEYS}
+
+
+def _assess_profiles(risk_name: str, profiles: List[Dict]) -> List[Dict[str, Any]]:
+    """Sweep worker: full per-user assessments, for sweeps that embed them"""
+    fogg = FoggBehaviorModel()
+    return [fogg.assess_cybersecurity_behavior(risk_name, profile) for profile in profiles]
 
 
 class CybersecurityRiskPrioritizer:
@@ -46,6 +96,127 @@ class CybersecurityRiskPrioritizer:
 
         self.risk_database.append(risk_scenario)
 
+    def add_risk_scenario_summary(
+        self,
+        risk_id: str,
+        risk_name: str,
+        impact_score: float,
+        behavior_summary: Dict[str, Any],
+        threat_frequency: float,
+    ) -> None:
+        """
+        Add a risk scenario from already aggregated behavior scores
+
+        Args:
+            behavior_summary: {"count": users assessed, "averages": mean
+                              motivation/ability/trigger/behavior_score}
+        """
+
+        self.risk_database.append({
+            "risk_id": risk_id,
+            "risk_name": risk_name,
+            "impact_score": float(impact_score),
+            "threat_frequency": float(threat_frequency),
+            "behavior_summary": behavior_summary,
+        })
+
+    def sweep_risk_scenarios(
+        self,
+        risks: List[Dict[str, Any]],
+        populations: Dict[str, Any],
+        max_workers: Optional[int] = None,
+        include_assessments: bool = False,
+        adjust: Optional[Callable[[Dict[str, Any], str], Tuple[float, float]]] = None,
+        chunk_size: int = SWEEP_CHUNK_SIZE,
+    ) -> List[Dict]:
+        """
+        Evaluate every risk against every profile population in a process pool
+
+        Each population is batch-scored once (split into chunk_size slices
+        across workers) and the resulting behavior summary is shared by all
+        risks, so N risks x M populations cost M scoring passes.
+
+        Args:
+            risks: Dicts with risk_id, risk_name, impact_score, threat_frequency
+            populations: {population name: profiles (list of dicts, (N, 3) array or DataFrame)}
+            max_workers: Pool size (None = os.cpu_count())
+            include_assessments: Also run and embed per-user assessments
+                                 (profiles must be lists of dicts)
+            adjust: Optional fn(risk, population name) -> (impact, frequency)
+            chunk_size: Profiles per scoring task
+
+        Returns:
+            Prioritized risks (see prioritize_risks); scenario ids/names are
+            "<risk_id>-<POPULATION>" / "<risk_name> (<population>)"
+        """
+
+        workers = max_workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            summary_futures: Dict[str, List[Future]] = {
+                name: [
+                    pool.submit(_summarize_profiles, profiles[start:start + chunk_size])
+                    for start in range(0, len(profiles), chunk_size)
+                ]
+                for name, profiles in populations.items()
+            }
+
+            assessment_futures: Dict[Tuple[int, str], Future] = {}
+            if include_assessments:
+                for idx, risk in enumerate(risks):
+                    for name, profiles in populations.items():
+                        scenario_name = f"{risk['risk_name']} ({name})"
+                        assessment_futures[(idx, name)] = pool.submit(_assess_profiles, scenario_name, list(profiles))
+
+            summaries: Dict[str, Dict[str, Any]] = {}
+            for name, futures in summary_futures.items():
+                count = 0
+                sums = {key: 0.0 for key in SCORE_KEYS}
+                for future in futures:
+                    chunk_count, chunk_sums = future.result()
+                    count += chunk_count
+                    for key in SCORE_KEYS:
+                        sums[key] += chunk_sums[key]
+                summaries[name] = {
+                    "count": count,
+                    "averages": {key: (sums[key] / count if count else 0.0) for key in SCORE_KEYS},
+                }
+
+            for idx, risk in enumerate(risks):
+                for name in populations:
+                    if adjust is not None:
+                        impact, frequency = adjust(risk, name)
+                    else:
+                        impact, frequency = risk["impact_score"], risk["threat_frequency"]
+
+                    self.add_risk_scenario_summary(
+                        risk_id=f"{risk['risk_id']}-{name.upper()}",
+                        risk_name=f"{risk['risk_name']} ({name})",
+                        impact_score=impact,
+                        behavior_summary=summaries[name],
+                        threat_frequency=frequency,
+                    )
+                    if include_assessments:
+                        self.risk_database[-1]["behavioral_assessments"] = assessment_futures[(idx, name)].result()
+
+        return self.prioritize_risks(include_assessments=include_assessments)
+
+    def _behavior_averages(self, risk_scenario: Dict) -> Dict[str, float]:
+        """Mean M/A/T/behavior score for a scenario (all 0.0 if nothing assessed)"""
+
+        summary = risk_scenario.get("behavior_summary")
+        if summary is not None:
+            if summary.get("count"):
+                return summary["averages"]
+            return {"motivation": 0.0, "ability": 0.0, "trigger": 0.0, "behavior_score": 0.0}
+
+        assessments = risk_scenario.get("behavioral_assessments", [])
+        if not assessments:
+            return {"motivation": 0.0, "ability": 0.0, "trigger": 0.0, "behavior_score": 0.0}
+        return {
+            key: sum(a["scores"][key] for a in assessments) / len(assessments)
+            for key in ("motivation", "ability", "trigger", "behavior_score")
+        }
+
     def calculate_risk_priority_score(self, risk_scenario: Dict) -> float:
         """
         Formula:
@@ -56,13 +227,7 @@ class CybersecurityRiskPrioritizer:
         impact = float(risk_scenario.get("impact_score", 0))
         frequency = float(risk_scenario.get("threat_frequency", 0))
 
-        assessments = risk_scenario.get("behavioral_assessments", [])
-        if assessments:
-            avg_behavior_score = (
-                sum(a["scores"]["behavior_score"] for a in assessments) / len(assessments)
-            )
-        else:
-            avg_behavior_score = 0.0
+        avg_behavior_score = self._behavior_averages(risk_scenario)["behavior_score"]
 
         behavioral_risk_factor = 100.0 - avg_behavior_score
         if behavioral_risk_factor < 0:
@@ -72,15 +237,20 @@ class CybersecurityRiskPrioritizer:
 
         return round(priority_score, 2)
 
-    def prioritize_risks(self) -> List[Dict]:
+    def prioritize_risks(self, include_assessments: bool = True) -> List[Dict]:
         """
         Prioritize all risks in the database
+
+        Args:
+            include_assessments: Embed each scenario's per-user behavioral
+                                 assessments; False keeps only the aggregates
         """
 
         self.prioritized_risks = []
 
         for risk in self.risk_database:
             score = self.calculate_risk_priority_score(risk)
+            mean_behavior_score = self._behavior_averages(risk)["behavior_score"]
 
             if score >= 70:
                 level = "Critical"
@@ -98,10 +268,16 @@ class CybersecurityRiskPrioritizer:
                 "threat_frequency": risk.get("threat_frequency"),
                 "priority_score": score,
                 "priority_level": level,
-                "affected_users": len(risk.get("user_profiles", [])),
-                "behavioral_assessments": risk.get("behavioral_assessments", []),
-                "recommendations": self._generate_risk_recommendations(risk),
+                "mean_behavior_score": round(mean_behavior_score, 2),
+                "affected_users": (
+                    risk["behavior_summary"].get("count", 0)
+                    if "behavior_summary" in risk
+                    else len(risk.get("user_profiles", []))
+                ),
             }
+            if include_assessments:
+                prioritized_risk["behavioral_assessments"] = risk.get("behavioral_assessments", [])
+            prioritized_risk["recommendations"] = self._generate_risk_recommendations(risk)
 
             self.prioritized_risks.append(prioritized_risk)
 
@@ -114,49 +290,17 @@ class CybersecurityRiskPrioritizer:
     def _generate_risk_recommendations(self, risk_scenario: Dict) -> List[str]:
         """
         Generate specific recommendations
-        """
 
-        recommendations: List[str] = []
+        Returns the shared list from RISK_RECOMMENDATION_TABLE (do not mutate it).
+        """
 
-        assessments = risk_scenario.get("behavioral_assessments", [])
         impact = float(risk_scenario.get("impact_score", 0))
         frequency = float(risk_scenario.get("threat_frequency", 0))
 
-        if assessments:
-            avg_m = sum(a["scores"]["motivation"] for a in assessments) / len(assessments)
-            avg_a = sum(a["scores"]["ability"] for a in assessments) / len(assessments)
-            avg_t = sum(a["scores"]["trigger"] for a in assessments) / len(assessments)
-        else:
-            avg_m, avg_a, avg_t = 0.0, 0.0, 0.0
-
-        if avg_m < 5:
-            recommendations.append(
-                "Increase motivation: run targeted awareness campaigns and leadership messaging for this risk."
-            )
-        if avg_a < 5:
-            recommendations.append(
-                "Increase ability: provide hands-on training, clear SOPs, and simplify security tools/workflows."
-            )
-        if avg_t < 5:
-            recommendations.append(
-                "Increase triggers: enable reminders, banners, simulations, and just-in-time prompts for users."
-            )
-
-        if impact >= 8:
-            recommendations.append(
-                "High impact detected: apply stronger controls, monitoring, and escalation procedures."
-            )
-        if frequency >= 8:
-            recommendations.append(
-                "High frequency detected: prioritize continuous controls and frequent user testing/simulations."
-            )
-
-        if not recommendations:
-            recommendations.append(
-                "Maintain current controls and perform periodic reassessment to ensure risk stays controlled."
-            )
-
-        return recommendations
+        avg = self._behavior_averages(risk_scenario)
+        mask = deficiency_mask(avg["motivation"], avg["ability"], avg["trigger"])
+
+        return RISK_RECOMMENDATION_TABLE[(mask, impact >= 8, frequency >= 8)]
 
     def generate_risk_report(self) -> str:
         """
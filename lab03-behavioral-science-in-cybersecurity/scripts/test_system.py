@@ -80,6 +80,86 @@ def test_fogg_model():
     return all_ok
 
 
+def test_batch_scoring():
+    """Test that batch scoring matches single assessments"""
+    print("=== Testing Batch Scoring ===\n")
+
+    fogg = FoggBehaviorModel()
+
+    profiles = [
+        {"motivation": 0, "ability": 0, "trigger": 0},
+        {"motivation": 10, "ability": 10, "trigger": 10},
+        {"motivation": 9, "ability": 9, "trigger": 2},
+        {"motivation": 15, "ability": 12, "trigger": 11},
+        {"motivation": -3, "ability": -1, "trigger": -10},
+        {"motivation": 3.695, "ability": 7.25, "trigger": 8},
+        {"ability": 3},
+    ]
+
+    batch = fogg.assess_batch(profiles)
+    ok1 = _assert_true(len(batch) == len(profiles), "Batch: one result per profile")
+    ok2 = _assert_true(len(fogg.behavior_history) == 0, "Batch: history not modified")
+
+    ok3 = True
+    for profile, row in zip(profiles, batch):
+        single = fogg.assess_cybersecurity_behavior("batch check", profile)
+        same = (
+            single["scores"]["behavior_score"] == row["behavior_score"]
+            and single["scores"]["motivation"] == row["motivation"]
+            and single["likelihood"] == row["likelihood"]
+            and single["risk_level"] == row["risk_level"]
+        )
+        ok3 = _assert_true(same, f"Batch matches single assessment for {profile}") and ok3
+
+    patterns = fogg.recommendations_by_pattern(batch)
+    ok4 = _assert_true(sum(p["count"] for p in patterns.values()) == len(profiles),
+                       "Batch: deficiency pattern counts cover every profile")
+    ok5 = _assert_true(patterns["motivation+ability+trigger"]["count"] == 2,
+                       "Batch: all-weak pattern counted")
+
+    print("\n=== Batch Scoring Tests Complete ===\n")
+    return ok1 and ok2 and ok3 and ok4 and ok5
+
+
+def test_bounded_history():
+    """Test ring buffer history, spill file and running trends"""
+    print("=== Testing Bounded History ===\n")
+
+    spill_file = "fogg_history_spill.jsonl"
+    bounded = FoggBehaviorModel(history_limit=3, spill_path=spill_file)
+    unbounded = FoggBehaviorModel()
+
+    for i in range(10):
+        profile = {"motivation": i, "ability": 10 - i, "trigger": 5 + i % 3}
+        bounded.assess_cybersecurity_behavior(f"Behavior {i}", profile)
+        unbounded.assess_cybersecurity_behavior(f"Behavior {i}", profile)
+
+    ok1 = _assert_true(len(bounded.behavior_history) == 3,
+                       "Ring buffer keeps only the most recent assessments")
+    ok2 = _assert_true(bounded.get_behavior_trends() == unbounded.get_behavior_trends(),
+                       "Running trends match full-history trends")
+
+    export_file = "fogg_bounded_export_test.json"
+    bounded.export_data(export_file)
+    bounded.close()
+    with open(export_file, "r", encoding="utf-8") as f:
+        exported = json.load(f)
+    ok3 = _assert_true([item["behavior_name"] for item in exported] == [f"Behavior {i}" for i in range(10)],
+                       "Export streams spilled and in-memory history in order")
+
+    ok4 = _assert_true([item["behavior_name"] for item in bounded.recent_history(2)] == ["Behavior 8", "Behavior 9"],
+                       "recent_history returns the newest assessments as a list")
+
+    try:
+        FoggBehaviorModel(history_limit=0, spill_path=spill_file)
+        ok5 = _assert_true(False, "history_limit=0 is rejected")
+    except ValueError:
+        ok5 = _assert_true(True, "history_limit=0 is rejected")
+
+    print("\n=== Bounded History Tests Complete ===\n")
+    return ok1 and ok2 and ok3 and ok4 and ok5
+
+
 def test_risk_prioritization():
     """Test the risk prioritization algorithm"""
     print("=== Testing Risk Prioritization ===\n")
@@ -126,6 +206,84 @@ def test_risk_prioritization():
     return ok1 and ok2 and ok3 and ok4 and ok5
 
 
+def test_summary_scenarios():
+    """Test that aggregated scenarios prioritize like per-user scenarios"""
+    print("=== Testing Summary Scenarios ===\n")
+
+    profiles = [
+        {"motivation": 3, "ability": 4, "trigger": 2},
+        {"motivation": 7, "ability": 6, "trigger": 8},
+        {"motivation": 5, "ability": 2, "trigger": 9},
+    ]
+
+    per_user = CybersecurityRiskPrioritizer()
+    per_user.add_risk_scenario("R-1", "Credential Phishing", 9.0, profiles, 8.5)
+    expected = per_user.prioritize_risks()[0]
+
+    fogg = FoggBehaviorModel()
+    batch = fogg.assess_batch(profiles)
+    averages = {
+        key: float(batch[key].sum()) / len(batch)
+        for key in ("motivation", "ability", "trigger", "behavior_score")
+    }
+
+    summarized = CybersecurityRiskPrioritizer()
+    summarized.add_risk_scenario_summary(
+        "R-1", "Credential Phishing", 9.0, {"count": len(profiles), "averages": averages}, 8.5
+    )
+    result = summarized.prioritize_risks()[0]
+
+    ok1 = _assert_true(result["priority_score"] == expected["priority_score"],
+                       "Summary scenario priority_score matches per-user scenario")
+    ok2 = _assert_true(result["priority_level"] == expected["priority_level"],
+                       "Summary scenario priority_level matches per-user scenario")
+    ok3 = _assert_true(result["recommendations"] == expected["recommendations"],
+                       "Summary scenario recommendations match per-user scenario")
+    ok4 = _assert_true(result["affected_users"] == len(profiles),
+                       "Summary scenario affected_users taken from count")
+
+    print("\n=== Summary Scenario Tests Complete ===\n")
+    return ok1 and ok2 and ok3 and ok4
+
+
+def test_scenario_sweep():
+    """Test that the parallel sweep matches sequential scenarios"""
+    print("=== Testing Scenario Sweep ===\n")
+
+    risks = [
+        {"risk_id": "R-1", "risk_name": "Credential Phishing", "impact_score": 9.0, "threat_frequency": 9.0},
+        {"risk_id": "R-2", "risk_name": "USB Usage Policy", "impact_score": 5.0, "threat_frequency": 4.0},
+    ]
+    populations = {
+        "Finance": [{"motivation": 7, "ability": 4, "trigger": 6},
+                    {"motivation": 6, "ability": 5, "trigger": 5}],
+        "IT": [{"motivation": 6, "ability": 8, "trigger": 4},
+               {"motivation": 7, "ability": 9, "trigger": 5}],
+    }
+
+    sequential = CybersecurityRiskPrioritizer()
+    for risk in risks:
+        for name, profiles in populations.items():
+            sequential.add_risk_scenario(f"{risk['risk_id']}-{name.upper()}", f"{risk['risk_name']} ({name})",
+                                         risk["impact_score"], profiles, risk["threat_frequency"])
+    expected = sequential.prioritize_risks(include_assessments=False)
+
+    swept = CybersecurityRiskPrioritizer().sweep_risk_scenarios(risks, populations, max_workers=2)
+
+    ok1 = _assert_true(swept == expected, "Sweep results match sequential scenarios")
+    ok2 = _assert_true(all("behavioral_assessments" not in r for r in swept),
+                       "Sweep omits per-user assessments by default")
+
+    embedded = CybersecurityRiskPrioritizer().sweep_risk_scenarios(
+        risks, populations, max_workers=2, include_assessments=True
+    )
+    ok3 = _assert_true(all(len(r["behavioral_assessments"]) == 2 for r in embedded),
+                       "Sweep embeds per-user assessments on request")
+
+    print("\n=== Scenario Sweep Tests Complete ===\n")
+    return ok1 and ok2 and ok3
+
+
 def test_data_export():
     """Test data export functionality"""
     print("=== Testing Data Export ===\n")
@@ -223,8 +381,12 @@ if __name__ == "__main__":
     ok_b = test_risk_prioritization()
     ok_c = test_data_export()
     ok_d = run_integration_test()
+    ok_e = test_batch_scoring()
+    ok_f = test_bounded_history()
+    ok_g = test_summary_scenarios()
+    ok_h = test_scenario_sweep()
 
-    if ok_a and ok_b and ok_c and ok_d:
+    if ok_a and ok_b and ok_c and ok_d and ok_e and ok_f and ok_g and ok_h:
         print("\n=== All Tests Complete ===")
         print("Overall Result: PASS")
     else:
@@ -29,6 +29,7 @@ cd scripts
 python3 generate_sample_data.py
 ls -lh ../data/
 head -n 5 ../data/sample_survey_data.csv
+python3 generate_sample_data.py 1000000 ../data/survey_1m.csv --seed 42
 
 # ------------------------------
 # Task 2: Implement SAMM Assessment Engine
@@ -53,3 +54,19 @@ nano report_generator.py
 python3 report_generator.py ../reports/samm_results.json ../reports/analysis_results.json
 cat ../reports/samm_report.txt | head -n 40
 xdg-open ../reports/samm_report.html &
+
+# ------------------------------
+# Full pipeline (survey parsed once, shared by engine + analyzer)
+# ------------------------------
+python3 run_pipeline.py ../data/sample_survey_data.csv ../reports
+
+# ------------------------------
+# Survey cache (Arrow IPC) benchmark
+# ------------------------------
+pip3 install pyarrow
+python3 benchmark_survey_cache.py ../data/sample_survey_data.csv
+
+# ------------------------------
+# Bootstrap confidence intervals
+# ------------------------------
+python3 samm_engine.py ../data/sample_survey_data.csv --bootstrap 2000 --seed 42
@@ -63,3 +63,7 @@ SCORING_THRESHOLDS = {
     1: 0.5,  # Initial
     0: 0.0   # Non-existent
 }
+
+# On-disk survey cache (Arrow IPC next to the survey CSV, see scripts/survey_cache.py)
+SURVEY_CACHE_ENABLED = True
+SURVEY_CACHE_DIR = None  # None = ".samm_cache" directory beside the CSV
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Survey Cache Benchmark
+
+Compares a cold CSV parse against a warm Arrow cache load for SAMM survey
+files, and checks that both produce the same typed frame.
+
+Usage:
+    python3 benchmark_survey_cache.py [survey_csv | responses ...]
+
+With no arguments, synthetic surveys of 10k, 100k and 500k responses are
+generated (seeded, see generate_survey_file) in a temporary directory.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+from generate_sample_data import generate_survey_file
+from survey_cache import cache_paths, read_cached_frame, source_signature, write_cached_frame
+from survey_dataset import SurveyDataset
+
+
+def time_call(fn, repeat=3):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def benchmark_file(csv_file):
+    size_mb = os.path.getsize(csv_file) / (1024 * 1024)
+
+    cold_seconds, dataset = time_call(lambda: SurveyDataset.from_csv(csv_file))
+
+    build_start = time.perf_counter()
+    write_cached_frame(csv_file, dataset.frame, source_signature(csv_file))
+    build_seconds = time.perf_counter() - build_start
+
+    warm_seconds, frame = time_call(lambda: read_cached_frame(csv_file))
+    pd.testing.assert_frame_equal(dataset.frame, frame)
+
+    arrow_path, _ = cache_paths(csv_file)
+    print(f"\n=== {os.path.basename(csv_file)}: {len(dataset):,} responses, {size_mb:.1f} MB CSV ===")
+    arrow_mb = os.path.getsize(arrow_path) / (1024 * 1024)
+    print(f"  {'cold CSV parse':<28}{cold_seconds * 1000:10.1f} ms")
+    print(f"  {'cache build (hash + write)':<28}{build_seconds * 1000:10.1f} ms  ({arrow_mb:.1f} MB Arrow)")
+    print(f"  {'warm cache load':<28}{warm_seconds * 1000:10.1f} ms  ({cold_seconds / warm_seconds:.1f}x faster)")
+
+
+def benchmark_sizes(sizes):
+    with tempfile.TemporaryDirectory() as tmp:
+        for num_responses in sizes:
+            csv_file = os.path.join(tmp, f"survey_{num_responses}.csv")
+            generate_survey_file(csv_file, num_responses, seed=42)
+            benchmark_file(csv_file)
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    if args and not args[0].isdigit():
+        benchmark_file(args[0])
+    else:
+        benchmark_sizes([int(arg) for arg in args] or [10_000, 100_000, 500_000])
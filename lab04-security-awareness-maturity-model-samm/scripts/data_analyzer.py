@@ -6,17 +6,18 @@ Students: Implement statistical analysis and visualization functions
 
 import os
 import json
-import pandas as pd
-import numpy as np
 import matplotlib.pyplot as plt
 import sys
 
+from survey_dataset import load_survey_dataset
+
 plt.switch_backend("Agg")
 
 
 class SAMMDataAnalyzer:
     def __init__(self):
         self.data = None
+        self.dataset = None
         self.analysis_results = {}
 
     def load_data(self, csv_file):
@@ -30,7 +31,7 @@ class SAMMDataAnalyzer:
             Boolean indicating success
         """
         try:
-            self.data = pd.read_csv(csv_file)
+            self.use_dataset(load_survey_dataset(csv_file))
             print("Loaded survey data successfully.")
             print(f"Rows: {self.data.shape[0]}, Columns: {self.data.shape[1]}")
             print("Columns:", list(self.data.columns))
@@ -40,22 +41,21 @@ class SAMMDataAnalyzer:
             print(f"Error loading data: {e}")
             return False
 
+    def use_dataset(self, dataset):
+        """
+        Analyze an already loaded SurveyDataset (e.g. the one the
+        assessment engine used), sharing its cached score columns.
+        """
+        self.dataset = dataset
+        self.data = dataset.frame
+
     def _score_columns(self):
-        # Identify score columns (exclude metadata)
-        meta_cols = {"response_id", "timestamp", "department", "role_level", "years_experience"}
-        score_cols = [c for c in self.data.columns if c not in meta_cols]
-        return score_cols
+        # Score columns ("<category>_<question>"; metadata excluded)
+        return self.dataset.score_columns()
 
     def _category_columns(self):
         # Group score columns into SAMM categories based on prefix
-        score_cols = self._score_columns()
-        categories = {
-            "governance": [c for c in score_cols if c.startswith("governance_")],
-            "training": [c for c in score_cols if c.startswith("training_")],
-            "culture": [c for c in score_cols if c.startswith("culture_")],
-            "measurement": [c for c in score_cols if c.startswith("measurement_")],
-        }
-        return categories
+        return self.dataset.category_columns()
 
     def basic_statistics(self):
         """
@@ -64,15 +64,12 @@ class SAMMDataAnalyzer:
         print("\nBasic Statistics Analysis")
         print("=" * 40)
 
-        categories = self._category_columns()
+        category_scores = self.dataset.category_scores()
         stats_out = {}
 
-        for cat, cols in categories.items():
-            if not cols:
-                continue
-
+        for cat in category_scores.columns:
             # Calculate mean, median, std, min, max for the category (row-wise average then overall)
-            cat_series = self.data[cols].mean(axis=1, numeric_only=True)
+            cat_series = category_scores[cat]
             cat_stats = {
                 "mean": round(float(cat_series.mean()), 3),
                 "median": round(float(cat_series.median()), 3),
@@ -96,15 +93,14 @@ class SAMMDataAnalyzer:
         print("\nDemographic Analysis")
         print("=" * 40)
 
-        categories = self._category_columns()
-        score_cols = self._score_columns()
+        category_scores = self.dataset.category_scores()
 
-        # Calculate overall score for each response
-        self.data["overall_score"] = self.data[score_cols].mean(axis=1, numeric_only=True)
+        # Overall score for each response (cached on the dataset)
+        overall_score = self.dataset.overall_scores()
 
         dept_summary = {}
         if "department" in self.data.columns:
-            dept_group = self.data.groupby("department")["overall_score"]
+            dept_group = overall_score.groupby(self.data["department"])
             dept_summary = dept_group.agg(["count", "mean", "median", "std", "min", "max"]).round(3).to_dict(orient="index")
             print("\nOverall Score by Department:")
             for dept, vals in dept_summary.items():
@@ -112,7 +108,7 @@ class SAMMDataAnalyzer:
 
         role_summary = {}
         if "role_level" in self.data.columns:
-            role_group = self.data.groupby("role_level")["overall_score"]
+            role_group = overall_score.groupby(self.data["role_level"])
             role_summary = role_group.agg(["count", "mean", "median", "std", "min", "max"]).round(3).to_dict(orient="index")
             print("\nOverall Score by Role Level:")
             for role, vals in role_summary.items():
@@ -126,17 +122,10 @@ class SAMMDataAnalyzer:
         # Also store category-level demographic averages (optional but useful)
         cat_demo = {"department": {}, "role_level": {}}
 
-        if "department" in self.data.columns:
-            for cat, cols in categories.items():
-                if cols:
-                    self.data[f"{cat}_score"] = self.data[cols].mean(axis=1, numeric_only=True)
-                    cat_demo["department"][cat] = self.data.groupby("department")[f"{cat}_score"].mean().round(3).to_dict()
-
-        if "role_level" in self.data.columns:
-            for cat, cols in categories.items():
-                if cols:
-                    self.data[f"{cat}_score"] = self.data[cols].mean(axis=1, numeric_only=True)
-                    cat_demo["role_level"][cat] = self.data.groupby("role_level")[f"{cat}_score"].mean().round(3).to_dict()
+        for demo in ("department", "role_level"):
+            if demo in self.data.columns:
+                for cat in category_scores.columns:
+                    cat_demo[demo][cat] = category_scores[cat].groupby(self.data[demo]).mean().round(3).to_dict()
 
         self.analysis_results["category_demographics"] = cat_demo
 
@@ -150,12 +139,7 @@ class SAMMDataAnalyzer:
         print("\nCorrelation Analysis")
         print("=" * 40)
 
-        categories = self._category_columns()
-        cat_df = pd.DataFrame()
-
-        for cat, cols in categories.items():
-            if cols:
-                cat_df[cat] = self.data[cols].mean(axis=1, numeric_only=True)
+        cat_df = self.dataset.category_scores()
 
         if cat_df.empty:
             print("No category columns found for correlation analysis.")
@@ -178,18 +162,11 @@ class SAMMDataAnalyzer:
         """
         os.makedirs(output_dir, exist_ok=True)
 
-        categories = self._category_columns()
-        score_cols = self._score_columns()
-
-        # Ensure overall_score exists
-        if "overall_score" not in self.data.columns:
-            self.data["overall_score"] = self.data[score_cols].mean(axis=1, numeric_only=True)
+        overall_score = self.dataset.overall_scores()
 
         # Box plots for category distributions
-        cat_scores = {}
-        for cat, cols in categories.items():
-            if cols:
-                cat_scores[cat] = self.data[cols].mean(axis=1, numeric_only=True)
+        category_scores = self.dataset.category_scores()
+        cat_scores = {cat: category_scores[cat] for cat in category_scores.columns}
 
         if cat_scores:
             plt.figure()
@@ -206,7 +183,7 @@ class SAMMDataAnalyzer:
 
         # Bar charts for demographic comparisons (department)
         if "department" in self.data.columns:
-            dept_means = self.data.groupby("department")["overall_score"].mean().sort_values(ascending=False)
+            dept_means = overall_score.groupby(self.data["department"]).mean().sort_values(ascending=False)
             plt.figure()
             plt.bar(dept_means.index.astype(str), dept_means.values)
             plt.title("Average Overall Score by Department")
@@ -222,7 +199,7 @@ class SAMMDataAnalyzer:
 
         # Bar charts for demographic comparisons (role level)
         if "role_level" in self.data.columns:
-            role_means = self.data.groupby("role_level")["overall_score"].mean().sort_values(ascending=False)
+            role_means = overall_score.groupby(self.data["role_level"]).mean().sort_values(ascending=False)
             plt.figure()
             plt.bar(role_means.index.astype(str), role_means.values)
             plt.title("Average Overall Score by Role Level")
@@ -238,7 +215,7 @@ class SAMMDataAnalyzer:
 
         # Histogram for overall score distribution
         plt.figure()
-        plt.hist(self.data["overall_score"].dropna(), bins=10)
+        plt.hist(overall_score.dropna(), bins=10)
         plt.title("Overall Score Distribution")
         plt.xlabel("Overall Score (1-5)")
         plt.ylabel("Count")
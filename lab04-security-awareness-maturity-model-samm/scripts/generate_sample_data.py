@@ -5,9 +5,60 @@ Students: Complete the TODO sections to generate realistic survey data
 """
 
 import csv
+import os
 import random
+import sys
+import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Tuple, Any, Optional
+
+import numpy as np
+import pandas as pd
+
+
+# Define survey questions
+SURVEY_QUESTIONS = {
+    # Governance category questions
+    "governance_policy_framework": "Rate security policy framework (1-5)",
+    "governance_leadership_commitment": "Rate leadership commitment to security awareness (1-5)",
+    "governance_resource_allocation": "Rate resource allocation for awareness/training (1-5)",
+    "governance_compliance_monitoring": "Rate compliance monitoring and enforcement (1-5)",
+
+    # Training category questions
+    "training_awareness_programs": "Rate awareness programs (1-5)",
+    "training_role_based_training": "Rate role-based security training (1-5)",
+    "training_training_effectiveness": "Rate training effectiveness (knowledge retention) (1-5)",
+    "training_continuous_learning": "Rate continuous learning opportunities (1-5)",
+
+    # Culture category questions
+    "culture_behavioral_change": "Rate observed behavioral change in security practices (1-5)",
+    "culture_incident_reporting": "Rate incident reporting culture and ease (1-5)",
+    "culture_peer_influence": "Rate positive peer influence on secure behavior (1-5)",
+    "culture_recognition_programs": "Rate recognition programs for secure behavior (1-5)",
+
+    # Measurement category questions
+    "measurement_kpi_tracking": "Rate KPI tracking for security awareness (1-5)",
+    "measurement_assessment_frequency": "Rate how often awareness is assessed (1-5)",
+    "measurement_data_analysis": "Rate depth of analysis performed on awareness data (1-5)",
+    "measurement_improvement_actions": "Rate effectiveness of improvement actions taken (1-5)",
+}
+
+DEPARTMENTS = ["IT", "HR", "Finance", "Marketing", "Operations"]
+ROLE_LEVELS = ["Junior", "Mid", "Senior", "Manager", "Executive"]
+
+# Department maturity bias (example)
+DEPARTMENT_BIAS = {"IT": 0.6, "Finance": 0.3, "HR": 0.1, "Marketing": -0.1, "Operations": -0.2}
+
+# Role bias (example)
+ROLE_BIAS = {"Junior": -0.2, "Mid": 0.0, "Senior": 0.3, "Manager": 0.3, "Executive": 0.2}
+
+# Possible organization base maturity (2-4, 3 twice as likely)
+ORG_BASE_CHOICES = [2, 3, 3, 4]
+
+META_FIELDS = ["response_id", "timestamp", "department", "role_level", "years_experience"]
+
+# Rows generated and written per chunk by generate_survey_file()
+DEFAULT_CHUNK_SIZE = 250_000
 
 
 def generate_sample_responses(num_responses: int = 50) -> Tuple[List[Dict[str, Any]], Dict[str, str]]:
@@ -21,68 +72,24 @@ def generate_sample_responses(num_responses: int = 50) -> Tuple[List[Dict[str, A
         Tuple of (responses list, questions dictionary)
     """
 
-    # Define survey questions
-    questions = {
-        # Governance category questions
-        "governance_policy_framework": "Rate security policy framework (1-5)",
-        "governance_leadership_commitment": "Rate leadership commitment to security awareness (1-5)",
-        "governance_resource_allocation": "Rate resource allocation for awareness/training (1-5)",
-        "governance_compliance_monitoring": "Rate compliance monitoring and enforcement (1-5)",
-
-        # Training category questions
-        "training_awareness_programs": "Rate awareness programs (1-5)",
-        "training_role_based_training": "Rate role-based security training (1-5)",
-        "training_training_effectiveness": "Rate training effectiveness (knowledge retention) (1-5)",
-        "training_continuous_learning": "Rate continuous learning opportunities (1-5)",
-
-        # Culture category questions
-        "culture_behavioral_change": "Rate observed behavioral change in security practices (1-5)",
-        "culture_incident_reporting": "Rate incident reporting culture and ease (1-5)",
-        "culture_peer_influence": "Rate positive peer influence on secure behavior (1-5)",
-        "culture_recognition_programs": "Rate recognition programs for secure behavior (1-5)",
-
-        # Measurement category questions
-        "measurement_kpi_tracking": "Rate KPI tracking for security awareness (1-5)",
-        "measurement_assessment_frequency": "Rate how often awareness is assessed (1-5)",
-        "measurement_data_analysis": "Rate depth of analysis performed on awareness data (1-5)",
-        "measurement_improvement_actions": "Rate effectiveness of improvement actions taken (1-5)",
-    }
-
+    questions = dict(SURVEY_QUESTIONS)
     responses: List[Dict[str, Any]] = []
 
-    departments = ["IT", "HR", "Finance", "Marketing", "Operations"]
-    role_levels = ["Junior", "Mid", "Senior", "Manager", "Executive"]
+    departments = DEPARTMENTS
+    role_levels = ROLE_LEVELS
 
     # Choose a base maturity for the whole organization to create correlated data
     # This simulates an org that is around 2-4 maturity on average
-    org_base = random.choice([2, 3, 3, 4])
+    org_base = random.choice(ORG_BASE_CHOICES)
 
     for i in range(num_responses):
         dept = random.choice(departments)
         role = random.choice(role_levels)
         years_exp = random.randint(0, 15)
 
-        # Department maturity bias (example)
-        dept_bias = 0
-        if dept == "IT":
-            dept_bias = 0.6
-        elif dept == "Finance":
-            dept_bias = 0.3
-        elif dept == "HR":
-            dept_bias = 0.1
-        elif dept == "Marketing":
-            dept_bias = -0.1
-        elif dept == "Operations":
-            dept_bias = -0.2
-
-        # Role bias (example)
-        role_bias = 0
-        if role in ["Senior", "Manager"]:
-            role_bias = 0.3
-        elif role == "Executive":
-            role_bias = 0.2
-        elif role == "Junior":
-            role_bias = -0.2
+        # Department and role maturity bias
+        dept_bias = DEPARTMENT_BIAS[dept]
+        role_bias = ROLE_BIAS[role]
 
         # Experience bias (small)
         exp_bias = min(0.4, years_exp / 30.0)
@@ -133,7 +140,7 @@ def save_sample_data(filename: str, responses: List[Dict[str, Any]], questions:
     """
     try:
         # Create CSV writer with appropriate fieldnames
-        fieldnames = ["response_id", "timestamp", "department", "role_level", "years_experience"] + list(questions.keys())
+        fieldnames = META_FIELDS + list(questions.keys())
 
         with open(filename, "w", newline="", encoding="utf-8") as f:
             writer = csv.DictWriter(f, fieldnames=fieldnames)
@@ -150,9 +157,190 @@ def save_sample_data(filename: str, responses: List[Dict[str, Any]], questions:
         return False
 
 
-if __name__ == "__main__":
-    # Generate 75 sample responses
-    responses, questions = generate_sample_responses(num_responses=75)
+def generate_response_frame(
+    rng_streams: List[np.random.Generator],
+    start: int,
+    num_responses: int,
+    org_base: float,
+    now: Optional[datetime] = None,
+) -> pd.DataFrame:
+    """
+    Generate a block of survey responses with NumPy, all respondents at once.
+
+    Each score is clip(round(org_base + dept_bias + role_bias + exp_bias + noise), 1, 5),
+    the same model as generate_sample_responses(), drawn from a
+    (responses x questions) uniform noise matrix.
+
+    Args:
+        rng_streams: Generators for (department, role, experience, timestamp, noise)
+        start: Index of the first response (for response_id)
+        num_responses: Number of responses in this block
+        org_base: Organization base maturity
+        now: Reference time for timestamps (defaults to datetime.now())
+
+    Returns:
+        DataFrame with META_FIELDS followed by one int8 column per question
+    """
+    dept_rng, role_rng, exp_rng, day_rng, noise_rng = rng_streams
+    now = now or datetime.now()
+
+    # int64 draws keep every stream identical however the output is chunked
+    dept_idx = dept_rng.integers(0, len(DEPARTMENTS), size=num_responses, dtype=np.int64)
+    role_idx = role_rng.integers(0, len(ROLE_LEVELS), size=num_responses, dtype=np.int64)
+    years_exp = exp_rng.integers(0, 16, size=num_responses, dtype=np.int64)
+    days_ago = day_rng.integers(1, 31, size=num_responses, dtype=np.int64)
+
+    dept_bias = np.array([DEPARTMENT_BIAS[d] for d in DEPARTMENTS])
+    role_bias = np.array([ROLE_BIAS[r] for r in ROLE_LEVELS])
+    base = org_base + dept_bias[dept_idx] + role_bias[role_idx] + np.minimum(0.4, years_exp / 30.0)
+    base = np.clip(base, 1, 5)
+
+    noise = noise_rng.uniform(-0.8, 0.8, size=(num_responses, len(SURVEY_QUESTIONS)))
+    scores = np.clip(np.rint(base[:, None] + noise), 1, 5).astype(np.int8)
+
+    # Only 30 distinct timestamps exist per run, so format them once and index
+    stamps = np.array([(now - timedelta(days=d)).isoformat() for d in range(31)], dtype=object)
+    ids = np.arange(start + 1, start + num_responses + 1).astype(str)
+    if num_responses > 0:  # np.char.zfill cannot size an empty array
+        ids = np.char.zfill(ids, 3)
+
+    frame = pd.DataFrame({
+        "response_id": np.char.add("RESP_", ids),
+        "timestamp": stamps[days_ago],
+        "department": np.array(DEPARTMENTS, dtype=object)[dept_idx],
+        "role_level": np.array(ROLE_LEVELS, dtype=object)[role_idx],
+        "years_experience": years_exp,
+    })
+    score_frame = pd.DataFrame(scores, columns=list(SURVEY_QUESTIONS))
+    return pd.concat([frame, score_frame], axis=1)
+
+
+def generate_survey_file(
+    filename: str,
+    num_responses: int,
+    seed: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    file_format: Optional[str] = None,
+    org_base: Optional[float] = None,
+) -> int:
+    """
+    Write a large synthetic survey to CSV or Parquet, chunk by chunk.
+
+    Memory use is bounded by chunk_size. For a given seed the output is the
+    same whatever the chunk size (apart from timestamps, which are relative
+    to the current time).
+
+    Args:
+        filename: Output file
+        num_responses: Number of survey responses to generate
+        seed: Random seed (None = random)
+        chunk_size: Responses generated and written per chunk
+        file_format: "csv" or "parquet" (None = from the file extension)
+        org_base: Organization base maturity (None = drawn from ORG_BASE_CHOICES)
 
-    # Save to ../data/sample_survey_data.csv
-    save_sample_data("../data/sample_survey_data.csv", responses, questions)
+    Returns:
+        Number of responses written
+    """
+    file_format = (file_format or os.path.splitext(filename)[1].lstrip(".") or "csv").lower()
+    if file_format not in ("csv", "parquet"):
+        raise ValueError(f"Unsupported survey file format: {file_format}")
+    chunk_size = max(1, int(chunk_size))
+
+    seed_seq = np.random.SeedSequence(seed)
+    org_rng, *streams = [np.random.default_rng(s) for s in seed_seq.spawn(6)]
+    if org_base is None:
+        org_base = float(org_rng.choice(ORG_BASE_CHOICES))
+    now = datetime.now()
+
+    writer = None
+    try:
+        for start in range(0, num_responses, chunk_size):
+            frame = generate_response_frame(streams, start, min(chunk_size, num_responses - start), org_base, now)
+            if file_format == "csv":
+                _write_csv_chunk(frame, filename, first=start == 0)
+            else:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+
+                table = pa.Table.from_pandas(frame, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(filename, table.schema)
+                writer.write_table(table)
+        if num_responses <= 0:
+            # Header-only CSV / zero-row Parquet with the same schema as a full run
+            frame = generate_response_frame(streams, 0, 0, org_base, now)
+            if file_format == "csv":
+                _write_csv_chunk(frame, filename, first=True)
+            else:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+
+                table = pa.Table.from_pandas(frame, preserve_index=False)
+                # Empty object columns come out as null; give them the string type of response_id
+                text_type = table.schema.field("response_id").type
+                schema = pa.schema([
+                    pa.field(f.name, text_type) if pa.types.is_null(f.type) else f for f in table.schema
+                ], metadata=table.schema.metadata)
+                pq.write_table(table.cast(schema), filename)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    return max(0, num_responses)
+
+
+def _write_csv_chunk(frame: pd.DataFrame, filename: str, first: bool) -> None:
+    """Write (first chunk) or append a chunk as CSV; Arrow's CSV writer is used when installed."""
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+    except ImportError:
+        frame.to_csv(filename, mode="w" if first else "a", header=first, index=False)
+        return
+
+    options = pa_csv.WriteOptions(include_header=False, quoting_style="none")
+    with open(filename, "wb" if first else "ab") as f:
+        if first:
+            # Arrow always quotes header names; write the plain header ourselves
+            f.write((",".join(frame.columns) + "\n").encode("utf-8"))
+        pa_csv.write_csv(pa.Table.from_pandas(frame, preserve_index=False), f, options)
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    if not args:
+        # Generate 75 sample responses
+        responses, questions = generate_sample_responses(num_responses=75)
+
+        # Save to ../data/sample_survey_data.csv
+        save_sample_data("../data/sample_survey_data.csv", responses, questions)
+        sys.exit(0)
+
+    # Large synthetic survey: <num_responses> [output_file] [--seed S] [--chunk-size N]
+    seed = None
+    chunk_size = DEFAULT_CHUNK_SIZE
+    positional = []
+    i = 0
+    while i < len(args):
+        if args[i] == "--seed" and i + 1 < len(args):
+            seed = int(args[i + 1])
+            i += 2
+        elif args[i] == "--chunk-size" and i + 1 < len(args):
+            chunk_size = int(args[i + 1])
+            i += 2
+        else:
+            positional.append(args[i])
+            i += 1
+
+    if not positional or not positional[0].isdigit():
+        print("Usage: python3 generate_sample_data.py [num_responses] [output.csv|output.parquet] "
+              "[--seed S] [--chunk-size N]")
+        sys.exit(1)
+
+    num_responses = int(positional[0])
+    output_file = positional[1] if len(positional) > 1 else "../data/sample_survey_data.csv"
+
+    start_time = time.perf_counter()
+    written = generate_survey_file(output_file, num_responses, seed=seed, chunk_size=chunk_size)
+    elapsed = time.perf_counter() - start_time
+    print(f"Generated {written:,} responses in {elapsed:.2f}s -> {output_file}")
@@ -58,6 +58,13 @@ class SAMMReportGenerator:
         lines = []
         lines.append(f"Overall SAMM Maturity Score: {score}")
         lines.append(f"Overall Maturity Level: {level.get('level')} - {level.get('name')}")
+        ci = overall.get("confidence_interval")
+        if ci:
+            level_range = ci.get("maturity_level_range", {})
+            lines.append(
+                f"{self._ci_label()}: {ci.get('ci_low')} - {ci.get('ci_high')} "
+                f"(Levels {level_range.get('low', {}).get('level')}-{level_range.get('high', {}).get('level')})"
+            )
         lines.append("")
         lines.append("Key Strengths:")
         for k, v in strengths:
@@ -69,6 +76,10 @@ class SAMMReportGenerator:
 
         return "\n".join(lines)
 
+    def _ci_label(self):
+        boot = self.assessment_results.get("bootstrap", {})
+        return f"{round(boot.get('confidence', 0.95) * 100)}% CI (bootstrap)"
+
     def generate_category_details(self):
         """
         Generate detailed category analysis.
@@ -83,6 +94,9 @@ class SAMMReportGenerator:
             lines.append(f"Category: {cat_val.get('name')}")
             lines.append(f"  Score: {cat_val.get('score')} (Weight: {cat_val.get('weight')})")
             lines.append(f"  Maturity Level: {lvl.get('level')} - {lvl.get('name')}")
+            ci = cat_val.get("confidence_interval")
+            if ci:
+                lines.append(f"  {self._ci_label()}: {ci.get('ci_low')} - {ci.get('ci_high')}")
             lines.append("  Recommendations:")
             for r in cat_val.get("recommendations", []):
                 lines.append(f"   - {r}")
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+SAMM Lab Pipeline
+Runs assessment, analysis and reporting in one process so the survey
+CSV is parsed once and each category row-mean is computed once.
+"""
+
+import os
+import sys
+
+from samm_engine import SAMMAssessment
+from data_analyzer import SAMMDataAnalyzer
+from report_generator import SAMMReportGenerator
+from survey_dataset import load_survey_dataset
+
+
+def run_pipeline(survey_file, reports_dir):
+    """
+    Run the full SAMM pipeline against one survey file.
+
+    Args:
+        survey_file: Path to survey data CSV
+        reports_dir: Output directory for results, plots and reports
+
+    Returns:
+        Boolean indicating success
+    """
+    dataset = load_survey_dataset(survey_file)
+
+    samm = SAMMAssessment()
+    if not samm.run_assessment(survey_file):
+        return False
+    assessment_file = os.path.join(reports_dir, "samm_results.json")
+    if not samm.save_results(assessment_file):
+        return False
+
+    analyzer = SAMMDataAnalyzer()
+    analyzer.use_dataset(dataset)
+    analyzer.basic_statistics()
+    analyzer.demographic_analysis()
+    analyzer.correlation_analysis()
+    analyzer.generate_visualizations(reports_dir)
+    analysis_file = os.path.join(reports_dir, "analysis_results.json")
+    if not analyzer.save_analysis_results(analysis_file):
+        return False
+
+    gen = SAMMReportGenerator()
+    if not gen.load_results(assessment_file, analysis_file):
+        return False
+    ok_txt = gen.generate_text_report(os.path.join(reports_dir, "samm_report.txt"))
+    ok_html = gen.generate_html_report(os.path.join(reports_dir, "samm_report.html"))
+    return ok_txt and ok_html
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python3 run_pipeline.py <survey_csv_file> [reports_dir]")
+        sys.exit(1)
+
+    survey_file = sys.argv[1]
+    reports_dir = sys.argv[2] if len(sys.argv) > 2 else os.path.join(os.path.dirname(__file__), "..", "reports")
+
+    if not run_pipeline(survey_file, reports_dir):
+        sys.exit(1)
+    print(f"SAMM pipeline complete. Reports in: {reports_dir}")
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Bootstrap Confidence Intervals for SAMM Scores
+
+Resamples survey responses with replacement and recomputes every category
+score and the weighted overall score for each resample:
+- each chunk of resamples is drawn as one 2-D index matrix (resamples x responses)
+- the index matrix is turned into per-response draw counts, so per-question
+  sums for all resamples in the chunk come from a single matrix product
+- chunks are spread across a process pool for very large surveys
+
+Chunk seeds are derived from the base seed and the chunk number, so results
+depend only on the seed, not on the number of workers.
+"""
+
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "config"))
+from samm_config import ASSESSMENT_CATEGORIES  # noqa: E402
+
+
+DEFAULT_RESAMPLES = 2000
+DEFAULT_CONFIDENCE = 0.95
+
+# Use a process pool from this many responses on (below it one process is faster)
+PARALLEL_MIN_RESPONSES = 50_000
+
+# Upper bound for one chunk's index/count matrices (elements)
+CHUNK_ELEMENTS = 8_000_000
+
+
+def _question_layout():
+    """Question columns in category order, and each category's column slice."""
+    columns, slices = [], {}
+    for cat_key, cat_info in ASSESSMENT_CATEGORIES.items():
+        start = len(columns)
+        columns.extend(f"{cat_key}_{sub}" for sub in cat_info["subcategories"])
+        slices[cat_key] = (start, len(columns))
+    return columns, slices
+
+
+def score_matrix(dataset):
+    """
+    (responses x questions) score matrix for the configured questions.
+    Missing questions are all-NaN columns (scored 0.0, as in the engine).
+    """
+    columns, _ = _question_layout()
+    frame = dataset.frame
+    matrix = np.full((len(frame), len(columns)), np.nan)
+    for j, col in enumerate(columns):
+        if col in frame.columns:
+            matrix[:, j] = frame[col].to_numpy(dtype=float)
+    return matrix
+
+
+def _scores_from_sums(sums, counts):
+    """Category and weighted overall scores from per-question sums/counts (rows = resamples)."""
+    _, slices = _question_layout()
+    with np.errstate(invalid="ignore", divide="ignore"):
+        question_means = np.where(counts > 0, sums / np.where(counts > 0, counts, 1), 0.0)
+
+    categories = {
+        cat: question_means[:, start:end].mean(axis=1) if end > start else np.zeros(len(sums))
+        for cat, (start, end) in slices.items()
+    }
+    overall = sum(categories[cat] * ASSESSMENT_CATEGORIES[cat]["weight"] for cat in categories)
+    return categories, overall
+
+
+# Worker state: score matrix split into values (NaN -> 0) and answered flags
+_WORKER = {}
+
+
+def _init_worker(matrix):
+    _WORKER["values"] = np.nan_to_num(matrix, nan=0.0)
+    _WORKER["answered"] = (~np.isnan(matrix)).astype(float)
+
+
+def _resample_chunk(seed, n_resamples):
+    """Run n_resamples bootstrap resamples; returns (category score arrays, overall array)."""
+    values, answered = _WORKER["values"], _WORKER["answered"]
+    n = len(values)
+    rng = np.random.default_rng(seed)
+
+    # 2-D index matrix: row b holds the response indices drawn for resample b
+    indices = rng.integers(0, n, size=(n_resamples, n))
+
+    # Draw counts per (resample, response), then all sums in one matrix product
+    offsets = (np.arange(n_resamples) * n)[:, None]
+    weights = np.bincount((indices + offsets).ravel(), minlength=n_resamples * n).reshape(n_resamples, n)
+    weights = weights.astype(float)
+
+    return _scores_from_sums(weights @ values, weights @ answered)
+
+
+def _interval(samples, confidence):
+    alpha = (1.0 - confidence) / 2.0
+    low, high = np.quantile(samples, [alpha, 1.0 - alpha])
+    return {
+        "ci_low": round(float(low), 2),
+        "ci_high": round(float(high), 2),
+        "std_error": round(float(samples.std(ddof=1)), 3) if len(samples) > 1 else 0.0,
+    }
+
+
+def bootstrap_scores(
+    dataset,
+    n_resamples=DEFAULT_RESAMPLES,
+    confidence=DEFAULT_CONFIDENCE,
+    seed=None,
+    workers=None,
+):
+    """
+    Bootstrap the category scores and weighted overall score.
+
+    Args:
+        dataset: SurveyDataset to resample
+        n_resamples: Number of bootstrap resamples
+        confidence: Confidence level for the percentile intervals
+        seed: Base random seed (None = random)
+        workers: Process count (None = all cores for large surveys, 1 otherwise)
+
+    Returns:
+        Dict with "categories" ({cat: ci_low/ci_high/std_error}), "overall"
+        (same, plus "samples" of resampled overall scores) and run settings
+    """
+    matrix = score_matrix(dataset)
+    n = len(matrix)
+    if n == 0 or n_resamples <= 0:
+        raise ValueError("Bootstrap needs at least one response and one resample")
+
+    chunk = max(1, min(n_resamples, CHUNK_ELEMENTS // n))
+    sizes = [min(chunk, n_resamples - start) for start in range(0, n_resamples, chunk)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+    if workers is None:
+        workers = (os.cpu_count() or 1) if n >= PARALLEL_MIN_RESPONSES else 1
+    workers = max(1, min(workers, len(sizes)))
+
+    if workers == 1:
+        _init_worker(matrix)
+        results = [_resample_chunk(s, size) for s, size in zip(seeds, sizes)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(matrix,)) as pool:
+            results = list(pool.map(_resample_chunk, seeds, sizes))
+
+    category_samples = {
+        cat: np.concatenate([categories[cat] for categories, _ in results]) for cat in ASSESSMENT_CATEGORIES
+    }
+    overall_samples = np.concatenate([overall for _, overall in results])
+
+    return {
+        "method": "percentile",
+        "n_resamples": n_resamples,
+        "confidence": confidence,
+        "seed": seed,
+        "categories": {cat: _interval(samples, confidence) for cat, samples in category_samples.items()},
+        "overall": dict(_interval(overall_samples, confidence), samples=overall_samples),
+    }
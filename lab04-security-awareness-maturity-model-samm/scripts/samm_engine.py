@@ -10,9 +10,14 @@ import statistics
 import sys
 import os
 
+import numpy as np
+import pandas as pd
+
 # Make config importable (config/samm_config.py)
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", "config"))
 from samm_config import MATURITY_LEVELS, ASSESSMENT_CATEGORIES, SCORING_THRESHOLDS  # noqa: E402
+from survey_dataset import SurveyDataset, load_survey_dataset  # noqa: E402
+from samm_bootstrap import DEFAULT_CONFIDENCE, DEFAULT_RESAMPLES, bootstrap_scores  # noqa: E402
 
 
 class SAMMAssessment:
@@ -63,44 +68,70 @@ class SAMMAssessment:
 
         return responses
 
+    def load_survey_frame(self, csv_file):
+        """
+        Load survey data into a typed DataFrame.
+
+        The file is parsed once per process through the shared survey
+        dataset (see survey_dataset.py): metadata columns use declared
+        dtypes and every score column is float64, with blank or
+        non-numeric cells as NaN.
+
+        Args:
+            csv_file: Path to CSV file containing survey responses
+
+        Returns:
+            pandas DataFrame with one row per response
+        """
+        return load_survey_dataset(csv_file).frame
+
+    def _as_dataset(self, responses):
+        if isinstance(responses, SurveyDataset):
+            return responses
+        if isinstance(responses, pd.DataFrame):
+            return SurveyDataset(responses.copy(deep=False))
+        return SurveyDataset.from_records(responses)
+
+    def calculate_subcategory_scores(self, responses, category):
+        """
+        Calculate the mean score of each subcategory in a category.
+
+        Args:
+            responses: SurveyDataset, survey DataFrame or list of response dictionaries
+            category: Category key
+
+        Returns:
+            Dict of subcategory -> mean score (0.0 when no numeric answers)
+        """
+        # Column means for all score columns, computed once per dataset
+        means = self._as_dataset(responses).column_means()
+
+        sub_scores = {}
+        for sub in ASSESSMENT_CATEGORIES.get(category, {}).get("subcategories", []):
+            value = means.get(f"{category}_{sub}", float("nan"))
+            sub_scores[sub] = 0.0 if pd.isna(value) else float(value)
+        return sub_scores
+
     def calculate_category_score(self, responses, category):
         """
         Calculate maturity score for a specific category.
 
         Args:
-            responses: List of survey responses
+            responses: SurveyDataset, survey DataFrame or list of response dictionaries
             category: Category key (governance, training, culture, measurement)
 
         Returns:
             Float representing average category score
         """
-        # Extract subcategories for the given category
-        cat_info = ASSESSMENT_CATEGORIES.get(category, {})
-        subcats = cat_info.get("subcategories", [])
-
-        if not subcats:
-            return 0.0
-
         # Calculate average score for each subcategory
-        sub_scores = []
-        for sub in subcats:
-            col = f"{category}_{sub}"
-            values = []
-            for r in responses:
-                val = r.get(col, "")
-                try:
-                    val_num = float(val)
-                    values.append(val_num)
-                except Exception:
-                    continue
-            if values:
-                sub_scores.append(statistics.mean(values))
-            else:
-                sub_scores.append(0.0)
+        sub_scores = self.calculate_subcategory_scores(responses, category)
 
         # Return overall category average
+        return self._average_subcategories(sub_scores)
+
+    def _average_subcategories(self, sub_scores):
         if sub_scores:
-            return float(round(statistics.mean(sub_scores), 2))
+            return float(round(statistics.mean(sub_scores.values()), 2))
         return 0.0
 
     def assess_maturity_level(self, score):
@@ -122,6 +153,44 @@ class SAMMAssessment:
                 return level, MATURITY_LEVELS.get(level, "Unknown")
         return 0, MATURITY_LEVELS.get(0, "Non-existent")
 
+    def bootstrap_confidence_intervals(self, responses, n_resamples=DEFAULT_RESAMPLES, confidence=DEFAULT_CONFIDENCE,
+                                       seed=None, workers=None):
+        """
+        Bootstrap confidence intervals for category and overall scores.
+
+        Args:
+            responses: SurveyDataset, survey DataFrame or list of response dictionaries
+            n_resamples: Number of bootstrap resamples
+            confidence: Confidence level (e.g. 0.95)
+            seed: Random seed for reproducible intervals
+            workers: Process count (None = automatic, see samm_bootstrap.py)
+
+        Returns:
+            Dict with per-category intervals and the overall interval, including
+            the maturity level range and the share of resamples at each level
+        """
+        result = bootstrap_scores(self._as_dataset(responses), n_resamples, confidence, seed, workers)
+
+        overall = result["overall"]
+        samples = np.round(overall.pop("samples"), 2)
+
+        # Maturity level per resample (same thresholds as assess_maturity_level)
+        levels = sorted(SCORING_THRESHOLDS)
+        bounds = [SCORING_THRESHOLDS[level] for level in levels]
+        sample_levels = np.maximum(np.searchsorted(bounds, samples, side="right") - 1, 0)
+        level_counts = np.bincount(sample_levels, minlength=len(levels))
+
+        low_num, low_name = self.assess_maturity_level(overall["ci_low"])
+        high_num, high_name = self.assess_maturity_level(overall["ci_high"])
+        overall["maturity_level_range"] = {
+            "low": {"level": low_num, "name": low_name},
+            "high": {"level": high_num, "name": high_name},
+        }
+        overall["level_distribution"] = {
+            levels[i]: round(float(count) / len(samples), 4) for i, count in enumerate(level_counts) if count
+        }
+        return result
+
     def generate_recommendations(self, category, score, level):
         """
         Generate improvement recommendations based on maturity level.
@@ -197,12 +266,15 @@ class SAMMAssessment:
         recs.append(f"Target Next Level: {next_level} - {next_name} (Current Score: {score})")
         return recs
 
-    def run_assessment(self, survey_file):
+    def run_assessment(self, survey_file, bootstrap_resamples=0, seed=None):
         """
         Run complete SAMM assessment.
 
         Args:
             survey_file: Path to survey data CSV
+            bootstrap_resamples: Add bootstrap confidence intervals using this
+                                 many resamples (0 = point estimates only)
+            seed: Random seed for the bootstrap
 
         Returns:
             Boolean indicating success
@@ -211,8 +283,8 @@ class SAMMAssessment:
         print("=" * 50)
 
         # Load survey data
-        responses = self.load_survey_data(survey_file)
-        if not responses:
+        responses = load_survey_dataset(survey_file)
+        if len(responses) == 0:
             print("No responses found in survey file.")
             return False
 
@@ -221,7 +293,8 @@ class SAMMAssessment:
         overall_weighted_score = 0.0
 
         for cat_key, cat_info in ASSESSMENT_CATEGORIES.items():
-            score = self.calculate_category_score(responses, cat_key)
+            sub_scores = self.calculate_subcategory_scores(responses, cat_key)
+            score = self._average_subcategories(sub_scores)
             level_num, level_name = self.assess_maturity_level(score)
 
             cat_recs = self.generate_recommendations(cat_key, score, level_num)
@@ -230,6 +303,7 @@ class SAMMAssessment:
                 "name": cat_info["name"],
                 "weight": cat_info["weight"],
                 "score": score,
+                "subcategory_scores": {sub: round(value, 2) for sub, value in sub_scores.items()},
                 "maturity_level": {
                     "level": level_num,
                     "name": level_name
@@ -257,10 +331,28 @@ class SAMMAssessment:
             "categories": category_results
         }
 
+        if bootstrap_resamples > 0:
+            boot = self.bootstrap_confidence_intervals(responses, bootstrap_resamples, seed=seed)
+            for cat_key, interval in boot["categories"].items():
+                category_results[cat_key]["confidence_interval"] = interval
+            self.results["overall"]["confidence_interval"] = boot["overall"]
+            self.results["bootstrap"] = {
+                "method": boot["method"],
+                "n_resamples": boot["n_resamples"],
+                "confidence": boot["confidence"],
+                "seed": boot["seed"],
+            }
+
         # Print summary
         print(f"Responses processed: {len(responses)}")
         print(f"Overall Weighted Score: {overall_weighted_score}")
         print(f"Overall Maturity Level: {overall_level_num} - {overall_level_name}")
+        if bootstrap_resamples > 0:
+            ci = self.results["overall"]["confidence_interval"]
+            level_range = ci["maturity_level_range"]
+            print(f"{round(self.results['bootstrap']['confidence'] * 100)}% CI (bootstrap, {bootstrap_resamples} resamples): "
+                  f"{ci['ci_low']} - {ci['ci_high']} "
+                  f"(levels {level_range['low']['level']}-{level_range['high']['level']})")
         print("=" * 50)
 
         return True
@@ -288,17 +380,23 @@ class SAMMAssessment:
 if __name__ == "__main__":
     # Parse command line arguments
     if len(sys.argv) < 2:
-        print("Usage: python3 samm_engine.py <survey_csv_file>")
+        print("Usage: python3 samm_engine.py <survey_csv_file> [--bootstrap N] [--seed S]")
         sys.exit(1)
 
     survey_file = sys.argv[1]
+    bootstrap_resamples = 0
+    seed = None
+    if "--bootstrap" in sys.argv:
+        bootstrap_resamples = int(sys.argv[sys.argv.index("--bootstrap") + 1])
+    if "--seed" in sys.argv:
+        seed = int(sys.argv[sys.argv.index("--seed") + 1])
     output_file = os.path.join(os.path.dirname(__file__), "..", "reports", "samm_results.json")
 
     # Create SAMMAssessment instance
     samm = SAMMAssessment()
 
     # Run assessment and save results
-    ok = samm.run_assessment(survey_file)
+    ok = samm.run_assessment(survey_file, bootstrap_resamples=bootstrap_resamples, seed=seed)
     if not ok:
         sys.exit(1)
 
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+On-disk Survey Cache
+Stores the typed survey frame as an Arrow IPC file next to the survey CSV.
+Later loads memory-map the Arrow file instead of parsing the CSV again.
+
+The cache is rebuilt when:
+- the CSV size changes
+- the CSV mtime changes and its SHA-256 no longer matches
+  (a touched but unchanged file only refreshes the stored mtime)
+- the cache format or the SAMM category list changes
+"""
+
+import hashlib
+import json
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "config"))
+from samm_config import ASSESSMENT_CATEGORIES  # noqa: E402
+
+
+CACHE_VERSION = 1
+CACHE_DIR_NAME = ".samm_cache"
+
+
+def cache_paths(csv_file, cache_dir=None):
+    """
+    Return (arrow_path, metadata_path) for a survey CSV.
+
+    Args:
+        csv_file: Path to the survey CSV
+        cache_dir: Cache directory (None = ".samm_cache" beside the CSV)
+    """
+    csv_file = os.path.abspath(csv_file)
+    cache_dir = cache_dir or os.path.join(os.path.dirname(csv_file), CACHE_DIR_NAME)
+    base = os.path.join(cache_dir, os.path.basename(csv_file))
+    return base + ".arrow", base + ".json"
+
+
+def file_sha256(path, block_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _expected_layout():
+    return {"version": CACHE_VERSION, "categories": sorted(ASSESSMENT_CATEGORIES)}
+
+
+def source_signature(csv_file):
+    """Size, mtime and content hash of the survey CSV."""
+    st = os.stat(csv_file)
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": file_sha256(csv_file)}
+
+
+def read_cached_frame(csv_file, cache_dir=None):
+    """
+    Load the cached survey frame for csv_file.
+
+    Returns:
+        DataFrame, or None when there is no valid cache for the current file
+    """
+    arrow_path, meta_path = cache_paths(csv_file, cache_dir)
+    if not (os.path.exists(arrow_path) and os.path.exists(meta_path)):
+        return None
+
+    with open(meta_path, "r", encoding="utf-8") as f:
+        meta = json.load(f)
+    if meta.get("layout") != _expected_layout():
+        return None
+
+    st = os.stat(csv_file)
+    source = meta.get("source", {})
+    if st.st_size != source.get("size"):
+        return None
+    if st.st_mtime_ns != source.get("mtime_ns"):
+        if file_sha256(csv_file) != source.get("sha256"):
+            return None
+        # Same content, new mtime: keep the cache, skip the hash next time
+        source["mtime_ns"] = st.st_mtime_ns
+        _write_json(meta_path, meta)
+
+    import pyarrow as pa
+
+    with pa.memory_map(arrow_path, "r") as mm:
+        table = pa.ipc.open_file(mm).read_all()
+    return table.to_pandas()
+
+
+def write_cached_frame(csv_file, frame, signature, cache_dir=None):
+    """
+    Write the typed survey frame and its source signature to the cache.
+
+    Args:
+        csv_file: Path to the survey CSV the frame was parsed from
+        frame: Typed survey DataFrame
+        signature: source_signature(csv_file) taken before parsing
+        cache_dir: Cache directory (None = ".samm_cache" beside the CSV)
+    """
+    import pyarrow as pa
+
+    arrow_path, meta_path = cache_paths(csv_file, cache_dir)
+    os.makedirs(os.path.dirname(arrow_path), exist_ok=True)
+
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    tmp_path = arrow_path + ".tmp"
+    with pa.OSFile(tmp_path, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    os.replace(tmp_path, arrow_path)
+
+    _write_json(meta_path, {"layout": _expected_layout(), "source": signature, "rows": len(frame)})
+
+
+def _write_json(path, payload):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2)
+    os.replace(tmp_path, path)
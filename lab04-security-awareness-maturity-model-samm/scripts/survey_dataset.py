@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Shared SAMM Survey Dataset
+Parses a survey CSV once into a typed DataFrame and caches the derived
+per-response score columns used by both the assessment engine and the
+data analyzer.
+"""
+
+import os
+import sys
+
+import pandas as pd
+
+# Make config importable (config/samm_config.py)
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "config"))
+from samm_config import ASSESSMENT_CATEGORIES, SURVEY_CACHE_ENABLED, SURVEY_CACHE_DIR  # noqa: E402
+import survey_cache  # noqa: E402
+
+
+META_COLUMNS = ["response_id", "timestamp", "department", "role_level", "years_experience"]
+
+# Declared dtypes for survey metadata; score columns are coerced to float64
+META_DTYPES = {
+    "response_id": str,
+    "timestamp": str,
+    "department": str,
+    "role_level": str,
+}
+
+SCORE_COLUMNS = [
+    f"{cat_key}_{sub}"
+    for cat_key, cat_info in ASSESSMENT_CATEGORIES.items()
+    for sub in cat_info["subcategories"]
+]
+
+
+class SurveyDataset:
+    """
+    Typed survey responses plus a cache of derived frames.
+
+    Score columns are the columns named "<category>_<question>"; every
+    one of them is float64, with blank or non-numeric cells as NaN.
+    Derived results (row means, column means, ...) are computed on first
+    use and cached by key.
+    """
+
+    def __init__(self, frame, source=None):
+        self.frame = coerce_score_columns(frame)
+        self.source = source
+        self._cache = {}
+
+    @classmethod
+    def from_csv(cls, csv_file):
+        if not os.path.exists(csv_file):
+            raise FileNotFoundError(f"Survey data file not found: {csv_file}")
+        frame = pd.read_csv(csv_file, dtype=META_DTYPES, keep_default_na=False, na_values=[""])
+        return cls(frame, source=csv_file)
+
+    @classmethod
+    def from_records(cls, records):
+        return cls(pd.DataFrame.from_records(list(records)))
+
+    def __len__(self):
+        return len(self.frame)
+
+    def cached(self, key, compute):
+        """Return the cached value for key, computing it with compute() on first use."""
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+    def score_columns(self):
+        return [c for c in self.frame.columns if _is_score_column(c)]
+
+    def category_columns(self):
+        """Score columns grouped by SAMM category (by column prefix)."""
+        score_cols = self.score_columns()
+        return {
+            cat: [c for c in score_cols if c.startswith(f"{cat}_")]
+            for cat in ASSESSMENT_CATEGORIES
+        }
+
+    def column_means(self):
+        """Mean of every score column (NaN cells skipped)."""
+        return self.cached("column_means", lambda: self.frame[self.score_columns()].mean())
+
+    def category_scores(self):
+        """Per-response category score (row mean of the category's columns), one column per category."""
+
+        def compute():
+            return pd.DataFrame(
+                {cat: self.frame[cols].mean(axis=1) for cat, cols in self.category_columns().items() if cols},
+                index=self.frame.index,
+            )
+
+        return self.cached("category_scores", compute)
+
+    def overall_scores(self):
+        """Per-response overall score (row mean of all score columns)."""
+        return self.cached("overall_scores", lambda: self.frame[self.score_columns()].mean(axis=1))
+
+
+def _is_score_column(name):
+    return any(str(name).startswith(f"{cat}_") for cat in ASSESSMENT_CATEGORIES)
+
+
+def coerce_score_columns(frame):
+    """Convert score columns to float64 in place (non-numeric cells become NaN)."""
+    for col in frame.columns:
+        if _is_score_column(col) and frame[col].dtype != "float64":
+            frame[col] = pd.to_numeric(frame[col], errors="coerce").astype("float64")
+    return frame
+
+
+# Datasets loaded in this process, keyed by absolute path
+_DATASETS = {}
+
+
+def load_survey_dataset(csv_file, use_cache=SURVEY_CACHE_ENABLED, cache_dir=SURVEY_CACHE_DIR):
+    """
+    Load a survey CSV, reusing the already parsed dataset when the same
+    unchanged file (same mtime and size) was loaded before in this process.
+
+    With use_cache, the typed frame is also kept in an on-disk Arrow cache
+    (see survey_cache.py), so later runs skip CSV parsing entirely.
+    """
+    path = os.path.abspath(csv_file)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Survey data file not found: {csv_file}")
+
+    st = os.stat(path)
+    signature = (st.st_mtime_ns, st.st_size)
+
+    entry = _DATASETS.get(path)
+    if entry is None or entry[0] != signature:
+        dataset = _load_cached(csv_file, cache_dir) if use_cache else SurveyDataset.from_csv(csv_file)
+        entry = (signature, dataset)
+        _DATASETS[path] = entry
+    return entry[1]
+
+
+def _load_cached(csv_file, cache_dir):
+    try:
+        frame = survey_cache.read_cached_frame(csv_file, cache_dir)
+        if frame is not None:
+            return SurveyDataset(frame, source=csv_file)
+        signature = survey_cache.source_signature(csv_file)
+    except (ImportError, OSError, ValueError) as e:
+        print(f"[WARN] Survey cache unavailable ({e}); parsing CSV directly.")
+        return SurveyDataset.from_csv(csv_file)
+
+    dataset = SurveyDataset.from_csv(csv_file)
+    try:
+        survey_cache.write_cached_frame(csv_file, dataset.frame, signature, cache_dir)
+    except (ImportError, OSError, ValueError) as e:
+        print(f"[WARN] Could not write survey cache ({e}).")
+    return dataset
@@ -59,6 +59,9 @@ nano filter_high_risk_roles.py
 chmod +x filter_high_risk_roles.py
 python3 filter_high_risk_roles.py
 
+# One-pass pipeline: score, full report and high-risk subset together
+python3 risk_pipeline.py organizational_roles.json cti_data.json --min-level HIGH
+
 # Priority list (one-liner)
 python3 -c "
 import json
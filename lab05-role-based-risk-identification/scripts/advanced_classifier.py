@@ -6,7 +6,18 @@ Students: Implement advanced classification features
 
 import json
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+
+from role_risk_analyzer import (
+    RoleRiskAnalyzer,
+    base_risk_scores,
+    build_cti_modifier_index,
+    classify_risk_levels,
+    cti_modifiers_for,
+    round2,
+)
 
 
 class AdvancedRiskClassifier:
@@ -28,6 +39,20 @@ class AdvancedRiskClassifier:
             "Customer Service": 1.0,
         }
 
+        # role_type -> CTI modifier, compiled from the CTI data it was built for.
+        # The cache is keyed on the identity of that dict: editing it in place
+        # is not detected, so call share_cti_index() again after changing it.
+        self.cti_modifiers: Dict[str, float] = {}
+        self._cti_source: Optional[Dict[str, Any]] = None
+
+    def share_cti_index(self, cti_data: Dict[str, Any], cti_modifiers: Dict[str, float]) -> None:
+        """Reuse an index already built for cti_data (e.g. RoleRiskAnalyzer.cti_modifiers).
+
+        Also the way to reload after cti_data has been modified in place.
+        """
+        self._cti_source = cti_data
+        self.cti_modifiers = cti_modifiers
+
     def _base_score(self, role_data: Dict[str, Any]) -> float:
         access_level = float(role_data.get("access_level", 0))
         data_sensitivity = float(role_data.get("data_sensitivity", 0))
@@ -43,21 +68,15 @@ class AdvancedRiskClassifier:
 
         return round(score, 2)
 
-    def _cti_modifier(self, role_type: str, cti_data: Dict[str, Any]) -> float:
-        modifier = 1.0
-
-        for cat, threats in cti_data.items():
-            if not isinstance(threats, list):
-                continue
-
-            for threat in threats:
-                targets = threat.get("target_roles", [])
-                severity = float(threat.get("severity", 0))
-
-                if role_type in targets:
-                    modifier += severity * 0.1
+    def _cti_index(self, cti_data: Dict[str, Any]) -> Dict[str, float]:
+        # Compile the index once per CTI data object, not once per role
+        if cti_data is not self._cti_source:
+            self.cti_modifiers = build_cti_modifier_index(cti_data)
+            self._cti_source = cti_data
+        return self.cti_modifiers
 
-        return modifier
+    def _cti_modifier(self, role_type: str, cti_data: Dict[str, Any]) -> float:
+        return self._cti_index(cti_data).get(role_type, 1.0)
 
     def calculate_advanced_risk_score(self, role_data, cti_data):
         """
@@ -80,6 +99,25 @@ class AdvancedRiskClassifier:
 
         return round(score, 2)
 
+    def calculate_advanced_risk_scores(self, frame, cti_data):
+        """
+        Vectorized calculate_advanced_risk_score() over a roles_to_frame() frame.
+
+        Returns:
+            Float array of advanced risk scores, in frame order
+        """
+        base = base_risk_scores(frame)
+        dept_mult = frame["department"].map(self.department_multipliers).astype(float).fillna(1.0).to_numpy()
+
+        mod = cti_modifiers_for(frame, self._cti_index(cti_data))
+
+        return round2(np.minimum(base * dept_mult * mod, 100.0))
+
+    def classify_risk_levels(self, scores):
+        """Vectorized _risk_level_from_score() using self.risk_thresholds."""
+        thresholds = [(lvl, self.risk_thresholds[lvl]) for lvl in ("CRITICAL", "HIGH", "MEDIUM", "LOW")]
+        return classify_risk_levels(scores, thresholds)
+
     def identify_risk_factors(self, role_data):
         """
         Identify specific risk factors for a role.
@@ -185,14 +223,14 @@ def run_advanced_classification():
         print(f"[ERROR] Failed to load organizational_roles.json: {e}")
         return
 
-    try:
-        with open("cti_data.json", "r", encoding="utf-8") as f:
-            cti = json.load(f)
-    except Exception as e:
-        print(f"[ERROR] Failed to load cti_data.json: {e}")
+    # Load CTI through the analyzer so its modifier index is built only once
+    analyzer = RoleRiskAnalyzer()
+    if not analyzer.load_cti_data("cti_data.json"):
         return
+    cti = analyzer.cti_data
 
     classifier = AdvancedRiskClassifier()
+    classifier.share_cti_index(cti, analyzer.cti_modifiers)
 
     results: Dict[str, Any] = {}
     scores = []
@@ -41,13 +41,24 @@ def filter_high_risk_roles(report_file, threshold=60):
     # Sort by score (descending)
     filtered.sort(key=lambda x: float(x[1].get("final_score", 0)), reverse=True)
 
-    # Print formatted results
+    print_high_risk_roles(filtered, threshold)
+
+
+def print_high_risk_roles(filtered, threshold, limit=None):
+    """
+    Print high-risk roles as a ranked table.
+
+    Args:
+        filtered: (role_id, info) pairs, already sorted by score (descending)
+        threshold: Minimum risk score the roles were filtered by
+        limit: Print only the first N rows (None = all)
+    """
     print(f"\nHigh-Risk Roles (final_score >= {threshold})")
     print("=" * 70)
     print(f"{'Rank':<6}{'Role Name':<30}{'Department':<20}{'Score':<8}{'Level':<10}")
     print("-" * 70)
 
-    for idx, (role_id, info) in enumerate(filtered, start=1):
+    for idx, (role_id, info) in enumerate(filtered[:limit], start=1):
         print(
             f"{idx:<6}"
             f"{info.get('role_name', 'Unknown'):<30}"
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Role Risk Pipeline
+Loads roles in chunks, scores them, filters high-risk roles and writes the
+full report and the high-risk subset in a single pass (no second pass over
+the report JSON as with run_analysis.py + filter_high_risk_roles.py).
+
+Usage:
+    python3 risk_pipeline.py [roles.json|roles.jsonl] [cti_data.json]
+        [--min-level HIGH] [--format json|compact|jsonl]
+        [--chunk-size N] [--workers N] [--raw]
+
+A .jsonl roles file holds one {"role_id": ..., <role fields>} object per
+line and is read chunk by chunk; a .json file is the usual role_id -> role map.
+"""
+
+import itertools
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from filter_high_risk_roles import print_high_risk_roles
+from role_risk_analyzer import (
+    REPORT_BUFFER_SIZE,
+    REPORT_FORMATS,
+    RISK_LEVEL_THRESHOLDS,
+    build_cti_modifier_index,
+    roles_to_frame,
+    score_roles_frame,
+    summarize_scores,
+    write_report_stream,
+)
+
+
+DEFAULT_CHUNK_SIZE = 10_000
+
+# Use a process pool from this many roles on (below it one process is faster)
+PARALLEL_MIN_ROLES = 50_000
+
+RoleRecord = Tuple[str, Dict[str, Any]]
+
+
+def level_threshold(level: str) -> float:
+    """Minimum final score for a risk level (e.g. HIGH -> 60, MINIMAL -> 0)."""
+    thresholds = RISK_LEVEL_THRESHOLDS + [("MINIMAL", 0)]
+    for name, minimum in thresholds:
+        if name == level.upper():
+            return minimum
+    raise ValueError(f"Unknown risk level: {level} (expected one of {', '.join(n for n, _ in thresholds)})")
+
+
+def _count_lines(path: str) -> int:
+    with open(path, "rb") as f:
+        return sum(block.count(b"\n") for block in iter(lambda: f.read(1 << 20), b""))
+
+
+def _chunked(items, chunk_size: int) -> Iterator[List[RoleRecord]]:
+    items = iter(items)
+    while True:
+        chunk = list(itertools.islice(items, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _jsonl_roles(roles_file: str) -> Iterator[RoleRecord]:
+    with open(roles_file, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                role = json.loads(line)
+                yield str(role.pop("role_id")), role
+
+
+def open_role_chunks(roles_file: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Tuple[int, Iterator[List[RoleRecord]]]:
+    """
+    Return (approximate role count, iterator over lists of (role_id, role_data)).
+
+    .jsonl files are read lazily, chunk_size roles at a time (the count is
+    the line count); .json maps are loaded whole and sliced into chunks.
+    Raises ValueError if a .json file does not hold a role_id -> role map.
+    """
+    if roles_file.endswith(".jsonl"):
+        return _count_lines(roles_file), _chunked(_jsonl_roles(roles_file), chunk_size)
+
+    with open(roles_file, "r", encoding="utf-8") as f:
+        roles = json.load(f)
+    if not isinstance(roles, dict):
+        raise ValueError(f"expected a role_id -> role map, got {type(roles).__name__}")
+    return len(roles), _chunked(roles.items(), chunk_size)
+
+
+# Worker state: CTI index and report options, set once per process
+_WORKER: Dict[str, Any] = {}
+
+
+def _init_worker(cti_modifiers: Optional[Dict[str, float]], include_raw: bool) -> None:
+    _WORKER["cti_modifiers"] = cti_modifiers
+    _WORKER["include_raw"] = include_raw
+
+
+def _score_chunk(chunk: List[RoleRecord]) -> List[RoleRecord]:
+    """Score one chunk of roles; returns (role_id, report record) pairs in input order."""
+    frame = score_roles_frame(roles_to_frame(chunk), _WORKER["cti_modifiers"])
+    base_scores = frame["base_score"].tolist()
+    final_scores = frame["final_score"].tolist()
+    risk_levels = frame["risk_level"].tolist()
+    analyzed_at = datetime.now().isoformat()
+    include_raw = _WORKER["include_raw"]
+
+    records = []
+    for (role_id, role), base, final, level in zip(chunk, base_scores, final_scores, risk_levels):
+        record = {
+            "role_name": role.get("name", "Unknown"),
+            "role_type": role.get("type", "unknown"),
+            "department": role.get("department", "Unknown"),
+            "base_score": base,
+            "final_score": final,
+            "risk_level": level,
+            "analyzed_at": analyzed_at,
+        }
+        if include_raw:
+            record["raw_attributes"] = role
+        records.append((role_id, record))
+    return records
+
+
+def score_chunks(chunks, cti_modifiers, include_raw=False, workers=1) -> Iterator[List[RoleRecord]]:
+    """
+    Score chunks in order, serially or across a process pool.
+
+    At most 2 * workers chunks are in flight, so memory stays bounded
+    however large the input is.
+    """
+    if workers <= 1:
+        _init_worker(cti_modifiers, include_raw)
+        for chunk in chunks:
+            yield _score_chunk(chunk)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(cti_modifiers, include_raw)) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(_score_chunk, chunk))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def run_pipeline(
+    roles_file: str,
+    cti_file: Optional[str],
+    report_file: str,
+    high_risk_file: str,
+    min_level: str = "HIGH",
+    fmt: str = "json",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: Optional[int] = None,
+    include_raw: bool = False,
+) -> Optional[List[RoleRecord]]:
+    """
+    Score every role and write the full report and the high-risk subset.
+
+    Args:
+        roles_file: Roles .json map or .jsonl file
+        cti_file: CTI JSON (None = no CTI modifiers)
+        report_file: Full report path
+        high_risk_file: High-risk subset report path
+        min_level: Lowest risk level kept in the high-risk subset
+        fmt: Report format, see write_report_stream()
+        chunk_size: Roles scored per chunk
+        workers: Process count (None = all cores for large inputs, 1 otherwise)
+        include_raw: Include each role's raw_attributes in the reports
+
+    Returns:
+        High-risk (role_id, record) pairs sorted by score, or None on error
+    """
+    if fmt not in REPORT_FORMATS:
+        print(f"[ERROR] Unknown report format: {fmt} (expected one of {', '.join(REPORT_FORMATS)})")
+        return None
+    try:
+        threshold = level_threshold(min_level)
+    except ValueError as e:
+        print(f"[ERROR] {e}")
+        return None
+
+    cti_modifiers = None
+    if cti_file:
+        try:
+            with open(cti_file, "r", encoding="utf-8") as f:
+                cti_data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError) as e:
+            print(f"[ERROR] Failed to load CTI data {cti_file}: {e}")
+            return None
+        cti_modifiers = build_cti_modifier_index(cti_data) if cti_data else None
+
+    try:
+        total, chunks = open_role_chunks(roles_file, chunk_size)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"[ERROR] Failed to load roles {roles_file}: {e}")
+        return None
+
+    if workers is None:
+        workers = (os.cpu_count() or 1) if total >= PARALLEL_MIN_ROLES else 1
+
+    scores: List[float] = []
+    levels: List[str] = []
+    high_risk: List[RoleRecord] = []
+
+    def scored_records():
+        for records in score_chunks(chunks, cti_modifiers, include_raw, workers):
+            for role_id, record in records:
+                scores.append(record["final_score"])
+                levels.append(record["risk_level"])
+                if record["final_score"] >= threshold:
+                    high_risk.append((role_id, record))
+            yield from records
+
+    start = time.perf_counter()
+    header = {"generated_at": datetime.now().isoformat()}
+    try:
+        with open(report_file, "w", encoding="utf-8", buffering=REPORT_BUFFER_SIZE) as f:
+            write_report_stream(f, header, scored_records(), fmt,
+                                trailer=lambda: {"summary": summarize_scores(scores, levels)})
+    except (OSError, ValueError, KeyError) as e:
+        print(f"[ERROR] Risk pipeline failed: {e}")
+        return None
+
+    high_risk.sort(key=lambda item: item[1]["final_score"], reverse=True)
+    subset_header = dict(header, min_level=min_level.upper(), min_score=threshold,
+                         summary=summarize_scores([r["final_score"] for _, r in high_risk],
+                                                  [r["risk_level"] for _, r in high_risk]))
+    try:
+        with open(high_risk_file, "w", encoding="utf-8", buffering=REPORT_BUFFER_SIZE) as f:
+            write_report_stream(f, subset_header, high_risk, fmt)
+    except (OSError, ValueError) as e:
+        print(f"[ERROR] Failed to write high-risk subset: {e}")
+        return None
+    elapsed = time.perf_counter() - start
+
+    report_bytes = os.path.getsize(report_file) + os.path.getsize(high_risk_file)
+    rate = report_bytes / elapsed if elapsed > 0 else float("inf")
+    print(f"[INFO] Scored {len(scores):,} roles in {elapsed:.2f}s with {workers} worker(s)")
+    print(f"[INFO] Full report: {report_file}")
+    print(f"[INFO] High-risk subset ({len(high_risk):,} roles >= {threshold}): {high_risk_file}")
+    print(f"[INFO] Wrote {report_bytes:,} bytes ({rate / (1024 * 1024):.1f} MB/s)")
+    return high_risk
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    options = {"--min-level": "HIGH", "--format": "json", "--chunk-size": DEFAULT_CHUNK_SIZE, "--workers": None}
+    include_raw = "--raw" in args
+    positional = []
+    i = 0
+    while i < len(args):
+        if args[i] in options and i + 1 < len(args):
+            options[args[i]] = args[i + 1]
+            i += 2
+        elif args[i] == "--raw":
+            i += 1
+        else:
+            positional.append(args[i])
+            i += 1
+
+    roles_file = positional[0] if positional else "organizational_roles.json"
+    cti_file = positional[1] if len(positional) > 1 else "cti_data.json"
+    fmt = options["--format"]
+    ext = "jsonl" if fmt == "jsonl" else "json"
+
+    high_risk = run_pipeline(
+        roles_file,
+        cti_file,
+        f"comprehensive_risk_report.{ext}",
+        f"high_risk_roles.{ext}",
+        min_level=options["--min-level"],
+        fmt=fmt,
+        chunk_size=int(options["--chunk-size"]),
+        workers=int(options["--workers"]) if options["--workers"] else None,
+        include_raw=include_raw,
+    )
+    if high_risk is None:
+        sys.exit(1)
+    print_high_risk_roles(high_risk, level_threshold(options["--min-level"]), limit=20)
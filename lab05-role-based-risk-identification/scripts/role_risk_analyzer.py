@@ -5,17 +5,225 @@ Students: Complete the TODO sections
 """
 
 import json
+import os
+import time
 import pandas as pd
 import numpy as np
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Callable, Iterable, List, Optional, TextIO, Tuple
+
+
+# Role attributes used by the base risk score (1-5 scale), with their weights
+ROLE_ATTRIBUTE_WEIGHTS: List[Tuple[str, float]] = [
+    ("access_level", 0.3),
+    ("data_sensitivity", 0.25),
+    ("external_exposure", 0.25),
+    ("privilege_level", 0.2),
+]
+
+# (level, minimum score), highest first; anything lower is MINIMAL
+RISK_LEVEL_THRESHOLDS: List[Tuple[str, float]] = [
+    ("CRITICAL", 80),
+    ("HIGH", 60),
+    ("MEDIUM", 40),
+    ("LOW", 20),
+]
+
+
+def build_cti_modifier_index(cti_data: Dict[str, Any]) -> Dict[str, float]:
+    """
+    Compile CTI threat data into a role_type -> modifier index.
+
+    Each threat targeting a role type adds severity * 0.1 to that role
+    type's modifier (starting at 1.0); role types no threat targets are
+    absent and use 1.0. Threats are summed in file order, so the result
+    is identical to scanning every threat for each role.
+    """
+    index: Dict[str, float] = {}
+
+    for category_name, threats in cti_data.items():
+        if not isinstance(threats, list):
+            continue
+
+        for threat in threats:
+            target_roles = threat.get("target_roles", [])
+            severity = float(threat.get("severity", 0))
+
+            for role_type in dict.fromkeys(target_roles):
+                index[role_type] = index.get(role_type, 1.0) + severity * 0.1
+
+    return index
+
+
+REPORT_FORMATS = ("json", "compact", "jsonl")
+REPORT_BUFFER_SIZE = 1 << 20
+
+
+def write_report_stream(
+    f: TextIO,
+    header: Dict[str, Any],
+    records: Iterable[Tuple[str, Dict[str, Any]]],
+    fmt: str = "json",
+    trailer: Optional[Callable[[], Dict[str, Any]]] = None,
+) -> None:
+    """
+    Write a risk report incrementally: header fields first, then one role
+    record at a time.
+
+    "json" produces exactly what json.dump(report, f, indent=2) would for
+    {**header, "detailed_analysis": dict(records)}; "compact" is the same
+    document without whitespace; "jsonl" writes the header as the first
+    line and then one {"role_id": ..., **record} object per line.
+
+    trailer, if given, is called once all records are written and its
+    fields are appended after "detailed_analysis" (jsonl: as a last line),
+    for values such as a summary that are only known at the end.
+    """
+    if fmt == "jsonl":
+        encode = json.JSONEncoder().encode
+        f.write(encode(header) + "\n")
+        for role_id, record in records:
+            f.write(encode({"role_id": role_id, **record}) + "\n")
+        if trailer is not None:
+            f.write(encode(trailer()) + "\n")
+        return
+
+    if fmt == "compact":
+        encode = json.JSONEncoder(separators=(",", ":")).encode
+        f.write("{" + ",".join(f"{encode(k)}:{encode(v)}" for k, v in header.items()))
+        f.write(("," if header else "") + '"detailed_analysis":{')
+        sep = ""
+        for role_id, record in records:
+            f.write(f"{sep}{encode(role_id)}:{encode(record)}")
+            sep = ","
+        f.write("}")
+        for key, value in (trailer() if trailer is not None else {}).items():
+            f.write(f",{encode(key)}:{encode(value)}")
+        f.write("}")
+        return
+
+    # Indented: nest each piece by its depth so the output matches json.dump(indent=2)
+    encode = json.JSONEncoder(indent=2).encode
+    f.write("{")
+    for key, value in header.items():
+        f.write(f"\n  {encode(key)}: " + encode(value).replace("\n", "\n  ") + ",")
+    f.write('\n  "detailed_analysis": {')
+    sep = ""
+    for role_id, record in records:
+        f.write(f"{sep}\n    {encode(role_id)}: " + encode(record).replace("\n", "\n    "))
+        sep = ","
+    f.write("\n  }" if sep else "}")
+    for key, value in (trailer() if trailer is not None else {}).items():
+        f.write(f",\n  {encode(key)}: " + encode(value).replace("\n", "\n  "))
+    f.write("\n}")
+
+
+def round2(values):
+    """
+    Round a score array to 2 decimals with the same result as round(x, 2)
+    on every element (np.round alone can differ on exact half-cent ties).
+    """
+    rounded = np.round(values, 2)
+    scaled = np.abs(values) * 100.0
+    near_half = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if near_half.any():
+        rounded[near_half] = [round(v, 2) for v in values[near_half].tolist()]
+    return rounded
+
+
+def roles_to_frame(roles_data) -> pd.DataFrame:
+    """
+    Load role records into a typed frame indexed by role_id.
+
+    roles_data is a role_id -> role map or a list of (role_id, role) pairs
+    (kept as given, one row per pair).
+
+    Name is a string column, type and department are categoricals, and the
+    ROLE_ATTRIBUTE_WEIGHTS attributes are float64 (missing attributes are 0).
+    Other role fields are not copied.
+    """
+    pairs = list(roles_data.items()) if isinstance(roles_data, dict) else list(roles_data)
+    records = [role for _, role in pairs]
+    frame = pd.DataFrame(
+        {
+            "role_name": [r.get("name", "Unknown") for r in records],
+            "role_type": pd.Categorical([r.get("type", "unknown") for r in records]),
+            "department": pd.Categorical([r.get("department", "Unknown") for r in records]),
+        },
+        index=pd.Index([role_id for role_id, _ in pairs], name="role_id"),
+    )
+    for attr, _ in ROLE_ATTRIBUTE_WEIGHTS:
+        frame[attr] = np.array([r.get(attr, 0) for r in records], dtype=float)
+    return frame
+
+
+def base_risk_scores(frame: pd.DataFrame) -> np.ndarray:
+    """Vectorized calculate_base_risk_score() over a roles_to_frame() frame."""
+    total = np.zeros(len(frame))
+    for attr, weight in ROLE_ATTRIBUTE_WEIGHTS:
+        total = total + frame[attr].to_numpy() * weight
+    return round2(total * 10.0)
+
+
+def cti_modifiers_for(frame: pd.DataFrame, cti_modifiers: Dict[str, float]) -> np.ndarray:
+    """CTI modifier per role, looked up once per distinct role type."""
+    return frame["role_type"].map(cti_modifiers).astype(float).fillna(1.0).to_numpy()
+
+
+def classify_risk_levels(scores, thresholds: List[Tuple[str, float]] = RISK_LEVEL_THRESHOLDS) -> np.ndarray:
+    """Vectorized classify_risk_level()."""
+    scores = np.asarray(scores)
+    return np.select(
+        [scores >= minimum for _, minimum in thresholds],
+        [level for level, _ in thresholds],
+        default="MINIMAL",
+    ).astype(object)
+
+
+def summarize_scores(scores, levels: Iterable[str]) -> Dict[str, Any]:
+    """Report summary: role count, average/min/max final score and level distribution."""
+    scores = np.asarray(scores, dtype=float)
+    risk_dist: Dict[str, int] = {}
+    for lvl in levels:
+        risk_dist[lvl] = risk_dist.get(lvl, 0) + 1
+
+    return {
+        "total_roles": len(scores),
+        "average_score": round(float(np.mean(scores)), 2) if len(scores) else 0.0,
+        "min_score": round(float(np.min(scores)), 2) if len(scores) else 0.0,
+        "max_score": round(float(np.max(scores)), 2) if len(scores) else 0.0,
+        "risk_level_distribution": risk_dist,
+    }
+
+
+def score_roles_frame(frame: pd.DataFrame, cti_modifiers: Optional[Dict[str, float]] = None) -> pd.DataFrame:
+    """
+    Add base_score, final_score and risk_level columns to a roles_to_frame() frame.
+
+    Args:
+        frame: Typed roles frame
+        cti_modifiers: role_type -> modifier index (None = no CTI data, final = base)
+    """
+    frame["base_score"] = base_risk_scores(frame)
+
+    if cti_modifiers is not None:
+        modifiers = cti_modifiers_for(frame, cti_modifiers)
+        frame["final_score"] = round2(np.minimum(frame["base_score"].to_numpy() * modifiers, 100.0))
+    else:
+        frame["final_score"] = frame["base_score"]
+
+    frame["risk_level"] = classify_risk_levels(frame["final_score"].to_numpy())
+    return frame
 
 
 class RoleRiskAnalyzer:
     def __init__(self):
         self.roles_data: Dict[str, Any] = {}
         self.cti_data: Dict[str, Any] = {}
+        self.cti_modifiers: Dict[str, float] = {}
         self.risk_scores: Dict[str, Any] = {}
+        self.risk_frame: pd.DataFrame = pd.DataFrame()
+        self.report_stats: Dict[str, float] = {}
 
     def load_organizational_data(self, roles_file):
         """
@@ -63,6 +271,7 @@ class RoleRiskAnalyzer:
                 data = json.load(f)
 
             self.cti_data = data
+            self.cti_modifiers = build_cti_modifier_index(data)
             print(f"[INFO] Loaded CTI data categories: {len(self.cti_data)} categories")
             return True
 
@@ -103,22 +312,13 @@ class RoleRiskAnalyzer:
     def apply_cti_modifiers(self, base_score, role_type):
         """
         Apply CTI-based risk modifiers to base score.
+
+        The modifier comes from the role_type index built by load_cti_data().
         """
         if not self.cti_data:
             return base_score
 
-        modifier = 1.0
-
-        for category_name, threats in self.cti_data.items():
-            if not isinstance(threats, list):
-                continue
-
-            for threat in threats:
-                target_roles = threat.get("target_roles", [])
-                severity = float(threat.get("severity", 0))
-
-                if role_type in target_roles:
-                    modifier += severity * 0.1
+        modifier = self.cti_modifiers.get(role_type, 1.0)
 
         modified_score = base_score * modifier
 
@@ -153,6 +353,7 @@ class RoleRiskAnalyzer:
         print("\n[INFO] Starting role-based risk analysis...")
 
         self.risk_scores = {}
+        self.risk_frame = pd.DataFrame()  # drop any earlier columnar results
 
         for role_id, info in self.roles_data.items():
             role_name = info.get("name", "Unknown")
@@ -177,55 +378,110 @@ class RoleRiskAnalyzer:
         print(f"[INFO] Risk analysis complete. Roles analyzed: {len(self.risk_scores)}")
         return True
 
-    def generate_risk_report(self, output_file="risk_report.json"):
+    def analyze_roles_columnar(self):
+        """
+        Analyze all loaded roles with vector operations.
+
+        Scores match analyze_all_roles(), but results are kept in one frame
+        (self.risk_frame, indexed by role_id) with the role attributes that
+        feed the score instead of a copy of every raw role record.
+
+        Returns:
+            DataFrame with role_name, role_type, department, the score
+            attributes, base_score, final_score, risk_level and analyzed_at
+        """
+        if not self.roles_data:
+            print("[ERROR] No role data loaded")
+            return None
+
+        frame = score_roles_frame(roles_to_frame(self.roles_data), self.cti_modifiers if self.cti_data else None)
+        frame["analyzed_at"] = datetime.now().isoformat()
+
+        self.risk_frame = frame
+        self.risk_scores = {}  # drop any earlier per-role results
+        print(f"[INFO] Columnar risk analysis complete. Roles analyzed: {len(frame)}")
+        return frame
+
+    def _report_scores(self):
+        """Final scores and risk levels of the current analysis (per-role dicts or risk_frame)."""
+        if self.risk_scores:
+            scores = np.fromiter((v["final_score"] for v in self.risk_scores.values()), dtype=float)
+            levels = [v["risk_level"] for v in self.risk_scores.values()]
+        else:
+            scores = self.risk_frame["final_score"].to_numpy(dtype=float)
+            levels = self.risk_frame["risk_level"].tolist()
+        return scores, levels
+
+    def _report_records(self, include_raw=True):
+        """Yield (role_id, record) pairs one at a time, without building the full report."""
+        if self.risk_scores:
+            for role_id, info in self.risk_scores.items():
+                if include_raw:
+                    yield role_id, info
+                else:
+                    yield role_id, {k: v for k, v in info.items() if k != "raw_attributes"}
+            return
+
+        columns = ["role_name", "role_type", "department", "base_score", "final_score", "risk_level", "analyzed_at"]
+        for row in self.risk_frame[columns].itertuples(name=None):
+            role_id, *values = row
+            yield role_id, dict(zip(columns, values))
+
+    def generate_risk_report(self, output_file="risk_report.json", fmt="json", include_raw=True):
         """
         Generate comprehensive risk report.
+
+        The summary header is written first, then each role record as it is
+        serialized, so memory stays flat however many roles there are.
+
+        Args:
+            output_file: Report path
+            fmt: "json" (indented, same layout as before), "compact" (JSON
+                without indentation) or "jsonl" (summary line, then one role
+                record per line with its role_id)
+            include_raw: Include each role's raw_attributes (per-role analysis only)
+
+        Returns:
+            Boolean indicating success
         """
-        if not self.risk_scores:
+        if not self.risk_scores and self.risk_frame.empty:
             print("[ERROR] No risk analysis data available")
             return False
+        if fmt not in REPORT_FORMATS:
+            print(f"[ERROR] Unknown report format: {fmt} (expected one of {', '.join(REPORT_FORMATS)})")
+            return False
 
-        scores = [v["final_score"] for v in self.risk_scores.values()]
-        avg_score = round(float(np.mean(scores)), 2) if scores else 0.0
-        min_score = round(float(np.min(scores)), 2) if scores else 0.0
-        max_score = round(float(np.max(scores)), 2) if scores else 0.0
-
-        risk_dist = {}
-        for v in self.risk_scores.values():
-            lvl = v["risk_level"]
-            risk_dist[lvl] = risk_dist.get(lvl, 0) + 1
-
-        report = {
+        scores, levels = self._report_scores()
+        header = {
             "generated_at": datetime.now().isoformat(),
-            "summary": {
-                "total_roles": len(self.risk_scores),
-                "average_score": avg_score,
-                "min_score": min_score,
-                "max_score": max_score,
-                "risk_level_distribution": risk_dist,
-            },
-            "detailed_analysis": self.risk_scores,
+            "summary": summarize_scores(scores, levels),
         }
 
         try:
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(report, f, indent=2)
-            print(f"[INFO] Risk report saved to {output_file}")
-            return True
+            start = time.perf_counter()
+            with open(output_file, "w", encoding="utf-8", buffering=REPORT_BUFFER_SIZE) as f:
+                write_report_stream(f, header, self._report_records(include_raw), fmt)
+            elapsed = time.perf_counter() - start
         except Exception as e:
             print(f"[ERROR] Failed to save report: {e}")
             return False
 
+        size = os.path.getsize(output_file)
+        rate = size / elapsed if elapsed > 0 else float("inf")
+        self.report_stats = {"bytes": size, "seconds": round(elapsed, 4), "bytes_per_sec": round(rate, 1)}
+        print(f"[INFO] Risk report saved to {output_file} ({size:,} bytes, {rate / (1024 * 1024):.1f} MB/s)")
+        return True
+
     def display_top_risks(self, top_n=10):
         """
-        Display top N highest risk roles.
+        Display top N highest risk roles (from either analysis mode).
         """
-        if not self.risk_scores:
+        if not self.risk_scores and self.risk_frame.empty:
             print("[ERROR] No risk analysis data available")
             return
 
         sorted_roles = sorted(
-            self.risk_scores.items(),
+            self._report_records(include_raw=False),
             key=lambda x: x[1]["final_score"],
             reverse=True
         )
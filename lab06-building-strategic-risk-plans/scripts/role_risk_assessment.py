@@ -8,7 +8,23 @@ import pandas as pd
 import json
 import numpy as np
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
+
+
+# Priority levels as (name, minimum score), highest first; anything lower is "low"
+PRIORITY_THRESHOLDS: List[Tuple[str, float]] = [
+    ("critical", 8.0),
+    ("high", 6.0),
+    ("medium", 4.0),
+]
+
+PRIMARY_RISK_MULTIPLIER = 1.3
+MAX_RISK_SCORE = 10.0
+
+
+def _round2(values):
+    """Round the score matrix cell by cell with round(x, 2), like calculate_role_risk_score()."""
+    return np.array([round(v, 2) for v in values.ravel().tolist()], dtype=float).reshape(values.shape)
 
 
 class RoleBasedRiskAssessment:
@@ -50,6 +66,28 @@ class RoleBasedRiskAssessment:
             "unsecured_devices": {"financial": 5, "operational": 6, "reputational": 4, "legal": 3},
         }
 
+        # Mean impact per risk type for the matrix path, keyed on the matrix contents
+        self._impact_means: Dict[str, float] = {}
+        self._impact_signature = None
+
+    def _impact_matrix_signature(self):
+        return tuple((risk, tuple(impacts.values())) for risk, impacts in self.risk_impact_matrix.items())
+
+    def impact_means(self):
+        """
+        Mean impact across dimensions for every risk type.
+
+        Cached between calls and recomputed whenever risk_impact_matrix
+        (reassigned or edited in place) no longer matches the cache.
+        """
+        signature = self._impact_matrix_signature()
+        if signature != self._impact_signature:
+            self._impact_means = {
+                risk: float(np.mean(list(impacts.values()))) for risk, impacts in self.risk_impact_matrix.items()
+            }
+            self._impact_signature = signature
+        return self._impact_means
+
     def calculate_role_risk_score(self, role, risk_type):
         """
         Calculate risk score for specific role and risk type.
@@ -69,11 +107,11 @@ class RoleBasedRiskAssessment:
 
         # Check if primary risk (multiply by 1.3 if yes)
         if risk_type in self.organizational_roles[role]["primary_risks"]:
-            score *= 1.3
+            score *= PRIMARY_RISK_MULTIPLIER
 
         # Cap at 10.0
-        if score > 10.0:
-            score = 10.0
+        if score > MAX_RISK_SCORE:
+            score = MAX_RISK_SCORE
 
         return round(score, 2)
 
@@ -92,31 +130,70 @@ class RoleBasedRiskAssessment:
         else:
             return "low"
 
+    def calculate_risk_score_matrix(self):
+        """
+        Score every role against every risk type at once.
+
+        The mean impact vector (risks) and role weight vector (roles) are
+        broadcast into a roles x risks matrix; the primary-risk mask applies
+        the 1.3 multiplier before capping and rounding, exactly as
+        calculate_role_risk_score() does per cell.
+
+        Returns:
+            Tuple of (role names, risk types, scores [roles x risks], primary-risk mask)
+        """
+        roles = list(self.organizational_roles.keys())
+        means = self.impact_means()
+        risk_types = list(means.keys())
+        risk_index = {risk: j for j, risk in enumerate(risk_types)}
+
+        mean_impacts = np.array([means[risk] for risk in risk_types], dtype=float)
+        weights = np.array([float(self.organizational_roles[role]["risk_weight"]) for role in roles], dtype=float)
+
+        primary = np.zeros((len(roles), len(risk_types)), dtype=bool)
+        for i, role in enumerate(roles):
+            cols = [risk_index[r] for r in self.organizational_roles[role]["primary_risks"] if r in risk_index]
+            primary[i, cols] = True
+
+        scores = mean_impacts[None, :] * weights[:, None]
+        scores = np.where(primary, scores * PRIMARY_RISK_MULTIPLIER, scores)
+        scores = _round2(np.minimum(scores, MAX_RISK_SCORE))
+
+        return roles, risk_types, scores, primary
+
+    def get_priority_levels(self, scores):
+        """Vectorized get_priority_level() over an array of scores."""
+        scores = np.asarray(scores)
+        return np.select(
+            [scores >= minimum for _, minimum in PRIORITY_THRESHOLDS],
+            [level for level, _ in PRIORITY_THRESHOLDS],
+            default="low",
+        ).astype(object)
+
     def generate_role_risk_matrix(self):
         """
         Generate comprehensive role-risk assessment matrix.
 
         Returns:
-            DataFrame with role-risk combinations
+            DataFrame with role-risk combinations (role-major order)
         """
-        assessment_data = []
-
-        for role in self.organizational_roles.keys():
-            for risk_type in self.risk_impact_matrix.keys():
-                score = self.calculate_role_risk_score(role, risk_type)
-                priority = self.get_priority_level(score)
-
-                assessment_data.append({
-                    "role": role,
-                    "access_level": self.organizational_roles[role]["access_level"],
-                    "target_value": self.organizational_roles[role]["target_value"],
-                    "risk_type": risk_type,
-                    "risk_score": score,
-                    "priority_level": priority,
-                    "is_primary_risk": risk_type in self.organizational_roles[role]["primary_risks"],
-                })
-
-        return pd.DataFrame(assessment_data)
+        roles, risk_types, scores, primary = self.calculate_risk_score_matrix()
+        n_risks = len(risk_types)
+        flat_scores = scores.ravel()
+
+        return pd.DataFrame({
+            "role": np.repeat(np.array(roles, dtype=object), n_risks),
+            "access_level": np.repeat(
+                np.array([self.organizational_roles[r]["access_level"] for r in roles], dtype=object), n_risks
+            ),
+            "target_value": np.repeat(
+                np.array([self.organizational_roles[r]["target_value"] for r in roles], dtype=object), n_risks
+            ),
+            "risk_type": np.tile(np.array(risk_types, dtype=object), len(roles)),
+            "risk_score": flat_scores,
+            "priority_level": self.get_priority_levels(flat_scores),
+            "is_primary_risk": primary.ravel(),
+        })
 
     def get_timeline_recommendation(self, priority):
         """Get recommended timeline based on priority level."""